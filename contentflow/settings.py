@@ -117,6 +117,19 @@ DATABASES = {
     }
 }
 
+# Shared (L2) cache behind core.cache.TieredCache, the tag cache version
+# and feed generation stamps. Use a shared backend (e.g.
+# django.core.cache.backends.redis.RedisCache) when running more than
+# one process; the in-process default only suits development and tests.
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            'CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache'),
+        "LOCATION": config('CACHE_LOCATION', default='contentflow'),
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -173,6 +186,43 @@ STATICFILES_DIRS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Store post images under sharded SHA-256 paths and reuse the stored blob,
+# thumbnail and renditions when identical content is uploaded again.
+MEDIA_CONTENT_ADDRESSED = config(
+    'MEDIA_CONTENT_ADDRESSED', default=False, cast=bool)
+
+# Generate thumbnails in the `process_thumbnail_jobs` worker instead of
+# inside the upload request.
+THUMBNAIL_ASYNC = config('THUMBNAIL_ASYNC', default=False, cast=bool)
+
+# Render the feed and tag pages once for all viewers (like buttons
+# neutral) and cache them briefly; each request only adds its like states.
+FEED_PAGE_CACHE = config('FEED_PAGE_CACHE', default=False, cast=bool)
+
+# Build the next feed page in a background worker after each page and
+# keep it briefly per viewer (ignored while FEED_PAGE_CACHE is on).
+FEED_PREFETCH = config('FEED_PREFETCH', default=False, cast=bool)
+
+# Send ETags on the feed, tag and profile pages and answer matching
+# revalidations with 304 before the feed is queried.
+FEED_CONDITIONAL_GET = config(
+    'FEED_CONDITIONAL_GET', default=False, cast=bool)
+
+# Serve the feed and profile pages from the denormalized PostCard read
+# model; run `rebuild_post_cards` once before turning this on.
+POST_CARDS_ENABLED = config('POST_CARDS_ENABLED', default=False, cast=bool)
+
+# Responsive renditions built next to each thumbnail and emitted as
+# `srcset`; the modal uses the widest rendition up to the display width.
+IMAGE_RENDITION_WIDTHS = (320, 640, 1080)
+IMAGE_RENDITION_FORMATS = ("webp", "jpeg")
+IMAGE_DISPLAY_WIDTH = 1080
+
+# Upper bound on pixels decoded per image (after scaled JPEG decoding),
+# i.e. roughly 3 bytes x this value of RAM per concurrent thumbnail.
+IMAGE_MAX_DECODE_PIXELS = config(
+    'IMAGE_MAX_DECODE_PIXELS', default=40_000_000, cast=int)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -1,5 +1,8 @@
 import os
+import re
+
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name, get_available_overwrite_name
 
 
 class StaticStorage(S3Boto3Storage):
@@ -14,3 +17,24 @@ class MediaStorage(S3Boto3Storage):
     default_acl = None
     file_overwrite = False
     custom_domain = os.getenv('AWS_S3_CUSTOM_DOMAIN')
+
+
+# posts/ab/cd/<sha256>.<ext>, see posts.models.image_upload_to
+CONTENT_ADDRESSED_NAME = re.compile(
+    r'(^|/)[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.\w+)?$')
+
+
+class ContentAddressedMediaStorage(MediaStorage):
+    """
+    Media storage for MEDIA_CONTENT_ADDRESSED deployments.
+
+    Hash-named blobs are unique by content, so they are written without
+    the HEAD round-trips S3Boto3Storage spends probing for a free name;
+    an overwrite can only replace a blob with identical bytes. Every
+    other name keeps the collision-safe behaviour of MediaStorage.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        if CONTENT_ADDRESSED_NAME.search(name):
+            return get_available_overwrite_name(clean_name(name), max_length)
+        return super().get_available_name(name, max_length)
@@ -0,0 +1,249 @@
+"""
+Two-tier cache for service-layer reads.
+
+Each `TieredCache` serves one key family (e.g. "feed_page") from:
+
+- L1: a small in-process LRU with its own short TTL, so hot keys cost
+  no network round trip;
+- L2: the shared Django cache backend (Redis/Memcached in production,
+  locmem in development and tests).
+
+Concurrent misses on the same key within a process are coalesced
+(single-flight): one thread computes, the others wait for its result.
+Values stay in L2 for `stale_ttl` seconds past their freshness; a
+stale value is returned immediately while one background thread per
+key (and, through an L2 lock, per deployment) recomputes it.
+
+Hit/miss counters are kept per family and per process; see
+`cache_metrics`.
+"""
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Final, Optional, TypeVar
+
+from django.core.cache import caches
+from django.db import connections
+
+T = TypeVar("T")
+
+# How long one process may hold the right to refresh a stale key.
+REFRESH_LOCK_TTL: Final = 30
+
+_metrics: dict[str, Counter] = {}
+_metrics_lock = threading.Lock()
+_registry: list["TieredCache"] = []
+
+
+def record_cache_event(family: str, event: str) -> None:
+    """
+    Count one event for a cache family in `cache_metrics`.
+    """
+    with _metrics_lock:
+        _metrics.setdefault(family, Counter())[event] += 1
+
+
+def cache_metrics() -> dict[str, dict[str, int]]:
+    """
+    Per-family counters of this process: `l1_hits`, `l2_hits`,
+    `misses`, `coalesced` (waited for another thread's miss),
+    `stale` (served while refreshing), `refreshes` and `errors`.
+    """
+    with _metrics_lock:
+        return {family: dict(counts) for family, counts in _metrics.items()}
+
+
+def reset_cache_metrics() -> None:
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def clear_local_caches() -> None:
+    """
+    Drop every family's L1 entries in this process (L2 is untouched).
+    """
+    for tiered in _registry:
+        tiered.clear_local()
+
+
+class _Flight:
+    """
+    One in-progress computation that concurrent callers wait on.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TieredCache:
+    """
+    L1 (in-process LRU) + L2 (Django cache) cache for one key family,
+    with single-flight misses and stale-while-revalidate.
+
+    Args:
+        family (str): Key prefix and metrics label.
+        ttl (int): Seconds a computed value is fresh.
+        stale_ttl (int): Extra seconds a stale value may be served
+            while it is recomputed in the background (0 disables).
+        l1_ttl (Optional[float]): Seconds a value may be served from
+            L1 without checking L2 (defaults to `ttl`).
+        l1_size (int): Maximum number of L1 entries.
+        backend (str): Alias of the Django cache used as L2.
+    """
+
+    def __init__(
+            self,
+            family: str,
+            ttl: int,
+            stale_ttl: int = 0,
+            l1_ttl: Optional[float] = None,
+            l1_size: int = 256,
+            backend: str = "default") -> None:
+        self.family = family
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.l1_ttl = ttl if l1_ttl is None else min(l1_ttl, ttl)
+        self.l1_size = l1_size
+        self.backend = backend
+        # full key -> (L1 expiry, value), most recently used last
+        self._l1: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        """
+        Return the cached value for `key`, computing it on a miss.
+
+        Args:
+            key (str): Key within the family.
+            compute (Callable[[], T]): Produces the value; must return
+                something picklable for the L2 backend.
+
+        Returns:
+            T: The fresh, stale or newly computed value.
+        """
+        full_key = f"{self.family}:{key}"
+        now = time.time()
+
+        with self._lock:
+            entry = self._l1.get(full_key)
+            if entry is not None and entry[0] > now:
+                self._l1.move_to_end(full_key)
+                record_cache_event(self.family, "l1_hits")
+                return entry[1]
+
+        envelope = caches[self.backend].get(full_key)
+        if envelope is not None:
+            fresh_until, value = envelope
+            if fresh_until > now:
+                self._remember(full_key, fresh_until, value)
+                record_cache_event(self.family, "l2_hits")
+                return value
+            record_cache_event(self.family, "stale")
+            self._refresh_in_background(full_key, compute)
+            return value
+
+        return self._load(full_key, compute)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a key from L2 and from this process's L1. Other processes
+        keep their L1 copy for at most `l1_ttl` seconds.
+        """
+        full_key = f"{self.family}:{key}"
+        with self._lock:
+            self._l1.pop(full_key, None)
+        caches[self.backend].delete(full_key)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._l1.clear()
+
+    def _remember(self, full_key: str, fresh_until: float, value: Any) -> None:
+        with self._lock:
+            self._l1[full_key] = (
+                min(time.time() + self.l1_ttl, fresh_until), value
+            )
+            self._l1.move_to_end(full_key)
+            while len(self._l1) > self.l1_size:
+                self._l1.popitem(last=False)
+
+    def _load(
+            self,
+            full_key: str,
+            compute: Callable[[], T],
+            event: str = "misses") -> T:
+        """
+        Compute and store a value; concurrent callers for the same key
+        wait for the first one instead of computing it again.
+        """
+        with self._lock:
+            flight = self._flights.get(full_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[full_key] = _Flight()
+
+        if not leader:
+            record_cache_event(self.family, "coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        record_cache_event(self.family, event)
+        try:
+            value = compute()
+            fresh_until = time.time() + self.ttl
+            caches[self.backend].set(
+                full_key, (fresh_until, value), self.ttl + self.stale_ttl
+            )
+            self._remember(full_key, fresh_until, value)
+            flight.value = value
+            return value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[full_key]
+            flight.done.set()
+
+    def _refresh_in_background(
+            self, full_key: str, compute: Callable[[], Any]) -> None:
+        with self._lock:
+            if full_key in self._refreshing or full_key in self._flights:
+                return
+            self._refreshing.add(full_key)
+
+        lock_key = f"{full_key}:refreshing"
+        if not caches[self.backend].add(lock_key, 1, REFRESH_LOCK_TTL):
+            with self._lock:
+                self._refreshing.discard(full_key)
+            return
+
+        threading.Thread(
+            target=self._refresh,
+            args=(full_key, lock_key, compute),
+            daemon=True,
+        ).start()
+
+    def _refresh(
+            self,
+            full_key: str,
+            lock_key: str,
+            compute: Callable[[], Any]) -> None:
+        try:
+            self._load(full_key, compute, event="refreshes")
+        except Exception:
+            # Keep serving the stale value; the next stale read retries.
+            record_cache_event(self.family, "errors")
+        finally:
+            caches[self.backend].delete(lock_key)
+            with self._lock:
+                self._refreshing.discard(full_key)
+            # Database connections are per thread; don't leak this one.
+            connections.close_all()
@@ -1,7 +1,8 @@
 from django.urls import path
 
-from core.views import home_view
+from core.views import cache_metrics_view, home_view
 
 urlpatterns = [
     path('', home_view, name='home'),
+    path('cache-metrics/', cache_metrics_view, name='cache-metrics'),
 ]
@@ -1,5 +1,18 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpRequest, JsonResponse
 from django.shortcuts import render
 
+from core.cache import cache_metrics
+
 
 def home_view(request):
     return render(request, 'home/home.html')
+
+
+@staff_member_required
+def cache_metrics_view(request: HttpRequest) -> JsonResponse:
+    """
+    Hit/miss counters of the tiered caches, per key family, for the
+    process that serves the request.
+    """
+    return JsonResponse({"families": cache_metrics()})
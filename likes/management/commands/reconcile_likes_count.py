@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from likes.models import Like
+from posts.models import Post
+from posts.services.feed_state import bump_likes_generation
+from posts.services.post_cards import copy_card_likes
+
+
+class Command(BaseCommand):
+    help = "Repair drift between Post.likes_count and the Like table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of posts checked per batch (default: 1000)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted posts without updating them',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Walk posts in primary-key order, one chunk at a time,
+        and rewrite likes_count where it differs from COUNT(Like).
+
+        Each chunk is a bounded range read plus a correlated count,
+        so the command can run against a live table without holding
+        long locks; only drifted rows are written back.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Contains 'chunk_size' (int) and 'dry_run' (bool).
+        """
+        chunk_size = options['chunk_size']
+        dry_run = options['dry_run']
+
+        actual_counts = (
+            Like.objects.filter(post=OuterRef("pk"))
+            .order_by()
+            .values("post")
+            .annotate(c=Count("id"))
+            .values("c")
+        )
+
+        last_id = 0
+        checked = 0
+        repaired = 0
+
+        while True:
+            chunk = list(
+                Post.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .annotate(actual=Coalesce(Subquery(actual_counts), 0))
+                .only("id", "likes_count")[:chunk_size]
+            )
+            if not chunk:
+                break
+
+            last_id = chunk[-1].id
+            checked += len(chunk)
+
+            drifted = [p.id for p in chunk if p.likes_count != p.actual]
+            if drifted and not dry_run:
+                # Recount inside the UPDATE itself so a like toggled
+                # between the read and the write is not overwritten.
+                Post.objects.filter(id__in=drifted).update(
+                    likes_count=Coalesce(Subquery(actual_counts), 0)
+                )
+                copy_card_likes(drifted)
+                bump_likes_generation()
+            repaired += len(drifted)
+
+        verb = "Would repair" if dry_run else "Repaired"
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {checked} post(s). {verb} {repaired} counter(s)."
+        ))
@@ -1,11 +1,14 @@
-from typing import TypedDict
+from typing import Iterable, TypedDict
 
 from django.contrib.auth.base_user import AbstractBaseUser
-from django.db import IntegrityError, transaction
-from django.db.models import Count
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
 
 from likes.models import Like
 from posts.models import Post
+from posts.services.feed_state import bump_likes_generation
+from posts.services.post_cards import set_card_likes
 
 
 class ToggleResult(TypedDict):
@@ -16,6 +19,146 @@ class ToggleResult(TypedDict):
     likes_count: int
 
 
+class LikeState(TypedDict):
+    """
+    Per-viewer like state of one post (see get_like_states).
+    """
+    post_id: int
+    liked: bool
+    likes_count: int
+
+
+def _supports_returning_upsert() -> bool:
+    """
+    Whether the backend understands INSERT ... ON CONFLICT DO NOTHING
+    RETURNING and DELETE ... RETURNING (PostgreSQL, SQLite >= 3.35).
+    """
+    if connection.vendor == "postgresql":
+        return True
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35, 0)
+    return False
+
+
+def _like_columns() -> tuple[str, str, str, str, str]:
+    """
+    Quoted table and column names of the Like model for raw SQL.
+    """
+    qn = connection.ops.quote_name
+    opts = Like._meta
+    return (
+        qn(opts.db_table),
+        qn(opts.pk.column),
+        qn(opts.get_field("user").column),
+        qn(opts.get_field("post").column),
+        qn(opts.get_field("created_at").column),
+    )
+
+
+def _insert_like(user_id: int, post_id: int) -> bool:
+    """
+    Insert the (user, post) like unless it already exists.
+
+    One statement, no savepoint: the unique constraint arbitrates
+    concurrent inserts via ON CONFLICT instead of an IntegrityError.
+
+    Returns:
+        bool: True if a row was inserted, False if it already existed.
+    """
+    if not _supports_returning_upsert():
+        try:
+            with transaction.atomic():
+                Like.objects.create(user_id=user_id, post_id=post_id)
+        except IntegrityError:
+            return False
+        return True
+
+    table, pk, user_col, post_col, created_col = _like_columns()
+    created_at = Like._meta.get_field("created_at").get_db_prep_value(
+        timezone.now(), connection
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({user_col}, {post_col}, {created_col}) "
+            f"VALUES (%s, %s, %s) "
+            f"ON CONFLICT ({user_col}, {post_col}) DO NOTHING "
+            f"RETURNING {pk}",
+            [user_id, post_id, created_at],
+        )
+        return cursor.fetchone() is not None
+
+
+def _delete_like(user_id: int, post_id: int) -> bool:
+    """
+    Delete the (user, post) like if present.
+
+    Returns:
+        bool: True if a row was deleted by this call.
+    """
+    if not _supports_returning_upsert():
+        deleted, _ = Like.objects.filter(
+            user_id=user_id, post_id=post_id
+        ).delete()
+        return bool(deleted)
+
+    table, pk, user_col, post_col, _ = _like_columns()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} "
+            f"WHERE {user_col} = %s AND {post_col} = %s "
+            f"RETURNING {pk}",
+            [user_id, post_id],
+        )
+        return cursor.fetchone() is not None
+
+
+def _apply_likes_delta(post_id: int, delta: int) -> int:
+    """
+    Adjust Post.likes_count by `delta` (clamped at zero) and return
+    the new value, in a single UPDATE ... RETURNING where supported.
+
+    Returns:
+        int: The post's likes_count after the update.
+
+    Raises:
+        Post.DoesNotExist: If the post was deleted concurrently.
+    """
+    counter = Post.objects.filter(pk=post_id)
+
+    if delta == 0:
+        return counter.values_list("likes_count", flat=True).get()
+
+    if not _supports_returning_upsert():
+        if delta > 0:
+            counter.update(likes_count=F("likes_count") + delta)
+        else:
+            counter.filter(likes_count__gte=-delta).update(
+                likes_count=F("likes_count") + delta
+            )
+        return counter.values_list("likes_count", flat=True).get()
+
+    qn = connection.ops.quote_name
+    column = qn(Post._meta.get_field("likes_count").column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {qn(Post._meta.db_table)} "
+            f"SET {column} = CASE WHEN {column} + %s < 0 THEN 0 "
+            f"ELSE {column} + %s END "
+            f"WHERE {qn(Post._meta.pk.column)} = %s "
+            f"RETURNING {column}",
+            [delta, delta, post_id],
+        )
+        row = cursor.fetchone()
+    if row is None:
+        raise Post.DoesNotExist(f"Post {post_id} does not exist")
+    return row[0]
+
+
+def _require_authenticated(user: AbstractBaseUser, action: str) -> None:
+    if not user or not getattr(user, "is_authenticated", False):
+        raise ValueError(f"{action} requires an authenticated user")
+
+
 def toggle_like(user: AbstractBaseUser, post: Post) -> ToggleResult:
     """
     Toggle a like for the given (user, post)
@@ -24,10 +167,16 @@ def toggle_like(user: AbstractBaseUser, post: Post) -> ToggleResult:
     Implementation details:
     - DB-level UniqueConstraint(user, post)
     guarantees no duplicates under concurrency.
-    - We optimistically try to create a Like;
-    on IntegrityError we delete the existing one.
-    - We return the current state (liked) and
-    the updated likes_count as the source of truth.
+    - We try INSERT ... ON CONFLICT DO NOTHING RETURNING; if nothing
+    was inserted the like existed, so DELETE ... RETURNING removes it.
+    No savepoint is opened and no IntegrityError is raised on the
+    hot path (backends without RETURNING fall back to the ORM).
+    - Post.likes_count is adjusted in the same transaction with
+    UPDATE ... SET likes_count = likes_count +/- 1 RETURNING likes_count,
+    so concurrent toggles never lose increments and no COUNT is needed.
+    - When POST_CARDS_ENABLED, the new count is copied onto the post's
+    feed card in the same transaction.
+    - After commit, the likes generation is bumped so feed ETags change.
 
     Args:
         user: Authenticated user performing the action.
@@ -36,20 +185,105 @@ def toggle_like(user: AbstractBaseUser, post: Post) -> ToggleResult:
     Returns:
         ToggleResult: {"liked": bool, "likes_count": int}
     """
-    if not user or not getattr(user, "is_authenticated", False):
-        raise ValueError("toggle_like requires an authenticated user")
+    _require_authenticated(user, "toggle_like")
 
     with transaction.atomic():
-        try:
-            with transaction.atomic():
-                Like.objects.create(user=user, post=post)
-            liked = True
-        except IntegrityError:
-            Like.objects.filter(user=user, post=post).delete()
-            liked = False
+        if _insert_like(user.pk, post.pk):
+            liked, delta = True, 1
+        else:
+            liked, delta = False, -1 if _delete_like(user.pk, post.pk) else 0
 
-        likes_count = (
-            Like.objects.filter(post=post).aggregate(c=Count("id"))["c"] or 0
-        )
+        likes_count = _apply_likes_delta(post.pk, delta)
+        if delta:
+            set_card_likes(post.pk, likes_count)
+            transaction.on_commit(bump_likes_generation)
 
     return {"liked": liked, "likes_count": likes_count}
+
+
+def add_like(user: AbstractBaseUser, post: Post) -> ToggleResult:
+    """
+    Idempotently like a post: repeating the call is a no-op.
+
+    Unlike toggle_like, a retried request (e.g. after a network
+    timeout) can never flip the state back. Two statements:
+    the conflict-aware INSERT and the counter UPDATE/SELECT.
+
+    Args:
+        user: Authenticated user performing the action.
+        post: Post instance to like.
+
+    Returns:
+        ToggleResult: {"liked": True, "likes_count": int}
+    """
+    _require_authenticated(user, "add_like")
+
+    with transaction.atomic():
+        delta = 1 if _insert_like(user.pk, post.pk) else 0
+        likes_count = _apply_likes_delta(post.pk, delta)
+        if delta:
+            set_card_likes(post.pk, likes_count)
+            transaction.on_commit(bump_likes_generation)
+
+    return {"liked": True, "likes_count": likes_count}
+
+
+def remove_like(user: AbstractBaseUser, post: Post) -> ToggleResult:
+    """
+    Idempotently unlike a post: repeating the call is a no-op.
+
+    Args:
+        user: Authenticated user performing the action.
+        post: Post instance to unlike.
+
+    Returns:
+        ToggleResult: {"liked": False, "likes_count": int}
+    """
+    _require_authenticated(user, "remove_like")
+
+    with transaction.atomic():
+        delta = -1 if _delete_like(user.pk, post.pk) else 0
+        likes_count = _apply_likes_delta(post.pk, delta)
+        if delta:
+            set_card_likes(post.pk, likes_count)
+            transaction.on_commit(bump_likes_generation)
+
+    return {"liked": False, "likes_count": likes_count}
+
+
+def get_like_states(
+        user: AbstractBaseUser,
+        post_ids: Iterable[int]) -> list[LikeState]:
+    """
+    Like state of many posts for one viewer in a single query.
+
+    The counter comes from the denormalized Post.likes_count column and
+    `liked` from an EXISTS probe on the (user, post) unique index, so the
+    cost is one indexed lookup per id regardless of how popular a post is.
+    Unknown ids are silently skipped.
+
+    Args:
+        user: Viewer whose like state is requested.
+        post_ids: Post ids, e.g. every post rendered on a cached page.
+
+    Returns:
+        list[LikeState]: States in the order of `post_ids`.
+    """
+    ids = list(dict.fromkeys(post_ids))
+    if not ids:
+        return []
+
+    rows = (
+        Post.objects.filter(pk__in=ids)
+        .annotate(
+            liked=Exists(
+                Like.objects.filter(user=user, post=OuterRef("pk"))
+            )
+        )
+        .values_list("pk", "liked", "likes_count")
+    )
+    by_id = {
+        pk: {"post_id": pk, "liked": liked, "likes_count": likes_count}
+        for pk, liked, likes_count in rows
+    }
+    return [by_id[pk] for pk in ids if pk in by_id]
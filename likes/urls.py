@@ -1,7 +1,11 @@
 from django.urls import path
 
-from .views import like_toggle_ajax
+from .views import (like_ajax, like_states_ajax, like_toggle_ajax,
+                    unlike_ajax)
 
 urlpatterns = [
     path('ajax/like-toggle/', like_toggle_ajax, name='like-toggle-ajax'),
+    path('ajax/like/', like_ajax, name='like-ajax'),
+    path('ajax/unlike/', unlike_ajax, name='unlike-ajax'),
+    path('ajax/states/', like_states_ajax, name='like-states-ajax'),
 ]
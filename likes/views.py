@@ -1,23 +1,27 @@
+from typing import Callable, Union
+
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, JsonResponse
+from django.http import Http404, HttpRequest, JsonResponse
 from django.shortcuts import get_object_or_404
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 
 from posts.models import Post
+from posts.services.selectors import MAX_DB_ID
 
-from .services.like_services import toggle_like
+from .services.like_services import (ToggleResult, add_like,
+                                     get_like_states, remove_like,
+                                     toggle_like)
 
+LIKE_STATES_MAX_IDS = 100
 
-@require_POST
-@login_required
-def like_toggle_ajax(request: HttpRequest) -> JsonResponse:
+
+def _resolve_post(request: HttpRequest) -> Union[Post, JsonResponse]:
     """
-    AJAX endpoint to toggle like for a given post.
+    Validate an AJAX like request and load the target post.
 
-    Contract (unchanged for frontend):
-    - Accepts POST form data with "post_id".
-    - Returns JSON with keys: "liked" (bool),
-    "likes_count" (int), "post_id" (int).
+    Returns:
+        Post | JsonResponse: The post, or a 400 error response.
+        Raises Http404 if the post does not exist.
     """
     if request.headers.get("x-requested-with") != "XMLHttpRequest":
         return JsonResponse({"error": "Invalid request type"}, status=400)
@@ -34,9 +38,26 @@ def like_toggle_ajax(request: HttpRequest) -> JsonResponse:
             status=400
         )
 
-    post: Post = get_object_or_404(Post, id=post_id)
+    return get_object_or_404(Post, id=post_id)
+
+
+def _like_action_response(
+        request: HttpRequest,
+        action: Callable[..., ToggleResult]) -> JsonResponse:
+    """
+    Run a like service for the requested post and serialize the result.
+
+    Raises Http404 if the post is missing or is deleted before the
+    service commits.
+    """
+    post = _resolve_post(request)
+    if isinstance(post, JsonResponse):
+        return post
 
-    result = toggle_like(user=request.user, post=post)
+    try:
+        result = action(user=request.user, post=post)
+    except Post.DoesNotExist:
+        raise Http404("No Post matches the given query.")
 
     return JsonResponse(
         {
@@ -46,3 +67,85 @@ def like_toggle_ajax(request: HttpRequest) -> JsonResponse:
         },
         status=200,
     )
+
+
+@require_POST
+@login_required
+def like_toggle_ajax(request: HttpRequest) -> JsonResponse:
+    """
+    AJAX endpoint to toggle like for a given post.
+
+    Contract (unchanged for frontend):
+    - Accepts POST form data with "post_id".
+    - Returns JSON with keys: "liked" (bool),
+    "likes_count" (int), "post_id" (int).
+    """
+    return _like_action_response(request, toggle_like)
+
+
+@require_POST
+@login_required
+def like_ajax(request: HttpRequest) -> JsonResponse:
+    """
+    AJAX endpoint to like a post; safe to retry.
+
+    Same request/response contract as like_toggle_ajax,
+    but "liked" is always true after the call.
+    """
+    return _like_action_response(request, add_like)
+
+
+@require_POST
+@login_required
+def unlike_ajax(request: HttpRequest) -> JsonResponse:
+    """
+    AJAX endpoint to unlike a post; safe to retry.
+
+    Same request/response contract as like_toggle_ajax,
+    but "liked" is always false after the call.
+    """
+    return _like_action_response(request, remove_like)
+
+
+@require_GET
+@login_required
+def like_states_ajax(request: HttpRequest) -> JsonResponse:
+    """
+    AJAX endpoint returning the viewer's like state for many posts.
+
+    Lets a page restored from the back/forward cache, or a feed page
+    shared between viewers, refresh hearts and counters in one request.
+
+    Contract:
+    - Accepts GET "ids" as a comma-separated list of positive post ids
+      (at most LIKE_STATES_MAX_IDS).
+    - Returns JSON {"posts": [{"post_id", "liked", "likes_count"}, ...]}
+      in request order; unknown ids are omitted.
+    """
+    if request.headers.get("x-requested-with") != "XMLHttpRequest":
+        return JsonResponse({"error": "Invalid request type"}, status=400)
+
+    ids_raw = request.GET.get("ids", "")
+    if not ids_raw:
+        return JsonResponse({"error": "ids is required"}, status=400)
+
+    try:
+        post_ids = [int(part) for part in ids_raw.split(",")]
+        if not all(0 < post_id <= MAX_DB_ID for post_id in post_ids):
+            raise ValueError(ids_raw)
+    except ValueError:
+        return JsonResponse(
+            {"error": "ids must be comma-separated integers"},
+            status=400
+        )
+
+    if len(post_ids) > LIKE_STATES_MAX_IDS:
+        return JsonResponse(
+            {"error": f"at most {LIKE_STATES_MAX_IDS} ids are allowed"},
+            status=400
+        )
+
+    return JsonResponse(
+        {"posts": get_like_states(request.user, post_ids)},
+        status=200,
+    )
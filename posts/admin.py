@@ -1,7 +1,10 @@
 from django.contrib import admin
+from django.db.models import Q
 from django.utils.html import format_html
 
-from .models import Image, Post, Tag
+from posts.services.search import caption_match
+
+from .models import Image, Post, Tag, ThumbnailJob
 
 
 @admin.register(Post)
@@ -14,6 +17,18 @@ class PostAdmin(admin.ModelAdmin):
     list_filter = ('created_at', 'tags')
     search_fields = ('caption', 'author__username')
 
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search captions through the full-text index instead of
+        `LIKE %term%` scans; an exact username also matches.
+        """
+        if not search_term:
+            return queryset, False
+        return queryset.filter(
+            caption_match(search_term)
+            | Q(author__username=search_term.strip())
+        ), False
+
     def tag_list(self, obj):
         """
         Return a comma-separated list of tag names associated with the post.
@@ -26,9 +41,12 @@ class PostAdmin(admin.ModelAdmin):
 class TagAdmin(admin.ModelAdmin):
     """
     Admin configuration for the Tag model.
-    Enables searching by tag name.
+    Enables searching by tag name and shows how many posts use each tag.
     """
+    list_display = ('name', 'post_count')
     search_fields = ('name',)
+    ordering = ('-post_count', 'name')
+    readonly_fields = ('post_count',)
 
 
 @admin.register(Image)
@@ -50,3 +68,14 @@ class ImageAdmin(admin.ModelAdmin):
                 obj.thumbnail.url)
         return "-"
     thumbnail_preview.short_description = "Thumbnail"
+
+
+@admin.register(ThumbnailJob)
+class ThumbnailJobAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the ThumbnailJob queue.
+    Shows job state so stuck or failing thumbnails can be inspected.
+    """
+    list_display = ('image', 'status', 'attempts', 'run_after', 'last_error')
+    list_filter = ('status',)
+    readonly_fields = ('created_at', 'locked_at')
@@ -1,13 +1,20 @@
-from typing import Optional
+from typing import Final, Optional
 
 from django import forms
 from django.contrib.auth.models import AbstractBaseUser
 from django.forms.widgets import FileInput
+from django.urls import reverse_lazy
 
+from posts.services.image_utils import ImageTooLargeError, check_decode_budget
 from posts.services.tag_services import update_post_tags
 
 from .models import Image, Post
 
+# Columns an edit writes back. likes_count and version are maintained by
+# atomic UPDATEs elsewhere; a full save would overwrite them with the
+# values loaded at the start of the request.
+POST_EDIT_FIELDS: Final = ["author", "caption"]
+
 
 class PostForm(forms.ModelForm):
     """
@@ -24,6 +31,7 @@ class PostForm(forms.ModelForm):
         widgets = {
             'caption': forms.Textarea(attrs={
                 'placeholder': 'Add caption and hashtags...',
+                'data-tag-autocomplete': reverse_lazy('tag-autocomplete'),
             })
         }
         labels = {
@@ -53,7 +61,8 @@ class PostForm(forms.ModelForm):
             post.author = author
 
         if commit:
-            post.save()
+            post.save(
+                update_fields=None if post._state.adding else POST_EDIT_FIELDS)
             update_post_tags(post, post.caption)
         return post
 
@@ -67,3 +76,15 @@ class ImageForm(forms.ModelForm):
     class Meta:
         model = Image
         fields = ['id', 'image']
+
+    def clean_image(self):
+        """
+        Reject images whose decode would exceed IMAGE_MAX_DECODE_PIXELS.
+        """
+        image = self.cleaned_data.get('image')
+        if image and hasattr(image, 'content_type'):
+            try:
+                check_decode_budget(image)
+            except ImageTooLargeError as exc:
+                raise forms.ValidationError(str(exc))
+        return image
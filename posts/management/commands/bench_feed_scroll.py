@@ -0,0 +1,107 @@
+import time
+from statistics import median, quantiles
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from core.cache import cache_metrics, reset_cache_metrics
+from posts.services.feed_prefetch import (PREFETCH_FAMILY,
+                                          wait_for_prefetches)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare scroll-through feed latency with and without prefetch"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sessions',
+            type=int,
+            default=5,
+            help='Scroll sessions per mode (default: 5)',
+        )
+        parser.add_argument(
+            '--pages',
+            type=int,
+            default=10,
+            help='Pages read per session (default: 10)',
+        )
+        parser.add_argument(
+            '--think-ms',
+            type=int,
+            default=200,
+            help='Pause between pages in milliseconds (default: 200)',
+        )
+        parser.add_argument(
+            '--username',
+            help='Viewer to scroll as (default: first user)',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Scroll the main feed page by page through the full request
+        stack, following each page's next cursor after a short pause,
+        once with FEED_PREFETCH off and once with it on.
+
+        Reads the current database only; run `seed_data` first on an
+        empty one. Page 1 is never prefetched, so only pages 2+ are
+        timed. Reports p50 and p95 per mode and the prefetch hit rate.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Contains 'sessions' (int), 'pages' (int),
+                'think_ms' (int) and 'username' (str | None).
+        """
+        viewer = (
+            User.objects.filter(username=options['username']).first()
+            if options['username'] else User.objects.order_by('id').first()
+        )
+        if viewer is None:
+            raise CommandError("No such user; run `seed_data` first.")
+
+        think = options['think_ms'] / 1000
+        url = reverse('post-list')
+        results = {}
+        reset_cache_metrics()
+
+        for label, enabled in (("no prefetch", False), ("prefetch", True)):
+            timings = []
+            with override_settings(
+                    FEED_PREFETCH=enabled, FEED_PAGE_CACHE=False,
+                    ALLOWED_HOSTS=['testserver']):
+                for _ in range(options['sessions']):
+                    client = Client()
+                    client.force_login(viewer)
+                    response = client.get(url)
+                    for _ in range(options['pages'] - 1):
+                        cursor = response.context['page_obj']['next_cursor']
+                        if not cursor:
+                            break
+                        time.sleep(think)
+                        started = time.perf_counter()
+                        response = client.get(url, {'cursor': cursor})
+                        timings.append(
+                            (time.perf_counter() - started) * 1000)
+                    wait_for_prefetches()
+
+            if len(timings) < 2:
+                raise CommandError("Feed has fewer than three pages.")
+            results[label] = median(timings)
+            self.stdout.write(
+                f"{label:<12} p50 {median(timings):8.2f} ms   "
+                f"p95 {quantiles(timings, n=20)[-1]:8.2f} ms   "
+                f"({len(timings)} page(s))"
+            )
+
+        counts = cache_metrics().get(PREFETCH_FAMILY, {})
+        self.stdout.write(
+            f"prefetch hits {counts.get('hits', 0)}, "
+            f"misses {counts.get('misses', 0)}, "
+            f"dropped {counts.get('dropped', 0)}"
+        )
+        saved = results["no prefetch"] - results["prefetch"]
+        self.stdout.write(self.style.SUCCESS(
+            f"Benchmark complete: p50 {saved:+.2f} ms saved by prefetch."))
@@ -0,0 +1,93 @@
+import time
+from statistics import median
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.services.selectors import (get_post_feed_for_user,
+                                      get_posts_by_tag_for_user,
+                                      get_posts_by_tags_for_user,
+                                      paginate_feed)
+from posts.services.tag_cache import get_tag_ids
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Compare first-page latency of single-tag and multi-tag feeds"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'tags',
+            nargs='+',
+            help='Two or more existing tag names to intersect',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Timed runs per strategy (default: 20)',
+        )
+        parser.add_argument(
+            '--username',
+            help='Viewer for has_liked (default: first user)',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Time the first feed page (query plus evaluation) for:
+
+        - single: each tag on its own via get_posts_by_tag_for_user;
+        - chained: one `.filter(tags=...)` join per tag (naive AND);
+        - intersect: get_posts_by_tags_for_user, rarest tag first.
+
+        Reads the current database only; run `seed_data` first on an
+        empty one. Reports the median and best time per strategy.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Contains 'tags' (list[str]), 'iterations' (int)
+                and 'username' (str | None).
+        """
+        names = [name.lower() for name in options['tags']]
+        if len(names) < 2:
+            raise CommandError("Pass at least two tags.")
+        tag_ids = get_tag_ids(names)
+        missing = sorted(set(names) - set(tag_ids))
+        if missing:
+            raise CommandError(f"Unknown tag(s): {', '.join(missing)}")
+
+        viewer = (
+            User.objects.get(username=options['username'])
+            if options['username'] else User.objects.order_by('id').first()
+        )
+
+        def chained():
+            qs = get_post_feed_for_user(viewer)
+            for tag_id in tag_ids.values():
+                qs = qs.filter(tags=tag_id)
+            return qs
+
+        strategies = [
+            (f"single #{name}",
+             lambda name=name: get_posts_by_tag_for_user(viewer, name))
+            for name in names
+        ] + [
+            ("chained joins", chained),
+            ("intersect", lambda: get_posts_by_tags_for_user(viewer, names)),
+        ]
+
+        for label, build in strategies:
+            timings = []
+            for _ in range(options['iterations']):
+                started = time.perf_counter()
+                page = paginate_feed(build())
+                list(page['posts'])
+                timings.append((time.perf_counter() - started) * 1000)
+            self.stdout.write(
+                f"{label:<24} median {median(timings):8.2f} ms   "
+                f"best {min(timings):8.2f} ms   "
+                f"({len(page['posts'])} post(s) on page)"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Benchmark complete."))
@@ -0,0 +1,112 @@
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from PIL import Image as PilImage
+
+
+def _peak_rss_mb() -> float:
+    """
+    Peak resident set size of the current process in MiB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _bench_worker(path: str, iterations: int, mode: str, queue) -> None:
+    """
+    Thumbnail one source file repeatedly in a fresh interpreter
+    and report throughput and peak RSS back to the parent.
+    """
+    import django
+    django.setup()
+
+    from posts.services.image_utils import THUMBNAIL_SIZE, generate_thumbnail
+
+    baseline = _peak_rss_mb()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        with open(path, "rb") as source:
+            if mode == "fast":
+                generate_thumbnail(source)
+            else:
+                # Naive path: full-resolution decode, then downscale.
+                img = PilImage.open(source).convert("RGB")
+                img.thumbnail(THUMBNAIL_SIZE)
+    elapsed = time.perf_counter() - started
+
+    peak = _peak_rss_mb()
+    queue.put((iterations / elapsed, peak, peak - baseline))
+
+
+class Command(BaseCommand):
+    help = "Measure thumbnail throughput and peak memory per source size"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--megapixels',
+            type=float,
+            nargs='+',
+            default=[2, 12, 24, 48],
+            help='Source sizes in megapixels (default: 2 12 24 48)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=5,
+            help='Thumbnails generated per size (default: 5)',
+        )
+        parser.add_argument(
+            '--compare',
+            action='store_true',
+            help='Also run a naive full-resolution decode for comparison',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Generate synthetic 4:3 JPEG sources and benchmark each one.
+
+        Every (size, mode) pair runs in a freshly spawned process so
+        `ru_maxrss` reflects only that workload. "peak MiB" is the
+        process peak RSS; "+decode" is the growth above the interpreter
+        baseline, i.e. roughly what one concurrent thumbnail costs.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: 'megapixels' (list), 'iterations' (int),
+                'compare' (bool).
+        """
+        modes = ["fast", "full"] if options['compare'] else ["fast"]
+        ctx = multiprocessing.get_context("spawn")
+
+        self.stdout.write(
+            f"{'source':>14} {'mode':>5} {'images/s':>9} "
+            f"{'peak MiB':>9} {'+decode':>8}"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            for mp in options['megapixels']:
+                width = int((mp * 1_000_000 * 4 / 3) ** 0.5)
+                height = width * 3 // 4
+                path = Path(tmp) / f"source_{mp}mp.jpg"
+                PilImage.linear_gradient("L").resize(
+                    (width, height)
+                ).convert("RGB").save(path, "JPEG", quality=90)
+
+                for mode in modes:
+                    queue = ctx.Queue()
+                    proc = ctx.Process(
+                        target=_bench_worker,
+                        args=(str(path), options['iterations'], mode, queue),
+                    )
+                    proc.start()
+                    rate, peak, delta = queue.get()
+                    proc.join()
+                    self.stdout.write(
+                        f"{f'{width}x{height}':>14} {mode:>5} "
+                        f"{rate:>9.1f} {peak:>9.1f} {delta:>8.1f}"
+                    )
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from posts.services.trending import (DAILY_RETENTION, HOURLY_RETENTION,
+                                     compact_tag_buckets)
+
+
+class Command(BaseCommand):
+    help = "Roll up old hourly trending-tag buckets into daily buckets"
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Compact the trending tag counters; meant to run periodically
+        (e.g. hourly from cron).
+
+        Hourly buckets older than HOURLY_RETENTION become daily buckets;
+        daily buckets older than DAILY_RETENTION are deleted.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Unused.
+        """
+        result = compact_tag_buckets()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rolled up {result['rolled_up']} hourly bucket(s) older than "
+            f"{HOURLY_RETENTION}; expired {result['expired']} daily "
+            f"bucket(s) older than {DAILY_RETENTION.days} days."
+        ))
@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from posts.models import ThumbnailJob
+from posts.services.thumbnail_jobs import claim_due_jobs, process_job
+
+
+def _process_in_thread(job: ThumbnailJob) -> bool:
+    """
+    Run a job on a pool thread and release that thread's DB connection.
+    """
+    try:
+        return process_job(job)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Generate queued thumbnails (worker for THUMBNAIL_ASYNC mode)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Number of jobs processed in parallel (default: 4)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Jobs claimed per poll (default: 4 x concurrency)',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep when the queue is empty (default: 2)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain due jobs and exit instead of polling forever',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Claim due ThumbnailJob rows in batches and process them.
+
+        Pillow releases the GIL while decoding and resizing, so a thread
+        pool gives real parallelism without forking. With concurrency 1
+        jobs run on the main thread (no extra DB connections).
+
+        Args:
+            *args: Unused positional arguments.
+            **options: 'concurrency', 'batch_size', 'poll_interval', 'once'.
+        """
+        concurrency = max(options['concurrency'], 1)
+        batch_size = options['batch_size'] or concurrency * 4
+        done = failed = 0
+
+        executor = (
+            ThreadPoolExecutor(max_workers=concurrency)
+            if concurrency > 1 else None
+        )
+        try:
+            while True:
+                jobs = claim_due_jobs(batch_size)
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                if executor:
+                    results = list(executor.map(_process_in_thread, jobs))
+                else:
+                    results = [process_job(job) for job in jobs]
+
+                succeeded = sum(results)
+                done += succeeded
+                failed += len(results) - succeeded
+                self.stdout.write(
+                    f"Processed {len(results)} job(s): "
+                    f"{succeeded} ok, {len(results) - succeeded} retrying"
+                )
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Interrupted."))
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Thumbnails generated: {done}, failed attempts: {failed}"
+        ))
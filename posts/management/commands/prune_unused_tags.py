@@ -0,0 +1,112 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef, Q
+
+from posts.models import (Post, Tag, TagBucket, TagCooccurrence,
+                          TagTimelineEntry)
+from posts.services.tag_cache import invalidate_tag_cache
+from posts.services.tag_index import clear_tag_index
+
+
+class Command(BaseCommand):
+    help = "Delete tags that are no longer used by any post"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of tags deleted per batch (default: 1000)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report unused tags without deleting them',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Find tags whose post_count is zero and delete them in chunks.
+
+        A tag is only deleted if it also has no through-rows, so a
+        drifted counter can never remove a tag that is still in use.
+        See `_delete_chunk` for how this holds under concurrent tagging.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Contains 'chunk_size' (int) and 'dry_run' (bool).
+        """
+        chunk_size = options['chunk_size']
+        dry_run = options['dry_run']
+
+        unused = Tag.objects.filter(post_count=0).exclude(
+            Exists(Post.tags.through.objects.filter(tag_id=OuterRef("pk")))
+        )
+
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(
+                f"Would delete {unused.count()} unused tag(s)."
+            ))
+            return
+
+        deleted = 0
+        while True:
+            ids = list(unused.order_by("id").values_list("id", flat=True)[
+                :chunk_size])
+            if not ids:
+                break
+            deleted += self._delete_chunk(ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} unused tag(s)."
+        ))
+
+    def _delete_chunk(self, ids: list[int]) -> int:
+        """
+        Delete the tags among `ids` that are still unused.
+
+        The usage check and the delete are one statement, so a post
+        that picks a tag up after the chunk was read keeps it: the row
+        no longer matches. (`QuerySet.delete()` would select pks first
+        and then cascade by pk, silently dropping such a through-row.)
+        Rows that only hang off deleted tags (trending buckets,
+        co-occurrence and timeline rows) are removed in the same
+        transaction; foreign keys are checked at commit, so a link made
+        to a deleted tag in between fails loudly instead of vanishing.
+
+        The raw DELETE sends no Tag signals, so when rows were deleted
+        the tag cache (and with it every worker's name -> id mappings)
+        and the local autocomplete index are invalidated here.
+
+        Returns:
+            int: Number of tags deleted.
+        """
+        qn = connection.ops.quote_name
+        tag_table = qn(Tag._meta.db_table)
+        tag_pk = f"{tag_table}.{qn(Tag._meta.pk.column)}"
+        through = Post.tags.through._meta
+        placeholders = ", ".join(["%s"] * len(ids))
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {tag_table} "
+                    f"WHERE {tag_pk} IN ({placeholders}) "
+                    f"AND {qn(Tag._meta.get_field('post_count').column)} = 0 "
+                    f"AND NOT EXISTS (SELECT 1 FROM {qn(through.db_table)} "
+                    f"WHERE {qn(through.get_field('tag').column)} "
+                    f"= {tag_pk})",
+                    ids,
+                )
+                deleted = cursor.rowcount
+
+            remaining = Tag.objects.filter(id__in=ids).values("id")
+            gone = Q(tag_id__in=ids) & ~Q(tag_id__in=remaining)
+            TagBucket.objects.filter(gone).delete()
+            TagTimelineEntry.objects.filter(gone).delete()
+            TagCooccurrence.objects.filter(
+                gone | Q(related_id__in=ids) & ~Q(related_id__in=remaining)
+            ).delete()
+        if deleted:
+            invalidate_tag_cache()
+            clear_tag_index()
+        return deleted
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import Post
+from posts.services.post_cards import rebuild_post_cards
+from posts.services.tag_services import update_post_tags
+
+
+class Command(BaseCommand):
+    help = "Write the PostCard read model of every post"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of cards written per batch (default: 500)',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        (Re)build every post card; run once before enabling
+        POST_CARDS_ENABLED, or to repair cards after bulk imports.
+
+        Posts saved before captions were parsed on save get their
+        caption body and tags stored first, so their cards render
+        without hashtags in the text.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Contains 'chunk_size' (int).
+        """
+        legacy = Post.objects.filter(caption_body__isnull=True)
+        for post in legacy.iterator():
+            update_post_tags(post, post.caption)
+
+        written = rebuild_post_cards(options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {written} post card(s)."
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from posts.services.cooccurrence import rebuild_tag_cooccurrence
+
+
+class Command(BaseCommand):
+    help = "Recompute the related-tags co-occurrence counts from scratch"
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Rebuild the tag co-occurrence table in bulk.
+
+        Tag sync keeps the counts up to date incrementally; run this
+        after importing data that bypassed it, or to repair drift.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: Unused.
+        """
+        rows = rebuild_tag_cooccurrence()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {rows} tag co-occurrence row(s)."
+        ))
@@ -0,0 +1,194 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import django
+from django.core.files.base import ContentFile, File
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from posts.models import Image
+from posts.services.image_utils import generate_thumbnail
+from posts.services.post_cards import post_cards_enabled, write_post_cards
+from posts.services.post_versions import bump_post_versions
+
+
+def _init_worker() -> None:
+    """
+    Make Django settings available in spawned pool processes.
+    """
+    django.setup()
+
+
+def _render_thumbnail(
+        image_id: int,
+        name: str) -> tuple[int, Optional[bytes], Optional[str], str]:
+    """
+    Read one original from storage and render its thumbnail in a pool
+    process.
+
+    Only the storage name crosses the process boundary, so the parent
+    never holds a chunk of originals in memory; no database access
+    happens here, so workers never share connections with the parent.
+
+    Returns:
+        tuple: (image_id, thumbnail bytes or None, error or None,
+        thumbnail file name).
+    """
+    storage = Image._meta.get_field('image').storage
+    try:
+        with storage.open(name, 'rb') as source:
+            thumb = generate_thumbnail(File(source, name=name))
+    except Exception as exc:
+        return image_id, None, f"{type(exc).__name__}: {exc}", ""
+    return image_id, thumb.read(), None, thumb.name
+
+
+class Command(BaseCommand):
+    help = "Rebuild Image.thumbnail in parallel, resumable id-ordered chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Only images without a thumbnail',
+        )
+        parser.add_argument(
+            '--since-id',
+            type=int,
+            default=0,
+            help='Start after this Image id (default: 0)',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Worker processes for decode/encode (default: CPU count)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=100,
+            help='Images loaded and checkpointed per batch (default: 100)',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            default='regenerate_thumbnails.checkpoint.json',
+            help='File recording the last completed Image id',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue after the id stored in --checkpoint',
+        )
+
+    def handle(self, *args: object, **options: dict) -> None:
+        """
+        Stream Image rows by primary key and rebuild their thumbnails.
+
+        Workers read the originals from storage by name (only thumbnail
+        bytes come back, so memory stays flat whatever the chunk size);
+        results are saved back chunk by chunk, after which the
+        checkpoint file is atomically rewritten with the last id. A crash
+        therefore loses at most one chunk of work.
+
+        Replaced thumbnail files are deleted unless another image still
+        points at them (content-addressed twins share one), and the
+        affected posts' versions and cards are refreshed so cached
+        fragments stop linking the old files.
+
+        Args:
+            *args: Unused positional arguments.
+            **options: See add_arguments.
+        """
+        checkpoint = Path(options['checkpoint'])
+        last_id = options['since_id']
+        if options['resume'] and checkpoint.exists():
+            last_id = max(last_id, json.loads(checkpoint.read_text())[
+                'last_id'])
+            self.stdout.write(f"Resuming after image id {last_id}")
+
+        images = Image.objects.order_by('id').only(
+            'id', 'post_id', 'image', 'thumbnail')
+        if options['missing_only']:
+            images = images.filter(
+                Q(thumbnail__isnull=True) | Q(thumbnail=''))
+
+        done = failed = 0
+        started = time.perf_counter()
+
+        with ProcessPoolExecutor(
+                max_workers=max(options['concurrency'], 1),
+                initializer=_init_worker) as pool:
+            while True:
+                chunk = list(
+                    images.filter(id__gt=last_id)[:options['chunk_size']])
+                if not chunk:
+                    break
+
+                by_id = {image.id: image for image in chunk}
+                futures = [
+                    pool.submit(_render_thumbnail, image.id, image.image.name)
+                    for image in chunk
+                ]
+
+                updated = []
+                replaced = set()
+                for future in futures:
+                    image_id, thumb, error, name = future.result()
+                    if error:
+                        failed += 1
+                        self.stderr.write(f"Image {image_id}: {error}")
+                        continue
+                    image = by_id[image_id]
+                    old_name = image.thumbnail.name
+                    image.thumbnail.save(
+                        name, ContentFile(thumb), save=False)
+                    if old_name and old_name != image.thumbnail.name:
+                        replaced.add(old_name)
+                    updated.append(image)
+
+                Image.objects.bulk_update(updated, ['thumbnail'])
+                self._delete_unreferenced(replaced)
+                post_ids = {image.post_id for image in updated}
+                bump_post_versions(post_ids)
+                if post_cards_enabled():
+                    write_post_cards(post_ids)
+                done += len(updated)
+                last_id = chunk[-1].id
+                self._write_checkpoint(checkpoint, last_id)
+
+                rate = done / (time.perf_counter() - started)
+                self.stdout.write(
+                    f"Up to id {last_id}: {done} rebuilt, "
+                    f"{failed} failed, {rate:.1f} images/s"
+                )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {done} thumbnail(s), {failed} failed "
+            f"in {elapsed:.1f}s."
+        ))
+
+    def _delete_unreferenced(self, names: set[str]) -> None:
+        """
+        Remove replaced thumbnail files no Image row refers to anymore.
+        """
+        shared = set(
+            Image.objects.filter(thumbnail__in=names)
+            .values_list('thumbnail', flat=True)
+        )
+        storage = Image._meta.get_field('thumbnail').storage
+        for name in names - shared:
+            storage.delete(name)
+
+    def _write_checkpoint(self, path: Path, last_id: int) -> None:
+        """
+        Atomically record progress (write to a temp file, then rename).
+        """
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        tmp.write_text(json.dumps({'last_id': last_id}))
+        os.replace(tmp, path)
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_likes_count(apps, schema_editor):
+    Post = apps.get_model("posts", "Post")
+    Like = apps.get_model("likes", "Like")
+    counts = (
+        Like.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(c=Count("id"))
+        .values("c")
+    )
+    Post.objects.update(likes_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0004_post_feed_indexes"),
+        ("likes", "0002_alter_like_unique_together_like_uniq_like_user_post"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(
+            backfill_likes_count, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:55
+
+from django.db import migrations, models
+import posts.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0007_imagerendition"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="image",
+            name="content_hash",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name="image",
+            name="image",
+            field=models.ImageField(upload_to=posts.models.image_upload_to),
+        ),
+    ]
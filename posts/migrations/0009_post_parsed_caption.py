@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0008_image_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="caption_body",
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="caption_tags",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:09
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_post_count(apps, schema_editor):
+    Tag = apps.get_model("posts", "Tag")
+    Through = apps.get_model("posts", "Post").tags.through
+    counts = (
+        Through.objects.filter(tag_id=OuterRef("pk"))
+        .order_by()
+        .values("tag_id")
+        .annotate(c=Count("id"))
+        .values("c")
+    )
+    Tag.objects.update(post_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0010_tagbucket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="post_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_post_count, migrations.RunPython.noop),
+    ]
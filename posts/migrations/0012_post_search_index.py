@@ -0,0 +1,95 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE posts_post_fts USING fts5(
+        caption,
+        content='posts_post',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER posts_post_fts_insert AFTER INSERT ON posts_post BEGIN
+        INSERT INTO posts_post_fts(rowid, caption)
+        VALUES (new.id, new.caption);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_post_fts_delete AFTER DELETE ON posts_post BEGIN
+        INSERT INTO posts_post_fts(posts_post_fts, rowid, caption)
+        VALUES ('delete', old.id, old.caption);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_post_fts_update AFTER UPDATE OF caption
+    ON posts_post BEGIN
+        INSERT INTO posts_post_fts(posts_post_fts, rowid, caption)
+        VALUES ('delete', old.id, old.caption);
+        INSERT INTO posts_post_fts(rowid, caption)
+        VALUES (new.id, new.caption);
+    END
+    """,
+    "INSERT INTO posts_post_fts(posts_post_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS posts_post_fts_update",
+    "DROP TRIGGER IF EXISTS posts_post_fts_delete",
+    "DROP TRIGGER IF EXISTS posts_post_fts_insert",
+    "DROP TABLE IF EXISTS posts_post_fts",
+]
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE posts_post ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(caption, ''))
+    ) STORED
+    """,
+    """
+    CREATE INDEX posts_post_search_idx
+    ON posts_post USING GIN (search_vector)
+    """,
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS posts_post_search_idx",
+    "ALTER TABLE posts_post DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(schema_editor, statements_by_vendor):
+    for statement in statements_by_vendor.get(
+        schema_editor.connection.vendor, []
+    ):
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    _run(
+        schema_editor,
+        {"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD},
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    _run(
+        schema_editor,
+        {"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRES_BACKWARD},
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index over Post.caption, maintained by the database:
+    an external-content FTS5 table kept in sync by triggers on SQLite,
+    a generated tsvector column with a GIN index on PostgreSQL. Other
+    backends get no index (search falls back to LIKE).
+    """
+
+    dependencies = [
+        ("posts", "0011_tag_post_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Composite (tag_id, post_id) index on the auto-created Post.tags
+    through table: a tag's posting list is read, and probed for given
+    post ids, from the index alone. Django only creates the (post_id,
+    tag_id) unique index and a single-column tag_id index for it.
+    """
+
+    dependencies = [
+        ("posts", "0012_post_search_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX posts_post_tags_tag_post_idx "
+            "ON posts_post_tags (tag_id, post_id)",
+            "DROP INDEX IF EXISTS posts_post_tags_tag_post_idx",
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_timeline(apps, schema_editor):
+    Through = apps.get_model("posts", "Post").tags.through
+    TagTimelineEntry = apps.get_model("posts", "TagTimelineEntry")
+    rows = Through.objects.values_list(
+        "tag_id", "post_id", "post__created_at"
+    ).iterator(chunk_size=2000)
+    batch = []
+    for tag_id, post_id, created_at in rows:
+        batch.append(
+            TagTimelineEntry(
+                tag_id=tag_id, post_id=post_id, created_at=created_at
+            )
+        )
+        if len(batch) >= 2000:
+            TagTimelineEntry.objects.bulk_create(batch)
+            batch = []
+    TagTimelineEntry.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0013_post_tags_tag_post_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagTimelineEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_entries",
+                        to="posts.post",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="timeline",
+                        to="posts.tag",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["tag", "-created_at", "-post"],
+                        name="tag_timeline_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="tagtimelineentry",
+            constraint=models.UniqueConstraint(
+                fields=("tag", "post"), name="uniq_tag_timeline_entry"
+            ),
+        ),
+        migrations.RunPython(backfill_timeline, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_cooccurrence(apps, schema_editor):
+    qn = schema_editor.connection.ops.quote_name
+    through = qn(apps.get_model("posts", "Post").tags.through._meta.db_table)
+    table = qn(apps.get_model("posts", "TagCooccurrence")._meta.db_table)
+    schema_editor.execute(
+        f"INSERT INTO {table} (tag_id, related_id, {qn('count')}) "
+        f"SELECT a.tag_id, b.tag_id, COUNT(*) "
+        f"FROM {through} a JOIN {through} b "
+        f"ON b.post_id = a.post_id AND b.tag_id <> a.tag_id "
+        f"GROUP BY a.tag_id, b.tag_id"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0014_tagtimelineentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagCooccurrence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="posts.tag",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cooccurrences",
+                        to="posts.tag",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["tag", "-count"],
+                        name="tag_cooccurrence_rank_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="tagcooccurrence",
+            constraint=models.UniqueConstraint(
+                fields=("tag", "related"), name="uniq_tag_cooccurrence"
+            ),
+        ),
+        migrations.RunPython(backfill_cooccurrence, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("posts", "0015_tagcooccurrence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostCard",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="posts.post",
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("author_username", models.CharField(max_length=150)),
+                ("author_name", models.CharField(max_length=150)),
+                (
+                    "author_avatar_url",
+                    models.CharField(blank=True, max_length=500),
+                ),
+                ("caption", models.TextField(blank=True)),
+                ("caption_html", models.TextField(blank=True)),
+                ("tags", models.JSONField(default=list)),
+                ("images", models.JSONField(default=list)),
+                ("likes_count", models.PositiveIntegerField(default=0)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-created_at", "-post"],
+                        name="post_card_feed_idx",
+                    ),
+                    models.Index(
+                        fields=["author", "-created_at", "-post"],
+                        name="post_card_author_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
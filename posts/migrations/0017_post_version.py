@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 02:31
+
+from django.db import migrations, models
+
+# A plain ALTER TABLE instead of AddField: on SQLite, AddField with a
+# default rebuilds posts_post, which would drop the full-text search
+# triggers from 0012 (and copy the whole table).
+ADD_VERSION = (
+    'ALTER TABLE "posts_post" ADD COLUMN "version" integer NOT NULL '
+    'DEFAULT 1 CHECK ("version" >= 0)'
+)
+DROP_VERSION = 'ALTER TABLE "posts_post" DROP COLUMN "version"'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0016_postcard"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(ADD_VERSION, DROP_VERSION),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name="post",
+                    name="version",
+                    field=models.PositiveIntegerField(
+                        default=1, editable=False
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any
 
 from django.conf import settings
@@ -5,11 +6,15 @@ from django.db import models
 from django.db.models import UniqueConstraint
 from django.db.models.functions import Lower
 from django.urls import reverse
+from django.utils import timezone
 
 
 class Tag(models.Model):
     """Normalized, case-insensitive unique tag."""
     name = models.CharField(max_length=30, unique=True)
+    # Denormalized number of posts carrying the tag, maintained by tag
+    # sync and post deletion (see posts.services.tag_services).
+    post_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         constraints = [
@@ -40,8 +45,34 @@ class Post(models.Model):
         related_name="posts"
     )
     caption = models.TextField(blank=True)
+    # Caption parsed once at save time (captions.parse_caption): the
+    # text without hashtags and the ordered, unique tag names. NULL until
+    # the post is next saved; templates then fall back to the filters.
+    caption_body = models.TextField(null=True, blank=True, editable=False)
+    caption_tags = models.JSONField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     tags = models.ManyToManyField(Tag, related_name="posts", blank=True)
+    # Denormalized counter maintained by likes.services.like_services;
+    # repaired by the `reconcile_likes_count` management command.
+    likes_count = models.PositiveIntegerField(default=0)
+    # Bumped whenever the viewer-independent rendering of the post
+    # changes (caption, images, author profile); part of the feed
+    # fragment cache key (see posts.services.post_versions).
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination seeks on the feed ordering
+            # (see posts.services.selectors.paginate_feed).
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="post_feed_idx",
+            ),
+            models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="post_author_feed_idx",
+            ),
+        ]
 
     def get_absolute_url(self):
         return reverse('users:profile', args=[self.author.username])
@@ -50,6 +81,21 @@ class Post(models.Model):
         return f"Post by {self.author.email} at {self.created_at}"
 
 
+def image_upload_to(instance: "Image", filename: str) -> str:
+    """
+    Storage name for an uploaded original.
+
+    With MEDIA_CONTENT_ADDRESSED enabled and a content hash set, the
+    blob is stored once under a sharded path derived from its SHA-256
+    (posts/ab/cd/abcd....jpg); otherwise under posts/<filename>.
+    """
+    digest = instance.content_hash
+    if settings.MEDIA_CONTENT_ADDRESSED and digest:
+        ext = Path(filename).suffix.lower()
+        return f"posts/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+    return f"posts/{filename}"
+
+
 class Image(models.Model):
     """
     Image model attached to a post, allowing multiple images per post.
@@ -58,10 +104,229 @@ class Image(models.Model):
     post = models.ForeignKey(
         Post, on_delete=models.CASCADE, related_name="images"
     )
-    image = models.ImageField(upload_to="posts/")
+    image = models.ImageField(upload_to=image_upload_to)
+    # SHA-256 of the original, set when MEDIA_CONTENT_ADDRESSED is on;
+    # identical uploads share the stored blob, thumbnail and renditions.
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
     thumbnail = models.ImageField(
         upload_to="posts/thumbnails/", blank=True, null=True
     )
 
     def __str__(self) -> str:
         return f"Image for post {self.post.id}"
+
+
+class ImageRendition(models.Model):
+    """
+    Resized encoding of an Image for responsive `srcset` delivery.
+
+    One row per (image, width, format); built by
+    posts.services.rendition_services.build_renditions.
+    """
+
+    class Format(models.TextChoices):
+        WEBP = "webp", "WebP"
+        JPEG = "jpeg", "JPEG"
+
+    image = models.ForeignKey(
+        Image, on_delete=models.CASCADE, related_name="renditions"
+    )
+    format = models.CharField(max_length=4, choices=Format.choices)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    file = models.ImageField(upload_to="posts/renditions/")
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["image", "format", "width"],
+                name="uniq_rendition_image_format_width",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.width}w {self.format} of image {self.image_id}"
+
+
+class ThumbnailJob(models.Model):
+    """
+    Durable queue entry for generating an image thumbnail off-request.
+
+    Rows are claimed and processed by the `process_thumbnail_jobs`
+    management command; see posts.services.thumbnail_jobs.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    image = models.OneToOneField(
+        Image, on_delete=models.CASCADE, related_name="thumbnail_job"
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "run_after"],
+                name="thumbnail_job_due_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Thumbnail job for image {self.image_id} ({self.status})"
+
+
+class TagTimelineEntry(models.Model):
+    """
+    One row per (tag, post) carrying the post's creation time, so a tag
+    feed can be read in (-created_at, -post) order straight from an
+    index instead of sorting every post with the tag.
+
+    Maintained alongside the Post.tags through-rows by tag sync.
+    """
+
+    tag = models.ForeignKey(
+        Tag, on_delete=models.CASCADE, related_name="timeline"
+    )
+    post = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="tag_entries"
+    )
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["tag", "post"],
+                name="uniq_tag_timeline_entry",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["tag", "-created_at", "-post"],
+                name="tag_timeline_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.tag_id} post {self.post_id} at {self.created_at}"
+
+
+class TagBucket(models.Model):
+    """
+    Number of times a tag was attached to posts created within one
+    hour (or, after compaction, one day).
+
+    Maintained incrementally by tag sync and rolled up by the
+    `compact_tag_buckets` command; see posts.services.trending.
+    """
+
+    class Granularity(models.TextChoices):
+        HOUR = "hour", "Hour"
+        DAY = "day", "Day"
+
+    tag = models.ForeignKey(
+        Tag, on_delete=models.CASCADE, related_name="buckets"
+    )
+    granularity = models.CharField(max_length=4, choices=Granularity.choices)
+    start = models.DateTimeField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["granularity", "start", "tag"],
+                name="uniq_tag_bucket",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.tag_id} {self.granularity} {self.start}: {self.count}"
+
+
+class TagCooccurrence(models.Model):
+    """
+    Number of posts carrying both `tag` and `related`.
+
+    Stored in both directions so the tags most often used together with
+    a tag are one index range scan on (tag, -count). Maintained as a
+    delta by tag sync and rebuilt in bulk by the `rebuild_tag_cooccurrence`
+    command; see posts.services.cooccurrence.
+    """
+
+    tag = models.ForeignKey(
+        Tag, on_delete=models.CASCADE, related_name="cooccurrences"
+    )
+    related = models.ForeignKey(
+        Tag, on_delete=models.CASCADE, related_name="+"
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=["tag", "related"],
+                name="uniq_tag_cooccurrence",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["tag", "-count"],
+                name="tag_cooccurrence_rank_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.tag_id} + #{self.related_id}: {self.count}"
+
+
+class PostCard(models.Model):
+    """
+    Denormalized read model of a post as the feed renders it: author
+    display data, image URLs, tags, caption HTML and likes count in
+    one row, so a feed page is a single range read on
+    (-created_at, -post) with no joins or prefetches.
+
+    Written by the post, image, like and profile services when
+    POST_CARDS_ENABLED is on; see posts.services.post_cards.
+    """
+
+    post = models.OneToOneField(
+        Post, on_delete=models.CASCADE, primary_key=True, related_name="card"
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    created_at = models.DateTimeField()
+    author_username = models.CharField(max_length=150)
+    author_name = models.CharField(max_length=150)
+    author_avatar_url = models.CharField(max_length=500, blank=True)
+    caption = models.TextField(blank=True)
+    caption_html = models.TextField(blank=True)
+    tags = models.JSONField(default=list)
+    images = models.JSONField(default=list)
+    likes_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-post"],
+                name="post_card_feed_idx",
+            ),
+            models.Index(
+                fields=["author", "-created_at", "-post"],
+                name="post_card_author_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Card for post {self.post_id}"
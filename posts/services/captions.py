@@ -0,0 +1,35 @@
+import re
+from typing import Final, List, TypedDict
+
+# The single hashtag tokenizer shared by tag extraction, caption parsing
+# and the template filters.
+HASHTAG_RE: Final = re.compile(r"#([\wа-яА-ЯёЁїЇіІєЄґҐ]+)", re.UNICODE)
+
+
+class ParsedCaption(TypedDict):
+    body: str
+    tags: List[str]
+
+
+def parse_caption(caption: str) -> ParsedCaption:
+    """
+    Split a caption into display text and tags in a single pass.
+
+    Args:
+        caption (str): The raw post caption.
+
+    Returns:
+        ParsedCaption: `body` is the caption with hashtags and trailing
+        whitespace removed; `tags` are the unique lowercase tag names
+        in order of first appearance.
+    """
+    tags: List[str] = []
+
+    def collect(match: re.Match) -> str:
+        name = match.group(1).lower()
+        if name not in tags:
+            tags.append(name)
+        return ""
+
+    body = HASHTAG_RE.sub(collect, caption or "").rstrip("\n\r\t ")
+    return {"body": body, "tags": tags}
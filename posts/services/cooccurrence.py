@@ -0,0 +1,114 @@
+from typing import Final, Iterable, Sequence
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+
+from core.cache import TieredCache
+from posts.models import Post, TagCooccurrence
+
+RELATED_TAGS_LIMIT: Final = 8
+RELATED_TAGS_TTL: Final = 300
+
+# Related-tag lists, keyed by "<tag id>:<limit>"; they drift slowly,
+# so a stale list is served while it is recomputed.
+RELATED_TAGS_CACHE: Final = TieredCache(
+    "posts:related-tags", ttl=RELATED_TAGS_TTL, stale_ttl=RELATED_TAGS_TTL
+)
+
+
+def _pairs(changed: set[int], kept: set[int]) -> Q:
+    """
+    Match the (tag, related) rows for every pair of tags that involves
+    at least one tag from `changed`, in both directions.
+    """
+    return Q(tag_id__in=changed, related_id__in=changed | kept) | Q(
+        tag_id__in=kept, related_id__in=changed
+    )
+
+
+def record_cooccurrence_changes(
+        added_ids: Sequence[int],
+        removed_ids: Sequence[int],
+        kept_ids: Iterable[int]) -> None:
+    """
+    Apply a post's tag diff to the co-occurrence counts.
+
+    Only pairs involving an added or removed tag change: each added tag
+    now co-occurs with the other added and the kept tags, each removed
+    tag no longer co-occurs with the other removed and the kept tags.
+    Missing rows are created with an INSERT that ignores conflicts and
+    incremented by one `count = count + 1` UPDATE in the same
+    transaction, so a new row is never visible at zero. Removals lock
+    the pairs they decrement and delete only those that this call took
+    to zero, so a concurrent add is never deleted along with them.
+
+    Args:
+        added_ids (Sequence[int]): Ids of tags attached to the post.
+        removed_ids (Sequence[int]): Ids of tags detached from the post.
+        kept_ids (Iterable[int]): Ids of the post's unchanged tags.
+    """
+    added, removed = set(added_ids), set(removed_ids)
+    kept = set(kept_ids) - added - removed
+
+    if added and len(added | kept) > 1:
+        # Joins the caller's transaction (tag sync) without a savepoint.
+        with transaction.atomic(savepoint=False):
+            TagCooccurrence.objects.bulk_create(
+                [
+                    TagCooccurrence(tag_id=a, related_id=b)
+                    for a in added
+                    for b in added | kept
+                    if a != b
+                ]
+                + [
+                    TagCooccurrence(tag_id=k, related_id=a)
+                    for k in kept
+                    for a in added
+                ],
+                ignore_conflicts=True,
+            )
+            TagCooccurrence.objects.filter(_pairs(added, kept)).update(
+                count=F("count") + 1
+            )
+
+    if removed and len(removed | kept) > 1:
+        with transaction.atomic(savepoint=False):
+            ids = list(
+                TagCooccurrence.objects.filter(
+                    _pairs(removed, kept), count__gt=0
+                )
+                .select_for_update()
+                .values_list("id", flat=True)
+            )
+            decremented = TagCooccurrence.objects.filter(id__in=ids)
+            decremented.update(count=F("count") - 1)
+            decremented.filter(count=0).delete()
+
+
+def rebuild_tag_cooccurrence() -> int:
+    """
+    Recompute every co-occurrence count from the Post.tags through table.
+
+    A single INSERT ... SELECT self-joins the through table on post_id
+    and groups by tag pair, so the work happens inside the database in
+    one pass. Runs in one transaction, so readers see either the old
+    or the new table.
+
+    Returns:
+        int: Number of (tag, related) rows written.
+    """
+    qn = connection.ops.quote_name
+    through = qn(Post.tags.through._meta.db_table)
+    table = qn(TagCooccurrence._meta.db_table)
+
+    with transaction.atomic():
+        TagCooccurrence.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (tag_id, related_id, {qn('count')}) "
+                f"SELECT a.tag_id, b.tag_id, COUNT(*) "
+                f"FROM {through} a JOIN {through} b "
+                f"ON b.post_id = a.post_id AND b.tag_id <> a.tag_id "
+                f"GROUP BY a.tag_id, b.tag_id"
+            )
+        return TagCooccurrence.objects.count()
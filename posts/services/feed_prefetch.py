@@ -0,0 +1,211 @@
+"""
+Speculative prefetch of the next feed page.
+
+A viewer on page N of a feed very often asks for page N+1 a few
+seconds later. After a page is rendered, `schedule_next_page` builds
+the next page (the same `paginate_feed` result the view would build)
+on a small background worker pool and parks it in the shared cache
+under a short-TTL key per viewer, path and cursor;
+`take_prefetched_page` hands it to the view when the request arrives.
+
+Keyset cursors are stable, so new posts elsewhere in the feed never
+change the page behind a cursor and the key carries no feed
+generation. Instead the page remembers the version of each post it
+holds, and taking it re-reads versions and like states in one query:
+a page whose posts were edited or deleted meanwhile is discarded as
+`stale` and the view builds it afresh, while likes are simply
+refreshed in place.
+
+The pool is bounded: when PREFETCH_MAX_PENDING pages are already
+queued or running, new requests are dropped instead of piling up work
+behind a slow database.
+
+Counters (`scheduled`, `dropped`, `hits`, `misses`, `stale`, `errors`) are
+reported under the "posts:feed-prefetch" family of `cache_metrics`.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Final, Optional
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Exists, OuterRef, QuerySet
+
+from core.cache import record_cache_event
+from likes.models import Like
+from posts.models import Post
+from posts.services.selectors import FeedPage, paginate_feed
+
+PREFETCH_FAMILY: Final = "posts:feed-prefetch"
+# A prefetched page is only useful while the viewer keeps scrolling.
+PREFETCH_TTL: Final = 30
+PREFETCH_WORKERS: Final = 2
+# Queued plus running prefetches per process; beyond this we drop.
+PREFETCH_MAX_PENDING: Final = 8
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+_pending: set[str] = set()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS,
+                thread_name_prefix="feed-prefetch",
+            )
+        return _pool
+
+
+def prefetch_key(viewer_id: int, path: str, cursor: str) -> str:
+    """
+    Cache key of one viewer's prefetched page.
+    """
+    return f"{PREFETCH_FAMILY}:{viewer_id}:{path}:{cursor}"
+
+
+def prefetch_page(
+        key: str,
+        feed_qs: Callable[..., QuerySet],
+        viewer: object,
+        cursor: str) -> None:
+    """
+    Build the page at `cursor` and store it under `key`.
+
+    Runs in a pool worker; called directly it is synchronous.
+
+    Args:
+        key (str): Key from `prefetch_key`.
+        feed_qs (Callable): Builds the feed queryset for a viewer.
+        viewer: The viewer the page is built for.
+        cursor (str): The page's `?cursor=` value.
+    """
+    page = paginate_feed(feed_qs(viewer), cursor)
+    posts = list(page["posts"])
+    if posts and isinstance(posts[0], Post):
+        versions = {post.pk: post.version for post in posts}
+    else:
+        # Cards carry no version; an edit landing between the two reads
+        # can at worst be served for PREFETCH_TTL.
+        versions = dict(
+            Post.objects.filter(pk__in=[post.pk for post in posts])
+            .values_list("pk", "version")
+        )
+    cache.set(key, {"page": {**page, "posts": posts}, "versions": versions},
+              PREFETCH_TTL)
+
+
+def _run(key: str, *args: object) -> None:
+    try:
+        prefetch_page(key, *args)
+    except Exception:
+        record_cache_event(PREFETCH_FAMILY, "errors")
+    finally:
+        with _pool_lock:
+            _pending.discard(key)
+        connections.close_all()
+
+
+def schedule_next_page(
+        feed_qs: Callable[..., QuerySet],
+        viewer: object,
+        path: str,
+        cursor: Optional[str]) -> bool:
+    """
+    Prefetch the page at `cursor` for `viewer` in the background.
+
+    Does nothing when there is no next page, when the same page is
+    already being prefetched, or when the pool is saturated.
+
+    Args:
+        feed_qs (Callable): Builds the feed queryset for a viewer.
+        viewer: The authenticated viewer.
+        path (str): Request path of the feed.
+        cursor (Optional[str]): The current page's `next_cursor`.
+
+    Returns:
+        bool: True if a prefetch was queued.
+    """
+    if not cursor:
+        return False
+    key = prefetch_key(viewer.pk, path, cursor)
+    with _pool_lock:
+        if key in _pending:
+            return False
+        if len(_pending) >= PREFETCH_MAX_PENDING:
+            record_cache_event(PREFETCH_FAMILY, "dropped")
+            return False
+        _pending.add(key)
+
+    record_cache_event(PREFETCH_FAMILY, "scheduled")
+    _executor().submit(_run, key, feed_qs, viewer, cursor)
+    return True
+
+
+def take_prefetched_page(
+        viewer: object,
+        path: str,
+        cursor: Optional[str]) -> Optional[FeedPage]:
+    """
+    Pop the viewer's prefetched page at `cursor`, if any.
+
+    One query re-reads the page's post versions and like states. If
+    any post was edited or deleted since the page was built, the page
+    is dropped as stale; otherwise its like buttons and counters are
+    refreshed and it is returned.
+
+    Args:
+        viewer: The authenticated viewer.
+        path (str): Request path of the feed.
+        cursor (Optional[str]): The requested `?cursor=` value.
+
+    Returns:
+        Optional[FeedPage]: The page, or None if it was not prefetched
+            or is stale.
+    """
+    if not cursor:
+        return None
+    key = prefetch_key(viewer.pk, path, cursor)
+    entry = cache.get(key)
+    if entry is None:
+        record_cache_event(PREFETCH_FAMILY, "misses")
+        return None
+    cache.delete(key)
+
+    page, versions = entry["page"], entry["versions"]
+    rows = (
+        Post.objects.filter(pk__in=list(versions))
+        .annotate(
+            liked=Exists(
+                Like.objects.filter(user=viewer, post=OuterRef("pk"))
+            )
+        )
+        .values_list("pk", "version", "liked", "likes_count")
+    )
+    current, states = {}, {}
+    for pk, version, liked, likes_count in rows:
+        current[pk] = version
+        states[pk] = (liked, likes_count)
+    if current != versions:
+        record_cache_event(PREFETCH_FAMILY, "stale")
+        return None
+    record_cache_event(PREFETCH_FAMILY, "hits")
+
+    for post in page["posts"]:
+        post.has_liked, post.likes_count = states[post.pk]
+    return page
+
+
+def wait_for_prefetches() -> None:
+    """
+    Block until every queued prefetch of this process has finished
+    (used by `bench_feed_scroll`).
+    """
+    while True:
+        with _pool_lock:
+            if not _pending:
+                return
+        time.sleep(0.01)
@@ -0,0 +1,109 @@
+import hashlib
+import time
+from typing import Final, Optional
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpRequest
+
+from core.cache import TieredCache
+
+FEED_GENERATION_KEY: Final = "posts:feed-generation"
+LIKES_GENERATION_KEY: Final = "posts:likes-generation"
+# Upper bound on how long a shared feed page can show stale like counts
+# to viewers without JavaScript; content changes bump the generation.
+FEED_PAGE_TTL: Final = 30
+
+# Shared feed page bodies, keyed by `feed_page_key`. A page past its
+# TTL is served once more while one worker re-renders it.
+FEED_PAGES: Final = TieredCache(
+    "posts:feed-page", ttl=FEED_PAGE_TTL, stale_ttl=FEED_PAGE_TTL, l1_ttl=5
+)
+
+
+def _generation(key: str) -> int:
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        generation = cache.get(key, 0)
+    return generation
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def feed_generation() -> int:
+    """
+    Current feed generation from the shared cache, initialising it if
+    missing. A time-based seed keeps a reset (eviction, cache flush)
+    from reusing a generation some cached page was built for.
+    """
+    return _generation(FEED_GENERATION_KEY)
+
+
+def bump_feed_generation() -> None:
+    """
+    Invalidate every shared feed page in every process.
+
+    Pages are cached under the generation they were built for, so
+    nothing is deleted; the next request for each page misses and
+    re-renders. Needs a shared cache backend in multi-process
+    deployments.
+    """
+    _bump(FEED_GENERATION_KEY)
+
+
+def likes_generation() -> int:
+    """
+    Counter of like/unlike events (any viewer, any post), seeded like
+    `feed_generation`.
+    """
+    return _generation(LIKES_GENERATION_KEY)
+
+
+def bump_likes_generation() -> None:
+    """
+    Record that some post's like count or like state changed.
+    """
+    _bump(LIKES_GENERATION_KEY)
+
+
+def feed_page_key(path: str, cursor: Optional[str]) -> str:
+    """
+    FEED_PAGES key of the shared body of one feed page at the current
+    generation.
+    """
+    return f"{feed_generation()}:{path}:{cursor or ''}"
+
+
+def feed_etag(request: HttpRequest, *parts: object) -> Optional[str]:
+    """
+    ETag of a feed, tag or profile page for conditional GET.
+
+    Built only from cache reads and the viewer: the feed generation
+    (post content), the likes generation (counters and like states)
+    and the viewer id, plus any page-specific `parts`; the path and
+    cursor need no part because validators are per URL. Nothing in
+    the feed is queried, so a matching request is answered 304 before
+    any selector runs.
+
+    Args:
+        request (HttpRequest): The GET request.
+        *parts: Extra values the page depends on.
+
+    Returns:
+        Optional[str]: The ETag, or None (no validator) when
+        FEED_CONDITIONAL_GET is off or flash messages are waiting to
+        be shown.
+    """
+    if not settings.FEED_CONDITIONAL_GET or len(get_messages(request)):
+        return None
+    raw = ":".join(map(str, (
+        feed_generation(), likes_generation(), request.user.pk, *parts,
+    )))
+    return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
@@ -1,10 +1,87 @@
 from typing import Any
 
-from django.core.files.uploadedfile import UploadedFile
+from django.conf import settings
+from django.core.files import File
 from django.forms import BaseModelFormSet
 
-from posts.models import Image, Post
-from posts.services.image_utils import generate_thumbnail
+from posts.models import Image, ImageRendition, Post
+from posts.services.image_utils import generate_thumbnail, hash_file
+from posts.services.post_cards import refresh_post_card
+from posts.services.post_versions import bump_post_versions
+from posts.services.rendition_services import (build_renditions,
+                                               clear_renditions)
+from posts.services.thumbnail_jobs import enqueue_thumbnail
+
+
+def _build_thumbnail(image_obj: Image, source: File) -> None:
+    """
+    Generate the thumbnail and responsive renditions inline,
+    or queue them when THUMBNAIL_ASYNC is on.
+
+    In async mode the request only inserts a ThumbnailJob row; the
+    `process_thumbnail_jobs` worker does the Pillow decode/resize and
+    the feed shows the original image until the thumbnail is ready.
+    """
+    if settings.THUMBNAIL_ASYNC:
+        enqueue_thumbnail(image_obj)
+        return
+
+    thumb = generate_thumbnail(source)
+    image_obj.thumbnail.save(thumb.name, thumb, save=True)
+    build_renditions(image_obj, source)
+
+
+def _store_image(image_obj: Image) -> None:
+    """
+    Save an image, storing its upload by content hash when
+    MEDIA_CONTENT_ADDRESSED is on.
+
+    If an image with the same content already exists, its stored blob,
+    thumbnail and renditions are reused by name: nothing is uploaded and
+    no thumbnail work is needed. Otherwise the upload is written once
+    under its sharded hash path, which is unique by construction.
+    """
+    upload = image_obj.image
+    if not settings.MEDIA_CONTENT_ADDRESSED or upload._committed:
+        image_obj.save()
+        return
+
+    image_obj.content_hash = hash_file(upload.file)
+    twin = (
+        Image.objects.filter(content_hash=image_obj.content_hash)
+        .exclude(pk=image_obj.pk)
+        .prefetch_related("renditions")
+        .order_by("id")
+        .first()
+    )
+    if twin is None:
+        image_obj.save()
+        return
+
+    if image_obj.pk:
+        clear_renditions(image_obj)
+    image_obj.image = twin.image.name
+    image_obj.thumbnail = twin.thumbnail.name or None
+    image_obj.save()
+    ImageRendition.objects.bulk_create(
+        ImageRendition(
+            image=image_obj,
+            format=rendition.format,
+            width=rendition.width,
+            height=rendition.height,
+            file=rendition.file.name,
+        )
+        for rendition in twin.renditions.all()
+    )
+
+
+def _delete_unreferenced_thumbnail(name: str) -> None:
+    """
+    Remove a replaced thumbnail file unless an image still refers to it
+    (content-addressed twins share theirs).
+    """
+    if name and not Image.objects.filter(thumbnail=name).exists():
+        Image._meta.get_field("thumbnail").storage.delete(name)
 
 
 def save_images_to_post(post: Post, images_data: list[dict[str, Any]]) -> None:
@@ -13,21 +90,30 @@ def save_images_to_post(post: Post, images_data: list[dict[str, Any]]) -> None:
 
     Each dictionary in images_data represents one cleaned form's data.
     If the image field is present, it creates a new Image instance linked
-    to the post and generates a thumbnail for it.
+    to the post and generates (or queues) a thumbnail for it. The post's
+    feed card is rewritten and its cached feed fragment invalidated
+    afterwards.
 
     Args:
         post (Post): The post instance to associate images with.
         images_data (list[dict[str, Any]]): Cleaned data from an image formset.
     """
+    saved = False
     for form_data in images_data:
         if not form_data or not form_data.get("image"):
             continue
 
-        original: UploadedFile = form_data["image"]
-        image_obj = Image.objects.create(post=post, image=original)
+        original: File = form_data["image"]
+        image_obj = Image(post=post, image=original)
+        _store_image(image_obj)
 
-        thumb = generate_thumbnail(original)
-        image_obj.thumbnail.save(thumb.name, thumb, save=True)
+        if not image_obj.thumbnail:
+            _build_thumbnail(image_obj, original)
+        saved = True
+
+    if saved:
+        bump_post_versions([post.pk])
+    refresh_post_card(post.pk)
 
 
 def handle_images_update(post: Post, formset: BaseModelFormSet) -> None:
@@ -37,8 +123,12 @@ def handle_images_update(post: Post, formset: BaseModelFormSet) -> None:
 
     This function processes the formset:
     - Saves new or updated images linked to the post
-    - Ensures that a thumbnail is generated for each image (if missing)
+    - Ensures that a thumbnail is generated or queued for each image
+      (if missing); when an image's file is replaced, its thumbnail and
+      renditions are rebuilt and the replaced files deleted
     - Deletes any images marked for deletion via the formset
+    - Rewrites the post's feed card and, if any image changed,
+      invalidates its cached feed fragment
 
     Args:
         post (Post): The post instance to associate images with.
@@ -49,11 +139,23 @@ def handle_images_update(post: Post, formset: BaseModelFormSet) -> None:
     for image in images:
         if image.image:
             image.post = post
-            image.save()
+            replaced_thumbnail = None
+            if image.pk and not image.image._committed:
+                # New file for an existing image: its derived files show
+                # the old picture, so drop them before storing.
+                replaced_thumbnail = image.thumbnail.name
+                image.thumbnail = None
+                clear_renditions(image)
+            _store_image(image)
 
             if not image.thumbnail:
-                thumb = generate_thumbnail(image.image)
-                image.thumbnail.save(thumb.name, thumb, save=True)
+                _build_thumbnail(image, image.image)
+            if replaced_thumbnail:
+                _delete_unreferenced_thumbnail(replaced_thumbnail)
 
     for obj in formset.deleted_objects:
         obj.delete()
+
+    if images or formset.deleted_objects:
+        bump_post_versions([post.pk])
+    refresh_post_card(post.pk)
@@ -1,23 +1,137 @@
+import hashlib
 from io import BytesIO
 from pathlib import Path
+from typing import Iterable, NamedTuple
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 from PIL import Image as PilImage
+from PIL import features
 
 THUMBNAIL_SIZE = (300, 300)
+# Let JPEG DCT scaling decode at up to this multiple of the target size;
+# the final resample from there keeps full quality.
+DRAFT_OVERSAMPLE = 2
+
+RENDITION_QUALITY = {"jpeg": 82, "webp": 80}
+PIL_FORMATS = {"jpeg": "JPEG", "webp": "WEBP"}
+
+
+class ImageTooLargeError(ValueError):
+    """
+    Raised when decoding an image would exceed IMAGE_MAX_DECODE_PIXELS.
+    """
+
+
+class RenditionFile(NamedTuple):
+    """
+    One encoded rendition produced by generate_renditions.
+    """
+    format: str
+    width: int
+    height: int
+    content: ContentFile
+
+
+def open_scaled(source, target_size: tuple[int, int]) -> PilImage.Image:
+    """
+    Open an image for downscaling, decoding as few pixels as possible.
+
+    Only the header is read up front. For JPEG, `draft()` asks libjpeg
+    to decode directly at 1/2, 1/4 or 1/8 scale (still at least
+    DRAFT_OVERSAMPLE x `target_size`), so a 48 MP photo is never
+    materialized at full resolution. Other formats have no scaled
+    decoder; they are decoded once and shrunk with `reduce()`.
+
+    The decode size is checked against IMAGE_MAX_DECODE_PIXELS before
+    any pixel data is read, which bounds worker memory per image.
+
+    Args:
+        source: File-like image (upload or FieldFile).
+        target_size: Bounding box the caller will resize into.
+
+    Returns:
+        PIL.Image.Image: Loaded image, at least as large as needed.
+
+    Raises:
+        ImageTooLargeError: The decode would exceed the pixel ceiling.
+    """
+    img = PilImage.open(source)
+    draft_size = (
+        target_size[0] * DRAFT_OVERSAMPLE, target_size[1] * DRAFT_OVERSAMPLE
+    )
+    if img.format == "JPEG":
+        img.draft("RGB", draft_size)
+
+    width, height = img.size
+    if width * height > settings.IMAGE_MAX_DECODE_PIXELS:
+        raise ImageTooLargeError(
+            f"Decoding {width}x{height} exceeds "
+            f"{settings.IMAGE_MAX_DECODE_PIXELS} pixels"
+        )
+
+    factor = min(width // draft_size[0], height // draft_size[1])
+    if factor >= 2:
+        img = img.reduce(factor)
+    else:
+        img.load()
+    return img
+
+
+def check_decode_budget(source) -> None:
+    """
+    Validate that an upload can be thumbnailed within the pixel ceiling.
+
+    Reads only the image header; used by forms to reject oversized
+    uploads with a validation error instead of failing in a worker.
+
+    Raises:
+        ImageTooLargeError: The scaled decode would exceed the ceiling.
+    """
+    img = PilImage.open(source)
+    if img.format == "JPEG":
+        # Smallest target we ever decode for (the thumbnail).
+        img.draft("RGB", (
+            THUMBNAIL_SIZE[0] * DRAFT_OVERSAMPLE,
+            THUMBNAIL_SIZE[1] * DRAFT_OVERSAMPLE,
+        ))
+    width, height = img.size
+    if width * height > settings.IMAGE_MAX_DECODE_PIXELS:
+        raise ImageTooLargeError(
+            f"Image is too large ({width}x{height} pixels)"
+        )
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+
+def hash_file(source) -> str:
+    """
+    SHA-256 hex digest of a file's content, read in chunks.
+
+    The file is rewound afterwards so it can still be saved or decoded.
+    """
+    digest = hashlib.sha256()
+    source.seek(0)
+    for chunk in source.chunks():
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
 
 
 def generate_thumbnail(original_image_field) -> ContentFile:
     """
     Generate thumbnail for an uploaded image and return as ContentFile.
-    """
-    img = PilImage.open(original_image_field)
 
-    if img.mode in ("RGBA", "P"):
-        img = img.convert("RGB")
+    Uses `open_scaled` so large JPEGs are decoded at reduced scale;
+    mode conversion happens after the downscale, on the small image.
+    """
+    img = open_scaled(original_image_field, THUMBNAIL_SIZE)
 
     img.thumbnail(THUMBNAIL_SIZE)
 
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
     thumb_io = BytesIO()
     img.save(thumb_io, format="JPEG", quality=85)
 
@@ -25,3 +139,66 @@ def generate_thumbnail(original_image_field) -> ContentFile:
     thumb_filename = f"thumb_{filename}"
 
     return ContentFile(thumb_io.getvalue(), name=thumb_filename)
+
+
+def generate_renditions(
+        original_image_field,
+        widths: Iterable[int],
+        formats: Iterable[str]) -> list[RenditionFile]:
+    """
+    Encode width-bounded renditions of an image in several formats.
+
+    The source is decoded once via `open_scaled` (scaled JPEG decode
+    for the widest target); widths are produced from largest to
+    smallest, each resized from the previous one.
+    Images are never upscaled: widths above the source width collapse
+    into a single native-width rendition. Formats Pillow cannot encode
+    (e.g. WebP without libwebp) are skipped.
+
+    Args:
+        original_image_field: File-like image (upload or FieldFile).
+        widths: Target widths in pixels.
+        formats: Subset of "webp" and "jpeg".
+
+    Returns:
+        list[RenditionFile]: Encoded renditions, widest first.
+    """
+    formats = [
+        fmt for fmt in formats
+        if fmt in PIL_FORMATS and (fmt != "webp" or features.check("webp"))
+    ]
+
+    widths = list(widths)
+    widest = max(widths)
+    img = open_scaled(original_image_field, (widest, widest))
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    # `open_scaled` only shrinks sources wider than 2x the widest target,
+    # so `img.width` below that bound is the native width: no upscaling.
+    stem = Path(original_image_field.name).stem
+    targets = sorted({min(w, img.width) for w in widths}, reverse=True)
+
+    renditions = []
+    current = img
+    for width in targets:
+        height = max(round(img.height * width / img.width), 1)
+        if current.width != width:
+            current = current.resize((width, height), PilImage.LANCZOS)
+
+        for fmt in formats:
+            buffer = BytesIO()
+            current.save(
+                buffer, format=PIL_FORMATS[fmt], quality=RENDITION_QUALITY[fmt]
+            )
+            ext = "jpg" if fmt == "jpeg" else fmt
+            renditions.append(RenditionFile(
+                format=fmt,
+                width=width,
+                height=height,
+                content=ContentFile(
+                    buffer.getvalue(), name=f"{stem}_{width}w.{ext}"
+                ),
+            ))
+
+    return renditions
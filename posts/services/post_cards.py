@@ -0,0 +1,203 @@
+from typing import Final, Iterable, List, TypedDict
+
+from django.conf import settings
+from django.contrib.auth.base_user import AbstractBaseUser
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.utils.html import conditional_escape
+
+from posts.models import Image, Post, PostCard
+from posts.services.captions import parse_caption
+from posts.services.selectors import IMAGES_QS
+
+CARD_FIELDS: Final = [
+    "author", "created_at", "author_username", "author_name",
+    "author_avatar_url", "caption", "caption_html", "tags", "images",
+    "likes_count",
+]
+
+
+class CardImage(TypedDict):
+    """
+    Render-ready URLs of one post image, as stored in PostCard.images,
+    plus its alt text and modal caption (images carry no caption of
+    their own, so this is the post caption).
+    """
+    caption: str
+    src: str
+    full: str
+    jpeg_srcset: str
+    webp_srcset: str
+
+
+def post_cards_enabled() -> bool:
+    return settings.POST_CARDS_ENABLED
+
+
+def _author_fields(author: AbstractBaseUser) -> dict[str, str]:
+    return {
+        "author_username": author.username,
+        "author_name": author.full_name or author.username,
+        "author_avatar_url": author.avatar.url if author.avatar else "",
+    }
+
+
+def _card_image(image: Image, caption: str) -> CardImage:
+    """
+    Mirror the feed template: the thumbnail (or a display-sized
+    rendition, or the original) inline, the widest JPEG rendition up to
+    IMAGE_DISPLAY_WIDTH in the modal, and per-format srcsets.
+    """
+    renditions = list(image.renditions.all())
+    display = [
+        r for r in renditions
+        if r.format == "jpeg" and r.width <= settings.IMAGE_DISPLAY_WIDTH
+    ]
+    full = (
+        max(display, key=lambda r: r.width).file.url
+        if display else image.image.url
+    )
+    return {
+        "caption": caption,
+        "src": image.thumbnail.url if image.thumbnail else full,
+        "full": full,
+        "jpeg_srcset": ", ".join(
+            f"{r.file.url} {r.width}w" for r in renditions
+            if r.format == "jpeg"
+        ),
+        "webp_srcset": ", ".join(
+            f"{r.file.url} {r.width}w" for r in renditions
+            if r.format == "webp"
+        ),
+    }
+
+
+def build_post_card(post: Post) -> PostCard:
+    """
+    Build (without saving) the card of a post whose author and images
+    with renditions are loaded.
+
+    Posts saved before captions were parsed at save time (no
+    `caption_body`) are parsed here, like the template filters did.
+    """
+    if post.caption_body is None:
+        parsed = parse_caption(post.caption)
+        body, tags = parsed["body"], parsed["tags"]
+    else:
+        body, tags = post.caption_body, post.caption_tags or []
+    return PostCard(
+        post=post,
+        author=post.author,
+        created_at=post.created_at,
+        caption=post.caption,
+        caption_html=conditional_escape(body),
+        tags=tags,
+        images=[
+            _card_image(image, post.caption) for image in post.images.all()
+        ],
+        likes_count=post.likes_count,
+        **_author_fields(post.author),
+    )
+
+
+def write_post_cards(post_ids: Iterable[int]) -> int:
+    """
+    Rebuild the cards of the given posts with one upsert.
+
+    Posts are loaded with the feed's image prefetch (three queries for
+    any number of posts); cards of posts that no longer exist are left
+    to the cascade.
+
+    Args:
+        post_ids (Iterable[int]): Ids of the posts to (re)write.
+
+    Returns:
+        int: Number of cards written.
+    """
+    posts = list(
+        Post.objects.filter(pk__in=list(post_ids))
+        .select_related("author")
+        .prefetch_related(Prefetch("images", queryset=IMAGES_QS))
+    )
+    PostCard.objects.bulk_create(
+        [build_post_card(post) for post in posts],
+        update_conflicts=True,
+        unique_fields=["post"],
+        update_fields=CARD_FIELDS,
+    )
+    return len(posts)
+
+
+def refresh_post_card(post_id: int) -> None:
+    """
+    Rewrite a post's card after its caption, tags or images changed.
+    No-op unless POST_CARDS_ENABLED.
+    """
+    if post_cards_enabled():
+        write_post_cards([post_id])
+
+
+def refresh_author_cards(author: AbstractBaseUser) -> int:
+    """
+    Copy an author's display name, username and avatar onto their cards.
+
+    A single UPDATE that only touches cards whose copy differs, so a
+    save that didn't change the profile (e.g. a login stamping
+    last_login) writes nothing. No-op unless POST_CARDS_ENABLED.
+
+    Returns:
+        int: Number of cards updated.
+    """
+    if not post_cards_enabled():
+        return 0
+    fields = _author_fields(author)
+    return (
+        PostCard.objects.filter(author_id=author.pk)
+        .exclude(**fields)
+        .update(**fields)
+    )
+
+
+def set_card_likes(post_id: int, likes_count: int) -> None:
+    """
+    Copy a post's new likes count onto its card.
+    No-op unless POST_CARDS_ENABLED.
+    """
+    if post_cards_enabled():
+        PostCard.objects.filter(post_id=post_id).update(
+            likes_count=likes_count
+        )
+
+
+def copy_card_likes(post_ids: Iterable[int]) -> None:
+    """
+    Copy Post.likes_count onto the cards of many posts in one UPDATE
+    (e.g. after counters were reconciled). No-op unless
+    POST_CARDS_ENABLED.
+    """
+    if post_cards_enabled():
+        PostCard.objects.filter(post_id__in=list(post_ids)).update(
+            likes_count=Subquery(
+                Post.objects.filter(pk=OuterRef("post_id"))
+                .values("likes_count")[:1]
+            )
+        )
+
+
+def rebuild_post_cards(chunk_size: int = 500) -> int:
+    """
+    Write the card of every post, in primary-key chunks.
+
+    Returns:
+        int: Number of cards written.
+    """
+    written, last_id = 0, 0
+    while True:
+        ids: List[int] = list(
+            Post.objects.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not ids:
+            return written
+        written += write_post_cards(ids)
+        last_id = ids[-1]
@@ -0,0 +1,42 @@
+from typing import Iterable
+
+from django.db.models import F
+
+from posts.models import Post
+from posts.services.feed_state import bump_feed_generation
+
+
+def bump_post_versions(post_ids: Iterable[int]) -> None:
+    """
+    Invalidate the cached feed fragments of posts whose caption or
+    images changed.
+
+    Fragments are cached under (post id, version), so bumping the
+    version makes every worker miss and re-render on the next request
+    without deleting anything from the cache; old entries expire.
+    One `version = version + 1` UPDATE, safe under concurrency. Shared
+    feed pages embedding the posts are invalidated too.
+
+    Args:
+        post_ids (Iterable[int]): Ids of the changed posts.
+    """
+    ids = list(post_ids)
+    if ids:
+        Post.objects.filter(pk__in=ids).update(version=F("version") + 1)
+        bump_feed_generation()
+
+
+def bump_author_post_versions(author_id: int) -> int:
+    """
+    Invalidate the cached feed fragments of every post by an author
+    after their name or avatar changed.
+
+    Returns:
+        int: Number of posts bumped.
+    """
+    bumped = Post.objects.filter(author_id=author_id).update(
+        version=F("version") + 1
+    )
+    if bumped:
+        bump_feed_generation()
+    return bumped
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.files import File
+
+from posts.models import Image, ImageRendition
+from posts.services.image_utils import generate_renditions
+
+
+def build_renditions(
+        image: Image,
+        source: Optional[File] = None) -> list[ImageRendition]:
+    """
+    (Re)build the responsive renditions of an image.
+
+    Widths and formats come from IMAGE_RENDITION_WIDTHS and
+    IMAGE_RENDITION_FORMATS. Existing renditions are replaced and their
+    files deleted unless another image shares them, so this is safe to
+    call again after the original file changes.
+
+    Args:
+        image (Image): Saved image to render.
+        source (File | None): Already-open original (e.g. the upload);
+            defaults to reading `image.image` from storage.
+
+    Returns:
+        list[ImageRendition]: The stored renditions, widest first.
+    """
+    encoded = generate_renditions(
+        source or image.image,
+        settings.IMAGE_RENDITION_WIDTHS,
+        settings.IMAGE_RENDITION_FORMATS,
+    )
+
+    renditions = []
+    for item in encoded:
+        rendition = ImageRendition(
+            image=image,
+            format=item.format,
+            width=item.width,
+            height=item.height,
+        )
+        rendition.file.save(item.content.name, item.content, save=False)
+        renditions.append(rendition)
+
+    replaced = set(image.renditions.values_list("file", flat=True))
+    image.renditions.all().delete()
+    created = ImageRendition.objects.bulk_create(renditions)
+    _delete_unreferenced(replaced)
+    return created
+
+
+def clear_renditions(image: Image) -> None:
+    """
+    Delete an image's renditions, e.g. because its original was
+    replaced, along with their files unless another image shares them.
+    """
+    replaced = set(image.renditions.values_list("file", flat=True))
+    image.renditions.all().delete()
+    _delete_unreferenced(replaced)
+
+
+def _delete_unreferenced(names: set[str]) -> None:
+    """
+    Remove replaced rendition files that no rendition row refers to
+    anymore (content-addressed twins share theirs).
+    """
+    shared = set(
+        ImageRendition.objects.filter(file__in=names)
+        .values_list("file", flat=True)
+    )
+    storage = ImageRendition._meta.get_field("file").storage
+    for name in names - shared:
+        storage.delete(name)
@@ -0,0 +1,62 @@
+import re
+from typing import Final, List
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_TERM_RE: Final = re.compile(r"\w+", re.UNICODE)
+# Longer queries are truncated rather than rejected.
+SEARCH_MAX_TERMS: Final = 8
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Split a user query into plain word terms (hashtag "#" and other
+    punctuation are dropped), lowercased and de-duplicated.
+    """
+    terms = dict.fromkeys(t.lower() for t in SEARCH_TERM_RE.findall(query))
+    return list(terms)[:SEARCH_MAX_TERMS]
+
+
+def caption_match(query: str) -> Q:
+    """
+    Filter matching posts whose caption contains every term of `query`,
+    the last term as a prefix (search-as-you-type).
+
+    Uses the full-text index created by migration 0012: an FTS5 table
+    on SQLite, the GIN-indexed `search_vector` column on PostgreSQL.
+    Terms are reduced to word characters and passed as parameters, so
+    user input can never inject query syntax. Other backends fall back
+    to `icontains` per term.
+
+    Args:
+        query (str): Raw search text.
+
+    Returns:
+        Q: A filter for Post querysets; matches nothing for an empty
+        query.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return Q(pk__in=[])
+
+    vendor = connection.vendor
+    if vendor == "sqlite":
+        match = " ".join(f'"{term}"' for term in terms) + "*"
+        return Q(pk__in=RawSQL(
+            "SELECT rowid FROM posts_post_fts WHERE posts_post_fts MATCH %s",
+            [match],
+        ))
+    if vendor == "postgresql":
+        tsquery = " & ".join(f"'{term}'" for term in terms) + ":*"
+        return Q(pk__in=RawSQL(
+            "SELECT id FROM posts_post "
+            "WHERE search_vector @@ to_tsquery('simple', %s)",
+            [tsquery],
+        ))
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(caption__icontains=term)
+    return condition
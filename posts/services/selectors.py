@@ -1,26 +1,90 @@
-from typing import Final
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Final, List, Optional, TypedDict
 from typing import TYPE_CHECKING
-from django.db.models import Count, Exists, OuterRef, Prefetch, QuerySet
+from django.db.models import (BooleanField, Exists, F, OuterRef, Prefetch,
+                              Q, QuerySet, Value)
 
 from likes.models import Like
-from posts.models import Post, Image, Tag
+from posts.models import (Post, PostCard, Image, ImageRendition, Tag,
+                          TagCooccurrence)
+from posts.services.cooccurrence import (RELATED_TAGS_CACHE,
+                                         RELATED_TAGS_LIMIT)
+from posts.services.search import caption_match
+from posts.services.tag_cache import get_tag_id, get_tag_ids
 
 if TYPE_CHECKING:
     from users.models import User
 
+RENDITIONS_QS: Final = (
+    ImageRendition.objects.only("id", "image_id", "format", "width", "file")
+    .order_by("width")
+)
 IMAGES_QS: Final = (
-    Image.objects.only("id", "post_id", "image", "thumbnail").order_by("id")
+    Image.objects.only("id", "post_id", "image", "thumbnail")
+    .prefetch_related(Prefetch("renditions", queryset=RENDITIONS_QS))
+    .order_by("id")
 )
 TAGS_QS: Final = Tag.objects.only("id", "name").order_by("name")
 
+FEED_PAGE_SIZE: Final = 5
+
+# "/posts/tag/python+django/" selects posts carrying every listed tag.
+TAG_SEPARATOR: Final = "+"
+MAX_FEED_TAGS: Final = 4
+# Rarest-tag posting lists up to this size are intersected by probing
+# the (tag_id, post_id) index with explicit ids; longer ones are left
+# to the database as chained semi-joins.
+INTERSECT_MAX_IDS: Final = 5000
+
+CURSOR_NEXT: Final = "n"
+CURSOR_PREV: Final = "p"
+# Largest primary key a BigAutoField column can hold.
+MAX_DB_ID: Final = 2**63 - 1
+
+
+class RelatedTag(TypedDict):
+    name: str
+    count: int
+
+
+class FeedPage(TypedDict):
+    """
+    One keyset-paginated page of a feed.
+
+    Cursors are opaque strings meant to be passed back verbatim
+    via the `?cursor=` query parameter; they are None when there is
+    nothing to fetch in that direction.
+    """
+    posts: list[Post]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+    has_next: bool
+    has_previous: bool
+
+
+def _has_liked(viewer: Optional["User"], post_ref: str) -> Exists | Value:
+    """
+    `has_liked` expression for a viewer; constant False for the
+    viewer-neutral feed (viewer=None) shared between users.
+    """
+    if viewer is None:
+        return Value(False, output_field=BooleanField())
+    return Exists(Like.objects.filter(user=viewer, post=OuterRef(post_ref)))
 
-def _base_feed_qs(viewer: "User") -> QuerySet[Post]:
+
+def _base_feed_qs(viewer: Optional["User"]) -> QuerySet[Post]:
     """
     Build the base queryset for posts with anti-N+1 guarantees.
 
     - `select_related("author")` joins FK to avoid extra queries per post.
-    - `prefetch_related` batches images & tags into 2 additional queries.
-    - `annotate` computes likes_count and has_liked in the main SELECT.
+    - `prefetch_related` batches images, their renditions & tags
+      into 3 additional queries.
+    - `likes_count` is read from the denormalized column (no GROUP BY).
+    - `annotate` computes has_liked in the main SELECT
+      (always False when `viewer` is None).
     - `only(...)` keeps row width minimal (I/O & deserialization savings).
     - Secondary order by "-id" stabilizes ordering for identical timestamps.
 
@@ -33,20 +97,51 @@ def _base_feed_qs(viewer: "User") -> QuerySet[Post]:
             Prefetch("images", queryset=IMAGES_QS),
             Prefetch("tags", queryset=TAGS_QS),
         )
-        .annotate(
-            likes_count=Count("likes", distinct=True),
-            has_liked=Exists(
-                Like.objects.filter(user=viewer, post=OuterRef("pk"))
-            ),
+        .annotate(has_liked=_has_liked(viewer, "pk"))
+        .only(
+            "id", "author_id", "caption", "caption_body", "caption_tags",
+            "created_at", "likes_count", "version",
         )
-        .only("id", "author_id", "caption", "created_at")
         .order_by("-created_at", "-id")
     )
 
 
-def get_post_feed_for_user(user: "User") -> QuerySet[Post]:
+def _card_feed_qs(viewer: Optional["User"]) -> QuerySet[PostCard]:
+    """
+    Feed read from the PostCard read model: one range read on the
+    (-created_at, -post) index with has_liked computed in the same
+    SELECT; no joins, no prefetch queries.
+
+    Returns:
+        QuerySet[PostCard]: Slice-ready queryset for `paginate_feed`.
+    """
+    return (
+        PostCard.objects.annotate(has_liked=_has_liked(viewer, "post_id"))
+        .order_by("-created_at", "-post")
+    )
+
+
+def get_post_cards_for_user(user: Optional["User"]) -> QuerySet[PostCard]:
+    """
+    Main feed as post cards (see POST_CARDS_ENABLED); user=None gives
+    the viewer-neutral feed.
+    """
+    return _card_feed_qs(viewer=user)
+
+
+def get_post_cards_by_user(
+        viewed_user: "User", viewer: "User") -> QuerySet[PostCard]:
+    """
+    Profile feed as post cards, read through the
+    (author, -created_at, -post) index.
+    """
+    return _card_feed_qs(viewer=viewer).filter(author=viewed_user)
+
+
+def get_post_feed_for_user(user: Optional["User"]) -> QuerySet[Post]:
     """
-    Main feed queryset (anti-N+1).
+    Main feed queryset (anti-N+1). Pass user=None for the
+    viewer-neutral feed shared between users (has_liked is False).
 
     Returns:
         QuerySet[Post]: Optimized queryset of latest posts for the feed.
@@ -54,18 +149,185 @@ def get_post_feed_for_user(user: "User") -> QuerySet[Post]:
     return _base_feed_qs(viewer=user)
 
 
-def get_posts_by_tag_for_user(user: "User", tag_name: str) -> QuerySet[Post]:
+def get_posts_by_tag_for_user(
+        user: Optional["User"], tag_name: str) -> QuerySet[Post]:
     """
     Tag-filtered feed (anti-N+1).
 
+    The tag name is resolved through the in-process tag id cache, so an
+    unknown tag yields an empty queryset without a query. Posts are
+    read through the tag timeline and ordered by its (created_at,
+    post_id) columns, so the database walks the (tag, -created_at,
+    -post) index and stops after one page instead of sorting every
+    post carrying the tag; `paginate_feed` seeks on the same columns.
+
     Args:
-        user: Current viewer (used for has_liked).
+        user: Current viewer (used for has_liked), or None for the
+            viewer-neutral feed.
         tag_name: Tag name to filter by (case-insensitive).
 
     Returns:
         QuerySet[Post]: Optimized queryset filtered by tag.
     """
-    return _base_feed_qs(viewer=user).filter(tags__name=tag_name.lower())
+    tag_id = get_tag_id(tag_name)
+    if tag_id is None:
+        return Post.objects.none()
+    return (
+        _base_feed_qs(viewer=user)
+        .filter(tag_entries__tag_id=tag_id)
+        .alias(
+            timeline_at=F("tag_entries__created_at"),
+            timeline_post=F("tag_entries__post_id"),
+        )
+        .order_by("-timeline_at", "-timeline_post")
+    )
+
+
+def search_posts_for_user(user: "User", query: str) -> QuerySet[Post]:
+    """
+    Caption full-text search with the feed projection (anti-N+1).
+
+    Matches come from the database full-text index (see
+    posts.services.search) and are ordered like the feed, newest
+    first, so results page with `paginate_feed` cursors.
+
+    Args:
+        user: Current viewer (used for has_liked).
+        query: Raw search text.
+
+    Returns:
+        QuerySet[Post]: Optimized queryset of matching posts.
+    """
+    return _base_feed_qs(viewer=user).filter(caption_match(query))
+
+
+def parse_tag_path(tag_path: str) -> list[str]:
+    """
+    Split a "python+Django" URL segment into normalised, unique tag
+    names.
+
+    All names are returned; callers reject paths with more than
+    MAX_FEED_TAGS of them rather than show a broader feed than the URL
+    asks for.
+    """
+    names = (name.strip().lower() for name in tag_path.split(TAG_SEPARATOR))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def _intersect_tag_posts(tag_ids: list[int]) -> "list[int] | QuerySet":
+    """
+    Ids of posts carrying every tag, given tag ids ordered rarest first.
+
+    The rarest tag's posting list is read once; every further tag only
+    probes the (tag_id, post_id) index for the surviving ids, so the cost
+    is bounded by the rarest tag no matter how popular the others are.
+    """
+    through = Post.tags.through
+    rarest, *others = tag_ids
+    post_ids = list(
+        through.objects.filter(tag_id=rarest)
+        .values_list("post_id", flat=True)[:INTERSECT_MAX_IDS + 1]
+    )
+    if len(post_ids) > INTERSECT_MAX_IDS:
+        survivors = through.objects.filter(tag_id=rarest).values("post_id")
+        for tag_id in others:
+            survivors = survivors.filter(post_id__in=through.objects.filter(
+                tag_id=tag_id).values("post_id"))
+        return survivors
+
+    for tag_id in others:
+        if not post_ids:
+            break
+        post_ids = list(
+            through.objects.filter(tag_id=tag_id, post_id__in=post_ids)
+            .values_list("post_id", flat=True)
+        )
+    return post_ids
+
+
+def get_posts_by_tags_for_user(
+        user: Optional["User"], tag_names: list[str]) -> QuerySet[Post]:
+    """
+    Feed of posts carrying all of the given tags (anti-N+1).
+
+    Instead of one join per tag, the per-tag post-id lists are
+    intersected starting from the rarest tag (by Tag.post_count), and
+    the surviving ids are fed into the standard feed projection.
+
+    Args:
+        user: Current viewer (used for has_liked), or None for the
+            viewer-neutral feed.
+        tag_names: Tag names (case-insensitive), e.g. from parse_tag_path.
+
+    Returns:
+        QuerySet[Post]: Optimized queryset; empty if any tag is unknown.
+    """
+    names = list(dict.fromkeys(name.strip().lower() for name in tag_names))
+    if len(names) == 1:
+        return get_posts_by_tag_for_user(user, names[0])
+
+    tag_ids = get_tag_ids(names)
+    if not names or len(tag_ids) < len(names):
+        return Post.objects.none()
+
+    by_rarity = (
+        Tag.objects.filter(id__in=tag_ids.values())
+        .order_by("post_count", "id")
+        .values_list("id", flat=True)
+    )
+    return _base_feed_qs(viewer=user).filter(
+        id__in=_intersect_tag_posts(list(by_rarity))
+    )
+
+
+def get_tag_post_count(tag_name: str) -> Optional[int]:
+    """
+    Number of posts carrying a tag, read from the denormalized
+    Tag.post_count by primary key (no COUNT over the M2M join).
+
+    Returns:
+        Optional[int]: The count, or None if the tag does not exist.
+    """
+    tag_id = get_tag_id(tag_name)
+    if tag_id is None:
+        return None
+    return (
+        Tag.objects.filter(pk=tag_id)
+        .values_list("post_count", flat=True)
+        .first()
+    )
+
+
+def get_related_tags(
+        tag_name: str, limit: int = RELATED_TAGS_LIMIT) -> List[RelatedTag]:
+    """
+    Tags most often used together with a tag ("people also use ...").
+
+    Reads the precomputed co-occurrence counts through the
+    (tag, -count) index, so the cost doesn't depend on how many posts
+    carry the tag; lists are cached in RELATED_TAGS_CACHE.
+
+    Args:
+        tag_name (str): The tag to find companions for.
+        limit (int): Maximum number of tags.
+
+    Returns:
+        List[RelatedTag]: Tag names and shared post counts,
+        highest count first; empty for unknown tags.
+    """
+    tag_id = get_tag_id(tag_name)
+    if tag_id is None:
+        return []
+
+    def load() -> List[RelatedTag]:
+        rows = (
+            TagCooccurrence.objects.filter(tag_id=tag_id, count__gt=0)
+            .order_by("-count", "related_id")
+            .values_list("related__name", "count")[:limit]
+        )
+        return [{"name": name, "count": count} for name, count in rows]
+
+    return RELATED_TAGS_CACHE.get_or_compute(f"{tag_id}:{limit}", load)
 
 
 def get_posts_by_user(viewed_user: "User", viewer: "User") -> QuerySet[Post]:
@@ -80,3 +342,134 @@ def get_posts_by_user(viewed_user: "User", viewer: "User") -> QuerySet[Post]:
         QuerySet[Post]: Optimized queryset of posts by `viewed_user`.
     """
     return _base_feed_qs(viewer=viewer).filter(author=viewed_user)
+
+
+def encode_cursor(post: Post, direction: str) -> str:
+    """
+    Encode the keyset position of `post` into an opaque URL-safe cursor.
+
+    Args:
+        post: Boundary post of the current page.
+        direction: CURSOR_NEXT (rows after `post`) or CURSOR_PREV (before).
+
+    Returns:
+        str: Base64url-encoded cursor without padding.
+    """
+    payload = json.dumps(
+        [direction, post.created_at.isoformat(), post.pk],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+        cursor: Optional[str]) -> Optional[tuple[str, datetime, int]]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Malformed or tampered cursors are treated as "no cursor" so that
+    a bad link falls back to the first page instead of a server error.
+
+    Returns:
+        tuple | None: (direction, created_at, id) or None if invalid.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        direction, created_at, pk = json.loads(raw)
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            return None
+        if type(pk) is not int or not 0 < pk <= MAX_DB_ID:
+            return None
+        return direction, datetime.fromisoformat(created_at), pk
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError,
+            OverflowError):
+        return None
+
+
+def _keyset_fields(qs: QuerySet[Post]) -> tuple[str, str]:
+    """
+    Names of the (timestamp, id) pair a feed queryset is ordered by,
+    descending. Feeds normally sort on the post's own `created_at, id`;
+    the tag feed and the post card feed sort on equal-valued copies.
+    """
+    order_by = qs.query.order_by
+    if len(order_by) == 2 and all(
+        isinstance(field, str) and field.startswith("-")
+        for field in order_by
+    ):
+        return order_by[0][1:], order_by[1][1:]
+    return "created_at", "id"
+
+
+def paginate_feed(
+        qs: QuerySet[Post],
+        cursor: Optional[str] = None,
+        per_page: int = FEED_PAGE_SIZE) -> FeedPage:
+    """
+    Keyset (cursor) pagination over the `(-created_at, -id)` feed ordering.
+
+    The keyset columns are taken from the queryset's ordering (see
+    `_keyset_fields`), so querysets ordered by denormalized copies of
+    created_at and id, like the tag feed, or by a post card's
+    `created_at, post`, seek on their own index.
+
+    Unlike `Paginator`, this never runs COUNT(*) and never uses OFFSET:
+    each page is a range read that seeks to the cursor position, so the
+    cost is the same on page 1 and page 10 000. One extra row is fetched
+    to detect whether another page exists in the requested direction.
+
+    Args:
+        qs: Feed queryset ordered by `-created_at, -id` or by
+            equal-valued fields (e.g. from `_base_feed_qs`).
+        cursor: Opaque cursor from a previous page, or None for page one.
+        per_page: Page size.
+
+    Returns:
+        FeedPage: Posts in feed order plus next/prev cursors.
+    """
+    decoded = decode_cursor(cursor)
+    time_field, id_field = _keyset_fields(qs)
+
+    if decoded is None:
+        rows = list(qs[:per_page + 1])
+        has_more = len(rows) > per_page
+        posts = rows[:per_page]
+        has_next, has_previous = has_more, False
+    else:
+        direction, created_at, pk = decoded
+        if direction == CURSOR_NEXT:
+            rows = list(
+                qs.filter(
+                    Q(**{f"{time_field}__lt": created_at})
+                    | Q(**{time_field: created_at, f"{id_field}__lt": pk})
+                )[:per_page + 1]
+            )
+            has_more = len(rows) > per_page
+            posts = rows[:per_page]
+            has_next, has_previous = has_more, True
+        else:
+            rows = list(
+                qs.filter(
+                    Q(**{f"{time_field}__gt": created_at})
+                    | Q(**{time_field: created_at, f"{id_field}__gt": pk})
+                ).order_by(time_field, id_field)[:per_page + 1]
+            )
+            has_more = len(rows) > per_page
+            posts = rows[:per_page][::-1]
+            has_next, has_previous = True, has_more
+
+    return {
+        "posts": posts,
+        "next_cursor": (
+            encode_cursor(posts[-1], CURSOR_NEXT)
+            if has_next and posts else None
+        ),
+        "prev_cursor": (
+            encode_cursor(posts[0], CURSOR_PREV)
+            if has_previous and posts else None
+        ),
+        "has_next": has_next and bool(posts),
+        "has_previous": has_previous and bool(posts),
+    }
@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Final, Iterable, Optional
+
+from django.core.cache import cache
+
+from posts.models import Tag
+
+TAG_CACHE_SIZE: Final = 4096
+TAG_CACHE_VERSION_KEY: Final = "posts:tag-cache-version"
+
+# Normalised tag name -> id (None for names known not to exist), most
+# recently used last. Entries belong to `_version`; when the shared
+# version stamp moves on, the whole map is dropped.
+_entries: "OrderedDict[str, Optional[int]]" = OrderedDict()
+_version: Optional[int] = None
+_lock = threading.Lock()
+
+
+def tag_cache_version() -> int:
+    """
+    Current version stamp from the shared cache, initialising it if
+    missing. A time-based seed keeps a reset (eviction, cache flush)
+    from reusing a version some worker still holds.
+    """
+    version = cache.get(TAG_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(TAG_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(TAG_CACHE_VERSION_KEY, 0)
+    return version
+
+
+def _remember(name: str, tag_id: Optional[int]) -> None:
+    _entries[name] = tag_id
+    _entries.move_to_end(name)
+    while len(_entries) > TAG_CACHE_SIZE:
+        _entries.popitem(last=False)
+
+
+def get_tag_ids(names: Iterable[str]) -> dict[str, int]:
+    """
+    Resolve tag names to ids through the in-process LRU cache.
+
+    Names are normalised (stripped, lowercased) first. All misses are
+    looked up in a single query, and names with no Tag row are cached
+    as missing too, so repeated lookups of unknown tags don't query.
+
+    Args:
+        names (Iterable[str]): Tag names.
+
+    Returns:
+        dict[str, int]: Normalised name -> id for the tags that exist.
+    """
+    wanted = list(dict.fromkeys(name.strip().lower() for name in names))
+    version = tag_cache_version()
+    found: dict[str, int] = {}
+    misses = []
+
+    global _version
+    with _lock:
+        if _version != version:
+            _entries.clear()
+            _version = version
+        for name in wanted:
+            if name not in _entries:
+                misses.append(name)
+                continue
+            _entries.move_to_end(name)
+            if _entries[name] is not None:
+                found[name] = _entries[name]
+
+    if misses:
+        loaded = dict(
+            Tag.objects.filter(name__in=misses).values_list("name", "id")
+        )
+        found.update(loaded)
+        with _lock:
+            if _version == version:
+                for name in misses:
+                    _remember(name, loaded.get(name))
+    return found
+
+
+def get_tag_id(name: str) -> Optional[int]:
+    """
+    Resolve a single tag name to its id, or None if no such tag exists.
+    """
+    return get_tag_ids([name]).get(name.strip().lower())
+
+
+def clear_local_tag_cache() -> None:
+    """
+    Drop this process's entries without touching the shared version.
+    """
+    global _version
+    with _lock:
+        _entries.clear()
+        _version = None
+
+
+def invalidate_tag_cache() -> None:
+    """
+    Invalidate the tag cache in every process.
+
+    Bumps the version stamp in the shared Django cache; other workers
+    notice on their next lookup. Cross-process invalidation needs a
+    shared cache backend (e.g. Redis or Memcached) in CACHES.
+    """
+    try:
+        cache.incr(TAG_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.add(TAG_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+    clear_local_tag_cache()
@@ -0,0 +1,103 @@
+import bisect
+import heapq
+import threading
+import time
+from typing import Final, List, NamedTuple, Optional, TypedDict
+
+from posts.models import Tag
+from posts.services.tag_cache import tag_cache_version
+
+AUTOCOMPLETE_LIMIT: Final = 10
+# Popularity counts may lag behind newly tagged posts by this long;
+# new or deleted tags are picked up immediately via the tag cache version.
+TAG_INDEX_TTL: Final = 60.0
+
+
+class TagSuggestion(TypedDict):
+    name: str
+    posts: int
+
+
+class _TagIndex(NamedTuple):
+    version: int
+    built_at: float
+    names: List[str]
+    counts: List[int]
+
+
+_index: Optional[_TagIndex] = None
+_lock = threading.Lock()
+
+
+def _is_fresh(index: Optional[_TagIndex], version: int) -> bool:
+    return (
+        index is not None
+        and index.version == version
+        and time.monotonic() - index.built_at < TAG_INDEX_TTL
+    )
+
+
+def _get_index() -> _TagIndex:
+    """
+    Return the in-process prefix index, rebuilding it (one query) when
+    the tag vocabulary changed or the popularity counts expired.
+    """
+    global _index
+    version = tag_cache_version()
+    index = _index
+    if _is_fresh(index, version):
+        return index
+
+    with _lock:
+        if not _is_fresh(_index, version):
+            rows = sorted(Tag.objects.values_list("name", "post_count"))
+            _index = _TagIndex(
+                version=version,
+                built_at=time.monotonic(),
+                names=[name for name, _ in rows],
+                counts=[count for _, count in rows],
+            )
+        return _index
+
+
+def clear_tag_index() -> None:
+    """
+    Drop the in-process index; the next lookup rebuilds it.
+    """
+    global _index
+    with _lock:
+        _index = None
+
+
+def suggest_tags(
+        prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> List[TagSuggestion]:
+    """
+    Suggest existing tags starting with a prefix, most popular first.
+
+    Tag names are kept in a sorted in-memory list, so the matching range
+    is found with two binary searches and only that range is ranked;
+    no query is made while the index is fresh.
+
+    Args:
+        prefix (str): What the user typed, with or without a leading "#".
+        limit (int): Maximum number of suggestions.
+
+    Returns:
+        List[TagSuggestion]: Names and post counts, ordered by post
+        count (descending) then name.
+    """
+    prefix = prefix.strip().lstrip("#").lower()
+    if not prefix:
+        return []
+
+    index = _get_index()
+    lo = bisect.bisect_left(index.names, prefix)
+    hi = bisect.bisect_left(index.names, prefix + "\U0010ffff", lo)
+    best = heapq.nsmallest(
+        limit,
+        range(lo, hi),
+        key=lambda i: (-index.counts[i], index.names[i]),
+    )
+    return [
+        {"name": index.names[i], "posts": index.counts[i]} for i in best
+    ]
@@ -1,7 +1,19 @@
-import re
-from typing import List
+from typing import List, Optional, TypedDict
 
-from posts.models import Post, Tag
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from posts.models import Post, Tag, TagTimelineEntry
+from posts.services.captions import HASHTAG_RE, parse_caption
+from posts.services.cooccurrence import record_cooccurrence_changes
+from posts.services.post_cards import refresh_post_card
+from posts.services.tag_cache import get_tag_ids, invalidate_tag_cache
+from posts.services.trending import record_tag_changes
+
+
+class TagDiff(TypedDict):
+    added: List[str]
+    removed: List[str]
 
 
 def extract_tag_names(tag_input: str) -> List[str]:
@@ -17,20 +29,163 @@ def extract_tag_names(tag_input: str) -> List[str]:
     Returns:
         List[str]: A list of tag names in lowercase.
     """
-    return [
-        tag.lower() for tag in re.findall(
-            r"#([\wа-яА-ЯёЁїЇіІєЄґҐ]+)",
-            tag_input,
-            flags=re.UNICODE)]
+    return [tag.lower() for tag in HASHTAG_RE.findall(tag_input)]
+
+
+def _adjust_post_counts(tag_ids: List[int], delta: int) -> None:
+    """
+    Add `delta` to Tag.post_count in one UPDATE, never going below zero.
+    """
+    if tag_ids:
+        Tag.objects.filter(id__in=tag_ids).update(
+            post_count=Greatest(F("post_count") + delta, 0)
+        )
+
+
+def apply_post_tag_changes(
+        post: Post,
+        added_ids: List[int],
+        removed_ids: List[int],
+        kept_ids: Optional[List[int]] = None) -> None:
+    """
+    Propagate a post's attached/detached tag ids to the denormalized
+    tag data: the tag timeline, Tag.post_count, the trending buckets
+    and the tag co-occurrence counts.
+
+    Called by tag sync, and by the Post.tags m2m_changed signal for
+    changes made through the related manager (admin, shell).
+
+    Args:
+        post (Post): The post whose tags changed.
+        added_ids (List[int]): Ids of tags attached to the post.
+        removed_ids (List[int]): Ids of tags detached from the post.
+        kept_ids (Optional[List[int]]): Ids of the post's unchanged
+            tags; read from the through table when not given.
+    """
+    if not added_ids and not removed_ids:
+        return
+    if removed_ids:
+        TagTimelineEntry.objects.filter(
+            post_id=post.pk, tag_id__in=removed_ids
+        ).delete()
+    if added_ids:
+        TagTimelineEntry.objects.bulk_create(
+            [
+                TagTimelineEntry(
+                    tag_id=tag_id, post_id=post.pk, created_at=post.created_at
+                )
+                for tag_id in added_ids
+            ],
+            ignore_conflicts=True,
+        )
+    _adjust_post_counts(added_ids, 1)
+    _adjust_post_counts(removed_ids, -1)
+    record_tag_changes(post.created_at, added_ids, removed_ids)
+
+    if kept_ids is None:
+        kept_ids = list(
+            Post.tags.through.objects.filter(post_id=post.pk)
+            .values_list("tag_id", flat=True)
+        )
+    record_cooccurrence_changes(added_ids, removed_ids, kept_ids)
+
+
+def sync_post_tags(post: Post, tag_names: List[str]) -> TagDiff:
+    """
+    Make a post's tags match `tag_names`, touching only what changed.
+
+    The current tags are read once and diffed against the wanted set.
+    Added names are resolved through the tag id cache; tags that don't
+    exist yet are created in one INSERT that ignores conflicts on the
+    unique name constraints (a concurrent request may create the same
+    tag), after which the cache is invalidated. Only the added or
+    removed through-rows are written, so an edit that keeps the same
+    tags costs a single SELECT. The diff is then propagated by
+    `apply_post_tag_changes`.
+
+    Args:
+        post (Post): A saved post.
+        tag_names (List[str]): Normalised (lowercase) tag names.
+
+    Returns:
+        TagDiff: Names of the tags that were attached and detached.
+    """
+    through = Post.tags.through
+    current = dict(
+        through.objects.filter(post_id=post.pk)
+        .values_list("tag__name", "tag_id")
+    )
+    wanted = dict.fromkeys(tag_names)
+    added = [name for name in wanted if name not in current]
+    removed = sorted(name for name in current if name not in wanted)
+
+    removed_ids = [current[name] for name in removed]
+    if removed_ids:
+        through.objects.filter(
+            post_id=post.pk, tag_id__in=removed_ids
+        ).delete()
+
+    tag_ids: dict[str, int] = {}
+    if added:
+        tag_ids = get_tag_ids(added)
+        missing = [name for name in added if name not in tag_ids]
+        if missing:
+            Tag.objects.bulk_create(
+                [Tag(name=name) for name in missing], ignore_conflicts=True
+            )
+            tag_ids.update(
+                Tag.objects.filter(name__in=missing)
+                .values_list("name", "id")
+            )
+            invalidate_tag_cache()
+        through.objects.bulk_create(
+            [through(post_id=post.pk, tag_id=tag_ids[name]) for name in added],
+            ignore_conflicts=True,
+        )
+
+    apply_post_tag_changes(
+        post,
+        [tag_ids[name] for name in added],
+        removed_ids,
+        [tag_id for name, tag_id in current.items() if name in wanted],
+    )
+    return {"added": added, "removed": removed}
+
+
+def update_post_tags(post: Post, caption: str) -> TagDiff:
+    """
+    Update tags for a post based on its caption.
+
+    This ensures tags in the DB match the current state of the post,
+    and stores the parsed caption body and tag list on the post so
+    feed templates don't re-parse the caption on every render. The
+    post's feed card is rewritten afterwards.
+
+    Returns:
+        TagDiff: Tags attached and detached by this update.
+    """
+    parsed = parse_caption(caption)
+    post.caption_body = parsed["body"]
+    post.caption_tags = parsed["tags"]
+    post.save(update_fields=["caption_body", "caption_tags"])
+
+    diff = sync_post_tags(post, parsed["tags"])
+    refresh_post_card(post.pk)
+    return diff
 
 
-def update_post_tags(post: Post, caption: str) -> None:
+def release_post_tags(post: Post) -> None:
     """
-    Clear and update tags for a post based on its caption.
+    Undo a post's contribution to its tags' counters before it is deleted.
 
-    This ensures tags in the DB match the current state of the post.
+    Called from the Post pre_delete signal, so it also covers posts
+    removed by cascades (e.g. when their author is deleted).
     """
-    post.tags.clear()
-    for tag_name in extract_tag_names(caption):
-        tag, _ = Tag.objects.get_or_create(name=tag_name)
-        post.tags.add(tag)
+    tag_ids = list(
+        Post.tags.through.objects.filter(post_id=post.pk)
+        .values_list("tag_id", flat=True)
+    )
+    if tag_ids:
+        _adjust_post_counts(tag_ids, -1)
+        record_tag_changes(post.created_at, [], tag_ids)
+        record_cooccurrence_changes([], tag_ids, [])
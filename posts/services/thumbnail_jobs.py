@@ -0,0 +1,153 @@
+from datetime import timedelta
+from typing import Final
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from posts.models import Image, ThumbnailJob
+from posts.services.image_utils import generate_thumbnail
+from posts.services.post_cards import refresh_post_card
+from posts.services.post_versions import bump_post_versions
+from posts.services.rendition_services import build_renditions
+
+MAX_ATTEMPTS: Final = 5
+BACKOFF_BASE: Final = timedelta(seconds=30)
+BACKOFF_MAX: Final = timedelta(hours=1)
+# A RUNNING job whose lock is older than this is assumed to belong
+# to a crashed worker and becomes claimable again.
+LEASE_TIMEOUT: Final = timedelta(minutes=5)
+
+
+def enqueue_thumbnail(image: Image) -> ThumbnailJob:
+    """
+    Schedule thumbnail generation for an image.
+
+    Re-enqueuing an image (e.g. after its file was replaced) resets the
+    existing job instead of creating a second one.
+
+    Args:
+        image (Image): Saved image whose thumbnail should be (re)built.
+
+    Returns:
+        ThumbnailJob: The pending job.
+    """
+    job, _ = ThumbnailJob.objects.update_or_create(
+        image=image,
+        defaults={
+            "status": ThumbnailJob.Status.PENDING,
+            "attempts": 0,
+            "run_after": timezone.now(),
+            "locked_at": None,
+            "last_error": "",
+        },
+    )
+    return job
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """
+    Exponential retry delay after the given number of failed attempts.
+    """
+    return min(BACKOFF_BASE * (2 ** max(attempts - 1, 0)), BACKOFF_MAX)
+
+
+def claim_due_jobs(limit: int) -> list[ThumbnailJob]:
+    """
+    Atomically claim up to `limit` jobs that are ready to run.
+
+    Each candidate is claimed with a conditional UPDATE that only
+    succeeds if the row is still in the state we read, so several
+    workers can poll the same table without a broker or
+    SELECT ... FOR UPDATE (which SQLite lacks). Jobs whose lease
+    expired after MAX_ATTEMPTS attempts are marked FAILED.
+
+    Args:
+        limit (int): Maximum number of jobs to claim.
+
+    Returns:
+        list[ThumbnailJob]: Jobs now marked RUNNING by this worker.
+    """
+    now = timezone.now()
+    expired = Q(
+        status=ThumbnailJob.Status.RUNNING,
+        locked_at__lt=now - LEASE_TIMEOUT,
+    )
+    # A job whose worker died on every attempt (e.g. OOM-killed while
+    # decoding) never reaches process_job's failure branch; give up on
+    # it here instead of re-leasing it forever.
+    ThumbnailJob.objects.filter(
+        expired, attempts__gte=MAX_ATTEMPTS
+    ).update(
+        status=ThumbnailJob.Status.FAILED,
+        locked_at=None,
+        last_error="Worker lease expired on the last attempt",
+    )
+    due = Q(status=ThumbnailJob.Status.PENDING, run_after__lte=now) | (
+        expired & Q(attempts__lt=MAX_ATTEMPTS)
+    )
+    candidates = list(
+        ThumbnailJob.objects.filter(due)
+        .order_by("run_after", "id")
+        .values_list("id", "status", "locked_at")[:limit]
+    )
+
+    claimed_ids = [
+        job_id
+        for job_id, status, locked_at in candidates
+        if ThumbnailJob.objects.filter(
+            pk=job_id, status=status, locked_at=locked_at
+        ).update(
+            status=ThumbnailJob.Status.RUNNING,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+    ]
+    return list(
+        ThumbnailJob.objects.select_related("image")
+        .filter(pk__in=claimed_ids)
+        .order_by("run_after", "id")
+    )
+
+
+def process_job(job: ThumbnailJob) -> bool:
+    """
+    Generate the thumbnail and renditions for a claimed job
+    and record the outcome.
+
+    Failures are retried with exponential backoff until MAX_ATTEMPTS,
+    after which the job is marked FAILED and the feed keeps showing
+    the original image.
+
+    Args:
+        job (ThumbnailJob): A job returned by `claim_due_jobs`.
+
+    Returns:
+        bool: True if the thumbnail was generated.
+    """
+    image = job.image
+    try:
+        thumb = generate_thumbnail(image.image)
+        image.thumbnail.save(thumb.name, thumb, save=False)
+        image.save(update_fields=["thumbnail"])
+        build_renditions(image)
+    except Exception as exc:
+        exhausted = job.attempts >= MAX_ATTEMPTS
+        ThumbnailJob.objects.filter(pk=job.pk).update(
+            status=(
+                ThumbnailJob.Status.FAILED if exhausted
+                else ThumbnailJob.Status.PENDING
+            ),
+            run_after=timezone.now() + backoff_delay(job.attempts),
+            locked_at=None,
+            last_error=f"{type(exc).__name__}: {exc}",
+        )
+        return False
+
+    ThumbnailJob.objects.filter(pk=job.pk).update(
+        status=ThumbnailJob.Status.DONE,
+        locked_at=None,
+        last_error="",
+    )
+    bump_post_versions([image.post_id])
+    refresh_post_card(image.post_id)
+    return True
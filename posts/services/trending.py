@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Final, List, Optional, Sequence, TypedDict
+
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from core.cache import TieredCache
+from posts.models import TagBucket
+
+# Hourly buckets older than this (rounded down to a day) are rolled up
+# into daily buckets by `compact_tag_buckets`; daily buckets are kept
+# long enough to answer the widest window.
+HOURLY_RETENTION: Final = timedelta(hours=48)
+DAILY_RETENTION: Final = timedelta(days=14)
+
+TRENDING_WINDOWS: Final = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(days=7),
+}
+TRENDING_LIMIT: Final = 10
+TRENDING_CACHE_TTL: Final = 60
+
+# Rendered trending lists, keyed by "<window>:<limit>".
+TRENDING_CACHE: Final = TieredCache(
+    "posts:trending", ttl=TRENDING_CACHE_TTL, stale_ttl=5 * TRENDING_CACHE_TTL
+)
+
+
+class TrendingTag(TypedDict):
+    name: str
+    count: int
+
+
+class CompactionResult(TypedDict):
+    rolled_up: int
+    expired: int
+
+
+def _floor_hour(moment: datetime) -> datetime:
+    return moment.astimezone(dt_timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+
+def _floor_day(moment: datetime) -> datetime:
+    return _floor_hour(moment).replace(hour=0)
+
+
+def _hourly_horizon(now: datetime) -> datetime:
+    return _floor_day(now - HOURLY_RETENTION)
+
+
+def record_tag_changes(
+        created_at: datetime,
+        added_ids: Sequence[int],
+        removed_ids: Sequence[int]) -> None:
+    """
+    Apply a post's tag diff to the bucket covering its creation time.
+
+    Recent posts count into hourly buckets, older ones straight into
+    the daily bucket compaction would have produced. Increments create
+    missing buckets with an INSERT that ignores conflicts, then bump all
+    of them with one `count = count + 1` UPDATE, so concurrent saves
+    never lose an increment.
+
+    Args:
+        created_at (datetime): The post's creation time.
+        added_ids (Sequence[int]): Ids of tags attached to the post.
+        removed_ids (Sequence[int]): Ids of tags detached from the post.
+    """
+    if created_at < _hourly_horizon(timezone.now()):
+        granularity, start = TagBucket.Granularity.DAY, _floor_day(created_at)
+    else:
+        granularity, start = TagBucket.Granularity.HOUR, _floor_hour(
+            created_at
+        )
+    buckets = TagBucket.objects.filter(granularity=granularity, start=start)
+
+    if added_ids:
+        TagBucket.objects.bulk_create(
+            [
+                TagBucket(tag_id=tag_id, granularity=granularity, start=start)
+                for tag_id in added_ids
+            ],
+            ignore_conflicts=True,
+        )
+        buckets.filter(tag_id__in=added_ids).update(count=F("count") + 1)
+
+    if removed_ids:
+        buckets.filter(tag_id__in=removed_ids, count__gt=0).update(
+            count=F("count") - 1
+        )
+
+
+def get_trending_tags(
+        window: str = "day",
+        limit: int = TRENDING_LIMIT,
+        now: Optional[datetime] = None) -> List[TrendingTag]:
+    """
+    Top tags attached to posts created within a recent window.
+
+    Sums the hourly (and, for long windows, daily) buckets overlapping
+    the window, so the cost depends on the number of buckets rather than
+    on the number of posts. Window edges are rounded to whole buckets.
+
+    Args:
+        window (str): One of TRENDING_WINDOWS ("hour", "day", "week").
+        limit (int): Maximum number of tags.
+        now (Optional[datetime]): Reference time (defaults to now).
+
+    Returns:
+        List[TrendingTag]: Tag names and counts, highest count first.
+    """
+    cutoff = (now or timezone.now()) - TRENDING_WINDOWS[window]
+    rows = (
+        TagBucket.objects.filter(
+            Q(
+                granularity=TagBucket.Granularity.HOUR,
+                start__gte=_floor_hour(cutoff),
+            )
+            | Q(
+                granularity=TagBucket.Granularity.DAY,
+                start__gte=_floor_day(cutoff),
+            )
+        )
+        .values("tag__name")
+        .annotate(total=Sum("count"))
+        .filter(total__gt=0)
+        .order_by("-total", "tag__name")[:limit]
+    )
+    return [{"name": row["tag__name"], "count": row["total"]} for row in rows]
+
+
+def compact_tag_buckets(now: Optional[datetime] = None) -> CompactionResult:
+    """
+    Roll old hourly buckets up into daily buckets and expire old days.
+
+    Hourly buckets before the HOURLY_RETENTION horizon are summed per
+    tag and day, added onto any existing daily bucket, and deleted;
+    daily buckets older than DAILY_RETENTION are deleted. Runs in one
+    transaction, so readers never see a day counted twice.
+
+    Args:
+        now (Optional[datetime]): Reference time (defaults to now).
+
+    Returns:
+        CompactionResult: Hourly buckets rolled up, daily buckets expired.
+    """
+    now = now or timezone.now()
+    old_hourly = TagBucket.objects.filter(
+        granularity=TagBucket.Granularity.HOUR,
+        start__lt=_hourly_horizon(now),
+    )
+
+    with transaction.atomic():
+        totals = {
+            (row["tag_id"], row["day"]): row["total"]
+            for row in old_hourly.annotate(
+                day=TruncDay("start", tzinfo=dt_timezone.utc)
+            )
+            .values("tag_id", "day")
+            .annotate(total=Sum("count"))
+        }
+        existing = {
+            (bucket.tag_id, bucket.start): bucket.count
+            for bucket in TagBucket.objects.filter(
+                granularity=TagBucket.Granularity.DAY,
+                start__in={day for _, day in totals},
+                tag_id__in={tag_id for tag_id, _ in totals},
+            )
+        }
+        TagBucket.objects.bulk_create(
+            [
+                TagBucket(
+                    tag_id=tag_id,
+                    granularity=TagBucket.Granularity.DAY,
+                    start=day,
+                    count=existing.get((tag_id, day), 0) + total,
+                )
+                for (tag_id, day), total in totals.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["granularity", "start", "tag"],
+            update_fields=["count"],
+            batch_size=500,
+        )
+        rolled_up, _ = old_hourly.delete()
+        expired, _ = TagBucket.objects.filter(
+            granularity=TagBucket.Granularity.DAY,
+            start__lt=_floor_day(now - DAILY_RETENTION),
+        ).delete()
+
+    return {"rolled_up": rolled_up, "expired": expired}
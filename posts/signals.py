@@ -0,0 +1,99 @@
+from typing import Any
+
+from django.conf import settings
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+
+from posts.models import Post, Tag
+from posts.services.feed_state import bump_feed_generation
+from posts.services.post_cards import refresh_author_cards
+from posts.services.tag_cache import invalidate_tag_cache
+from posts.services.tag_services import (apply_post_tag_changes,
+                                         release_post_tags)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_cache_on_change(sender: type, **kwargs: Any) -> None:
+    """
+    Keep cached tag name -> id mappings in sync with the Tag table.
+    """
+    invalidate_tag_cache()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_shared_feed_pages(sender: type, **kwargs: Any) -> None:
+    """
+    Posts created, edited or deleted change what the shared feed pages
+    show.
+    """
+    bump_feed_generation()
+
+
+@receiver(pre_delete, sender=Post)
+def release_tags_on_post_delete(
+        sender: type, instance: Post, **kwargs: Any) -> None:
+    """
+    Decrement tag counters while the post's through-rows still exist.
+    """
+    release_post_tags(instance)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def apply_manager_tag_changes(
+        sender: type, instance: Post | Tag, action: str, reverse: bool,
+        pk_set: set[int] | None, **kwargs: Any) -> None:
+    """
+    Keep the tag timeline and counters right when tags are changed via
+    the related manager (`post.tags.add(...)`, admin forms) instead of
+    tag sync, which writes through-rows directly and sends no signal.
+    """
+    if action == "pre_clear":
+        if reverse:
+            for post in instance.posts.all():
+                apply_post_tag_changes(post, [], [instance.pk])
+        else:
+            apply_post_tag_changes(
+                instance, [], list(instance.tags.values_list("id", flat=True))
+            )
+        return
+    if action == "pre_remove":
+        # Django sends the ids the caller asked to remove, not the rows
+        # that exist; remember the real ones for post_remove.
+        through = Post.tags.through.objects
+        if reverse:
+            existing = through.filter(tag_id=instance.pk, post_id__in=pk_set)
+            column = "post_id"
+        else:
+            existing = through.filter(post_id=instance.pk, tag_id__in=pk_set)
+            column = "tag_id"
+        instance._removed_tag_links = set(
+            existing.values_list(column, flat=True))
+        return
+    if action == "post_remove":
+        pk_set = instance.__dict__.pop("_removed_tag_links", set())
+    if action not in ("post_add", "post_remove") or not pk_set:
+        return
+
+    added = action == "post_add"
+    if reverse:
+        for post in Post.objects.filter(pk__in=pk_set):
+            ids = [instance.pk]
+            apply_post_tag_changes(
+                post, ids if added else [], [] if added else ids)
+    else:
+        ids = list(pk_set)
+        apply_post_tag_changes(
+            instance, ids if added else [], [] if added else ids)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_cards_on_profile_change(
+        sender: type, instance: Any, **kwargs: Any) -> None:
+    """
+    Copy profile changes (name, username, avatar) onto the author's
+    feed cards.
+    """
+    refresh_author_cards(instance)
@@ -1,9 +1,15 @@
-import re
 from typing import List
 
 from django import template
+from django.conf import settings
 from django.utils.safestring import mark_safe
 
+from posts.models import Post, PostCard
+from posts.services.captions import HASHTAG_RE
+from posts.services.post_cards import build_post_card
+from posts.services.trending import (TRENDING_CACHE, TRENDING_LIMIT,
+                                     get_trending_tags)
+
 register = template.Library()
 
 
@@ -31,11 +37,7 @@ def linkify_hashtags(text: str) -> str:
         url = f'/posts/tag/{tag}/'
         return f'<a href="{url}">#{tag}</a>'
 
-    linked_text = re.sub(
-        r'#([\wа-яА-ЯёЁїЇіІєЄґҐ]+)',
-        replace_tag,
-        text,
-        flags=re.UNICODE)
+    linked_text = HASHTAG_RE.sub(replace_tag, text)
     linked_text = linked_text.replace('\n', '<br>')
     return mark_safe(linked_text)
 
@@ -53,22 +55,26 @@ def split(value: str, delimiter: str = " ") -> List[str]:
 
 @register.filter
 def remove_hashtags(text: str) -> str:
-    """Removes hashtags from a string."""
+    """
+    Removes hashtags from a string.
+    Fallback for posts without a stored `caption_body`.
+    """
     if not text:
         return ""
-    return re.sub(r"#([\wа-яА-ЯёЁїЇіІєЄґҐ]+)", "", text, flags=re.UNICODE)
+    return HASHTAG_RE.sub("", text)
 
 
 @register.filter
 def extract_hashtags(text: str) -> List[str]:
     """
     Returns a list of unique hashtags in the order in which they appear.
+    Fallback for posts without stored `caption_tags`.
     """
     if not text:
         return []
     seen = set()
     tags = []
-    for tag in re.findall(r"#\w+", text):
+    for tag in ("#" + name for name in HASHTAG_RE.findall(text)):
         if tag not in seen:
             seen.add(tag)
             tags.append(tag)
@@ -84,3 +90,56 @@ def remove_trailing_newlines(text: str) -> str:
     if not text:
         return ""
     return text.rstrip("\n\r\t ")
+
+
+@register.filter
+def srcset(image, fmt: str = "jpeg") -> str:
+    """
+    Build a `srcset` value from an image's renditions in one format.
+    Usage: <source type="image/webp" srcset="{{ image|srcset:'webp' }}">
+    Returns "" when the image has no renditions (yet).
+    """
+    return ", ".join(
+        f"{r.file.url} {r.width}w"
+        for r in image.renditions.all()
+        if r.format == fmt
+    )
+
+
+@register.filter
+def display_url(image) -> str:
+    """
+    URL of the widest JPEG rendition not exceeding IMAGE_DISPLAY_WIDTH,
+    used by the modal instead of the (possibly multi-megabyte) original.
+    Falls back to the original when no rendition fits.
+    """
+    best = None
+    for r in image.renditions.all():
+        if r.format == "jpeg" and r.width <= settings.IMAGE_DISPLAY_WIDTH:
+            if best is None or r.width > best.width:
+                best = r
+    return best.file.url if best else image.image.url
+
+
+@register.inclusion_tag("posts/trending_tags.html")
+def trending_tags(window: str = "day", limit: int = TRENDING_LIMIT) -> dict:
+    """
+    Renders the trending tags widget for a window ("hour", "day", "week").
+    The list is shared by all viewers and cached in TRENDING_CACHE for
+    TRENDING_CACHE_TTL seconds.
+    Usage: {% trending_tags "day" %}
+    """
+    tags = TRENDING_CACHE.get_or_compute(
+        f"{window}:{limit}", lambda: get_trending_tags(window, limit)
+    )
+    return {"trending_tags": tags, "window": window}
+
+
+@register.simple_tag
+def post_card_for(post: Post) -> PostCard:
+    """
+    Unsaved PostCard of a feed post, so `posts/post_body.html` renders
+    Posts and stored cards from the same markup.
+    Usage: {% post_card_for post as card %}
+    """
+    return build_post_card(post)
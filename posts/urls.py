@@ -15,6 +15,14 @@ urlpatterns = [
         'tag/<str:tag_name>/',
         views.post_list_by_tag,
         name='post-by-tag'),
+    path(
+        'search/',
+        views.post_search,
+        name='post-search'),
+    path(
+        'tags/autocomplete/',
+        views.tag_autocomplete,
+        name='tag-autocomplete'),
     path(
         'post/<int:pk>/edit/',
         views.PostUpdateView.as_view(),
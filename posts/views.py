@@ -5,30 +5,135 @@ This module handles views related to post operations in ContentFlow.
 It includes:
 - Displaying a feed of posts from other users
 - Creating a post with multiple images and tags
+- Suggesting existing tags while a caption is typed
+- Searching post captions
 """
 
+from typing import Callable, Optional
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.core.paginator import Paginator
+from django.db.models import QuerySet
 from django.forms import modelformset_factory
-from django.http import HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
+from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils.safestring import mark_safe
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
 from django.views.generic import DeleteView
 from django.views.generic.edit import UpdateView
 
+from likes.services.like_services import get_like_states
+from posts.services.feed_prefetch import (schedule_next_page,
+                                          take_prefetched_page)
+from posts.services.feed_state import FEED_PAGES, feed_etag, feed_page_key
 from posts.services.image_services import (handle_images_update,
                                            save_images_to_post)
-from posts.services.selectors import (get_post_feed_for_user,
-                                      get_posts_by_tag_for_user)
+from posts.services.post_cards import post_cards_enabled
+from posts.services.post_versions import bump_post_versions
+from posts.services.selectors import (MAX_FEED_TAGS,
+                                      get_post_cards_for_user,
+                                      get_post_feed_for_user,
+                                      get_posts_by_tags_for_user,
+                                      get_related_tags, get_tag_post_count,
+                                      paginate_feed, parse_tag_path,
+                                      search_posts_for_user)
+from posts.services.tag_index import suggest_tags
 from posts.services.tag_services import update_post_tags
 
-from .forms import ImageForm, PostForm
+from .forms import POST_EDIT_FIELDS, ImageForm, PostForm
 from .models import Image, Post
 
 
+def _render_feed(
+        request: HttpRequest,
+        feed_qs: Callable[..., QuerySet],
+        context: dict,
+        feed_cards: bool = False) -> HttpResponse:
+    """
+    Render a feed page into posts/list.html.
+
+    With FEED_PAGE_CACHE on, the post list (posts and pagination) is
+    rendered once for every viewer from the viewer-neutral feed, with
+    all like buttons unliked, and cached in FEED_PAGES per path, cursor
+    and feed generation (concurrent misses render it once). Each
+    request then only adds its own like states (one query), inlined as
+    JSON and applied by like-toggle.js.
+
+    Otherwise, with FEED_PREFETCH on, the next page is built in the
+    background right after this one is rendered and served from the
+    viewer's prefetch slot if it is requested soon after.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        feed_qs (Callable): Builds the feed queryset for a viewer,
+            or for None (viewer-neutral).
+        context (dict): Extra context for the page header.
+        feed_cards (bool): Whether the queryset yields PostCards.
+
+    Returns:
+        HttpResponse: The rendered page.
+    """
+    cursor = request.GET.get('cursor')
+
+    if not settings.FEED_PAGE_CACHE:
+        page_obj = None
+        if settings.FEED_PREFETCH:
+            page_obj = take_prefetched_page(
+                request.user, request.path, cursor)
+        if page_obj is None:
+            page_obj = paginate_feed(feed_qs(request.user), cursor)
+        response = render(request, 'posts/list.html', {
+            **context,
+            'page_obj': page_obj,
+            'posts': page_obj['posts'],
+            'feed_cards': feed_cards,
+        })
+        if settings.FEED_PREFETCH:
+            schedule_next_page(
+                feed_qs, request.user, request.path,
+                page_obj['next_cursor'])
+        return response
+
+    def render_shared() -> dict:
+        page_obj = paginate_feed(feed_qs(None), cursor)
+        return {
+            'html': render_to_string('posts/feed_posts.html', {
+                **context,
+                'page_obj': page_obj,
+                'posts': page_obj['posts'],
+                'feed_cards': feed_cards,
+            }, request),
+            'post_ids': [post.pk for post in page_obj['posts']],
+        }
+
+    shared = FEED_PAGES.get_or_compute(
+        feed_page_key(request.path, cursor), render_shared)
+
+    return render(request, 'posts/list.html', {
+        **context,
+        'feed_html': mark_safe(shared['html']),
+        'like_states': get_like_states(request.user, shared['post_ids']),
+    })
+
+
+def _feed_etag(
+        request: HttpRequest,
+        *args: object,
+        **kwargs: object) -> Optional[str]:
+    """
+    `condition` validator of the feed and tag pages (see feed_etag).
+    """
+    return feed_etag(request)
+
+
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_feed_etag)
 def post_list_view(request: HttpRequest) -> HttpResponse:
     """
     Feed of latest posts.
@@ -39,16 +144,10 @@ def post_list_view(request: HttpRequest) -> HttpResponse:
     Returns:
         HttpResponse: Rendered template with filtered posts.
     """
-    posts_qs = get_post_feed_for_user(request.user)
-
-    paginator = Paginator(posts_qs, 5)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-
-    return render(request, 'posts/list.html', {
-        'page_obj': page_obj,
-        'posts': page_obj.object_list,
-    })
+    if post_cards_enabled():
+        return _render_feed(
+            request, get_post_cards_for_user, {}, feed_cards=True)
+    return _render_feed(request, get_post_feed_for_user, {})
 
 
 @login_required
@@ -100,23 +199,63 @@ def post_create_view(request: HttpRequest) -> HttpResponse:
 
 
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_feed_etag)
 def post_list_by_tag(request: HttpRequest, tag_name: str) -> HttpResponse:
     """
-    Display posts filtered by tag.
+    Display posts filtered by tag, or by several tags joined with "+"
+    (posts carrying all of them), e.g. /posts/tag/python+django/.
+    More than MAX_FEED_TAGS distinct tags is a 404.
+    """
+    tag_names = parse_tag_path(tag_name)
+    if len(tag_names) > MAX_FEED_TAGS:
+        raise Http404(f"At most {MAX_FEED_TAGS} tags can be combined.")
+    single_tag = len(tag_names) == 1
+
+    def feed_qs(viewer):
+        return get_posts_by_tags_for_user(viewer, tag_names)
+
+    return _render_feed(request, feed_qs, {
+        'filter_tag': tag_name,
+        'filter_tags': tag_names,
+        'filter_tag_count': (
+            get_tag_post_count(tag_names[0]) if single_tag else None
+        ),
+        'related_tags': get_related_tags(tag_names[0]) if single_tag else [],
+    })
+
+
+@login_required
+def post_search(request: HttpRequest) -> HttpResponse:
+    """
+    Display posts whose caption matches the "q" query, newest first.
     """
-    posts_qs = get_posts_by_tag_for_user(request.user, tag_name)
+    query = request.GET.get('q', '').strip()
+    posts_qs = search_posts_for_user(request.user, query)
 
-    paginator = Paginator(posts_qs, 5)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate_feed(posts_qs, request.GET.get('cursor'))
 
     return render(request, 'posts/list.html', {
         'page_obj': page_obj,
-        'posts': page_obj.object_list,
-        'filter_tag': tag_name,
+        'posts': page_obj['posts'],
+        'search_query': query,
     })
 
 
+@login_required
+@require_GET
+def tag_autocomplete(request: HttpRequest) -> JsonResponse:
+    """
+    Suggest existing tags for the hashtag being typed in a caption.
+
+    Contract:
+    - Accepts GET "q", the tag prefix (a leading "#" is ignored).
+    - Returns JSON {"tags": [{"name", "posts"}, ...]}, most used first;
+      an empty prefix yields an empty list.
+    """
+    return JsonResponse({"tags": suggest_tags(request.GET.get('q', ''))})
+
+
 ImageFormSet = modelformset_factory(
     Image,
     form=ImageForm,
@@ -192,9 +331,11 @@ class PostUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
 
         post = form.save(commit=False)
         post.author = request.user
-        post.save()
+        post.save(update_fields=POST_EDIT_FIELDS)
 
         update_post_tags(post, post.caption)
+        if form.has_changed():
+            bump_post_versions([post.pk])
 
         handle_images_update(post, formset)
 
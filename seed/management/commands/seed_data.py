@@ -8,9 +8,9 @@ from django.core.management.base import BaseCommand
 from faker import Faker
 from PIL import Image as PilImage
 
-from posts.models import Image, Post, Tag
+from posts.models import Image, Post
 from posts.services.image_utils import generate_thumbnail
-from posts.services.tag_services import extract_tag_names
+from posts.services.tag_services import update_post_tags
 
 fake = Faker()
 User = get_user_model()
@@ -59,10 +59,7 @@ class Command(BaseCommand):
             caption=fake.sentence() + "\n" + caption_tags
         )
 
-        tag_names = extract_tag_names(post.caption)
-        for tag_name in tag_names:
-            tag, _ = Tag.objects.get_or_create(name=tag_name)
-            post.tags.add(tag)
+        update_post_tags(post, post.caption)
 
         for _ in range(random.randint(1, 3)):
             image = self.generate_fake_image()
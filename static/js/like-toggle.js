@@ -13,7 +13,61 @@ function getCookie(name) {
   return cookieValue;
 }
 
+function renderLikeState(button, liked, likesCount, postId) {
+  let heart = button.querySelector('.heart');
+  let label = button.querySelector('.label');
+  if (!heart || !label) {
+    button.innerHTML = '<span class="heart"></span> <span class="label"></span>';
+    heart = button.querySelector('.heart');
+    label = button.querySelector('.label');
+  }
+  heart.textContent = liked ? '❤️' : '🤍';
+  label.textContent = liked ? 'Unlike' : 'Like';
+  button.classList.toggle('liked', liked);
+  button.dataset.liked = liked.toString();
+
+  const countSpan = document.getElementById(`likes-count-${postId}`);
+  if (countSpan) {
+    countSpan.textContent = `${likesCount} like${likesCount === 1 ? '' : 's'}`;
+  }
+}
+
+function applyLikeStates(states) {
+  states.forEach(state => {
+    const button = document.querySelector(`.like-button[data-post-id="${state.post_id}"]`);
+    if (button) renderLikeState(button, state.liked, state.likes_count, state.post_id);
+  });
+}
+
+async function refreshLikeStates() {
+  const buttons = Array.from(document.querySelectorAll('.like-button'));
+  if (buttons.length === 0) return;
+
+  const ids = buttons.map(button => button.dataset.postId).join(',');
+  try {
+    const response = await fetch(`/likes/ajax/states/?ids=${ids}`, {
+      headers: { 'X-Requested-With': 'XMLHttpRequest' }
+    });
+    if (!response.ok) return;
+
+    const data = await response.json();
+    applyLikeStates(data.posts);
+  } catch (error) {
+    console.error('Error refreshing like states:', error);
+  }
+}
+
+// Pages restored from the back/forward cache show stale hearts and counters.
+window.addEventListener('pageshow', function (event) {
+  if (event.persisted) refreshLikeStates();
+});
+
 document.addEventListener('DOMContentLoaded', function () {
+  // Shared (cached) feed pages render every button unliked and inline
+  // the viewer's like states next to them.
+  const inlineStates = document.getElementById('like-states');
+  if (inlineStates) applyLikeStates(JSON.parse(inlineStates.textContent));
+
   const csrftoken = getCookie('csrftoken');
   document.querySelectorAll('.like-button').forEach(button => {
     button.addEventListener('click', async () => {
@@ -39,11 +93,7 @@ document.addEventListener('DOMContentLoaded', function () {
         if (!response.ok) throw new Error('Network response was not ok');
 
         const data = await response.json();
-        button.innerHTML = data.liked ? '❤️ Unlike' : '🤍 Like';
-        button.dataset.liked = data.liked.toString();
-
-        const countSpan = document.getElementById(`likes-count-${data.post_id}`);
-        countSpan.textContent = `${data.likes_count} like${data.likes_count === 1 ? '' : 's'}`;
+        renderLikeState(button, data.liked, data.likes_count, data.post_id);
       } catch (error) {
         console.error('Error toggling like:', error);
         alert('Something went wrong. Please try again.');
@@ -0,0 +1,95 @@
+// Suggests existing tags while a hashtag is typed into a caption textarea
+// marked with data-tag-autocomplete="<endpoint url>".
+const HASHTAG_AT_CARET = /#([\wа-яА-ЯёЁїЇіІєЄґҐ]+)$/u;
+const SUGGEST_DELAY_MS = 150;
+
+function currentHashtag(textarea) {
+  const beforeCaret = textarea.value.slice(0, textarea.selectionStart);
+  const match = beforeCaret.match(HASHTAG_AT_CARET);
+  if (!match) return null;
+  return { prefix: match[1], start: beforeCaret.length - match[0].length };
+}
+
+function applySuggestion(textarea, name) {
+  const token = currentHashtag(textarea);
+  if (!token) return;
+
+  const caret = textarea.selectionStart;
+  const before = textarea.value.slice(0, token.start);
+  const after = textarea.value.slice(caret);
+  textarea.value = `${before}#${name} ${after}`;
+
+  const newCaret = before.length + name.length + 2;
+  textarea.setSelectionRange(newCaret, newCaret);
+  textarea.focus();
+}
+
+function renderSuggestions(list, textarea, tags) {
+  list.innerHTML = '';
+  tags.forEach(tag => {
+    const item = document.createElement('li');
+    const button = document.createElement('button');
+    button.type = 'button';
+    button.className = 'tag-suggestion';
+    button.dataset.name = tag.name;
+    button.textContent = `#${tag.name} · ${tag.posts}`;
+    button.addEventListener('mousedown', event => {
+      // Keep focus (and the caret position) in the textarea.
+      event.preventDefault();
+      applySuggestion(textarea, tag.name);
+      list.hidden = true;
+    });
+    item.appendChild(button);
+    list.appendChild(item);
+  });
+  list.hidden = tags.length === 0;
+}
+
+function attachTagAutocomplete(textarea) {
+  const url = textarea.dataset.tagAutocomplete;
+  const list = document.createElement('ul');
+  list.className = 'tag-suggestions';
+  list.hidden = true;
+  textarea.insertAdjacentElement('afterend', list);
+
+  let timer = null;
+  let latestPrefix = null;
+
+  textarea.addEventListener('input', () => {
+    clearTimeout(timer);
+    const token = currentHashtag(textarea);
+    if (!token) {
+      list.hidden = true;
+      return;
+    }
+
+    timer = setTimeout(async () => {
+      latestPrefix = token.prefix;
+      try {
+        const response = await fetch(`${url}?q=${encodeURIComponent(token.prefix)}`, {
+          headers: { 'X-Requested-With': 'XMLHttpRequest' }
+        });
+        if (!response.ok) return;
+
+        const data = await response.json();
+        // Ignore answers to prefixes the user has already typed past.
+        if (token.prefix === latestPrefix) {
+          renderSuggestions(list, textarea, data.tags);
+        }
+      } catch (error) {
+        console.error('Error fetching tag suggestions:', error);
+      }
+    }, SUGGEST_DELAY_MS);
+  });
+
+  textarea.addEventListener('keydown', event => {
+    if (event.key === 'Escape') list.hidden = true;
+  });
+  textarea.addEventListener('blur', () => {
+    list.hidden = true;
+  });
+}
+
+document.addEventListener('DOMContentLoaded', function () {
+  document.querySelectorAll('textarea[data-tag-autocomplete]').forEach(attachTagAutocomplete);
+});
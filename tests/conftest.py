@@ -0,0 +1,42 @@
+import io
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image as PilImage
+
+from core.cache import clear_local_caches
+from posts.services.tag_cache import clear_local_tag_cache
+from posts.services.tag_index import clear_tag_index
+
+
+def make_image_upload(
+        name: str = 'photo.jpg',
+        size: tuple[int, int] = (800, 600),
+        color: str = 'red',
+        fmt: str = 'JPEG') -> SimpleUploadedFile:
+    """
+    A solid-colour image as an uploaded file, ready for forms and
+    services that take uploads.
+    """
+    buffer = io.BytesIO()
+    PilImage.new('RGB', size, color=color).save(buffer, fmt)
+    return SimpleUploadedFile(
+        name, buffer.getvalue(), content_type=f'image/{fmt.lower()}')
+
+
+@pytest.fixture(autouse=True)
+def _isolate_tag_cache():
+    # Test transactions roll back Tag rows without sending signals, so
+    # cached ids and the autocomplete index must not leak between tests.
+    # Rolled-back post ids are reused too, so versioned feed fragments
+    # and cached selector results must not survive a test either.
+    clear_local_tag_cache()
+    clear_tag_index()
+    cache.clear()
+    clear_local_caches()
+    yield
+    clear_local_tag_cache()
+    clear_tag_index()
+    cache.clear()
+    clear_local_caches()
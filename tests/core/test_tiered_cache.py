@@ -0,0 +1,112 @@
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from core.cache import TieredCache, cache_metrics, reset_cache_metrics
+
+
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        reset_cache_metrics()
+        self.addCleanup(reset_cache_metrics)
+        self.calls = 0
+
+    def compute(self, value="v"):
+        def inner():
+            self.calls += 1
+            return f"{value}{self.calls}"
+        return inner
+
+    def test_l1_then_l2_then_miss(self) -> None:
+        tiered = TieredCache("test:tiers", ttl=60)
+
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v1")
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v1")
+        tiered.clear_local()
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v1")
+        tiered.invalidate("k")
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v2")
+
+        self.assertEqual(cache_metrics()["test:tiers"], {
+            "misses": 2, "l1_hits": 1, "l2_hits": 1})
+
+    def test_l1_evicts_least_recently_used(self) -> None:
+        tiered = TieredCache("test:lru", ttl=60, l1_size=2)
+        for key in ("a", "b", "a", "c"):
+            tiered.get_or_compute(key, self.compute(key))
+
+        self.assertEqual(list(tiered._l1), ["test:lru:a", "test:lru:c"])
+
+    def test_concurrent_misses_compute_once(self) -> None:
+        tiered = TieredCache("test:flight", ttl=60)
+        release = threading.Event()
+        results = []
+
+        def slow():
+            release.wait(5)
+            self.calls += 1
+            return "page"
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    tiered.get_or_compute("page", slow)))
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, ["page"] * 20)
+        self.assertEqual(self.calls, 1)
+        metrics = cache_metrics()["test:flight"]
+        self.assertEqual(metrics["misses"], 1)
+        self.assertEqual(metrics["coalesced"], 19)
+
+    def test_errors_reach_waiters_and_are_not_cached(self) -> None:
+        tiered = TieredCache("test:errors", ttl=60)
+
+        def boom():
+            raise RuntimeError("db down")
+
+        with self.assertRaises(RuntimeError):
+            tiered.get_or_compute("k", boom)
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v1")
+
+    def test_stale_value_served_while_refreshing(self) -> None:
+        tiered = TieredCache("test:swr", ttl=1, stale_ttl=30)
+        tiered.get_or_compute("k", self.compute())
+        time.sleep(1.1)
+
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v1")
+
+        deadline = time.time() + 5
+        while self.calls < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        while tiered._refreshing and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(tiered.get_or_compute("k", self.compute()), "v2")
+        metrics = cache_metrics()["test:swr"]
+        self.assertEqual(metrics["stale"], 1)
+        self.assertEqual(metrics["refreshes"], 1)
+
+
+class CacheMetricsViewTests(TestCase):
+    def test_staff_only(self) -> None:
+        User = get_user_model()
+        user = User.objects.create_user("u", "u@example.com", "x")
+        self.client.force_login(user)
+        self.assertEqual(
+            self.client.get(reverse("cache-metrics")).status_code, 302)
+
+        user.is_staff = True
+        user.save()
+        response = self.client.get(reverse("cache-metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("families", response.json())
@@ -9,7 +9,9 @@ import '../../static/js/like-toggle.js';
 describe('like-toggle.js', () => {
   beforeEach(() => {
     document.body.innerHTML = `
-      <button class="like-button" data-post-id="1" data-liked="false">🤍 Like</button>
+      <button class="like-button" data-post-id="1" data-liked="false">
+        <span class="heart">🤍</span> <span class="label">Like</span>
+      </button>
       <span id="likes-count-1">0 likes</span>
     `;
 
@@ -42,6 +44,8 @@ describe('like-toggle.js', () => {
 
     expect(fetch).toHaveBeenCalledWith('/likes/ajax/like-toggle/', expect.any(Object));
     expect(button).toHaveTextContent('❤️ Unlike');
+    expect(button).toHaveClass('liked');
+    expect(button.querySelector('.label')).toHaveTextContent('Unlike');
     expect(button.dataset.liked).toBe('true');
     expect(countSpan).toHaveTextContent('5 likes');
   });
@@ -60,4 +64,54 @@ describe('like-toggle.js', () => {
     expect(global.alert).toHaveBeenCalledWith('Something went wrong. Please try again.');
     consoleErrorSpy.mockRestore();
   });
+
+  it('should refresh like states when restored from bfcache', async () => {
+    const button = document.querySelector('.like-button');
+    const countSpan = document.getElementById('likes-count-1');
+
+    fetch.mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ posts: [{ post_id: 1, liked: true, likes_count: 3 }] })
+    });
+
+    const event = new Event('pageshow');
+    event.persisted = true;
+    window.dispatchEvent(event);
+
+    await new Promise(process.nextTick);
+
+    expect(fetch).toHaveBeenCalledWith('/likes/ajax/states/?ids=1', expect.any(Object));
+    expect(button).toHaveTextContent('❤️ Unlike');
+    expect(countSpan).toHaveTextContent('3 likes');
+  });
+
+  it('should apply like states inlined in a shared feed page', () => {
+    document.body.innerHTML = `
+      <button class="like-button" data-post-id="2" data-liked="false">
+        <span class="heart">🤍</span> <span class="label">Like</span>
+      </button>
+      <button class="like-button liked" data-post-id="3" data-liked="true">
+        <span class="heart">❤️</span> <span class="label">Unlike</span>
+      </button>
+      <span id="likes-count-3">4 likes</span>
+      <span id="likes-count-2">0 likes</span>
+      <script id="like-states" type="application/json">[{"post_id": 2, "liked": true, "likes_count": 1}, {"post_id": 3, "liked": false, "likes_count": 3}]</script>
+    `;
+
+    document.dispatchEvent(new Event('DOMContentLoaded'));
+
+    const button = document.querySelector('.like-button[data-post-id="2"]');
+    expect(button).toHaveTextContent('❤️ Unlike');
+    expect(button).toHaveClass('liked');
+    expect(button.querySelector('.heart')).toHaveTextContent('❤️');
+    expect(button.querySelector('.label')).toHaveTextContent('Unlike');
+    expect(button.dataset.liked).toBe('true');
+    expect(document.getElementById('likes-count-2')).toHaveTextContent('1 like');
+
+    const unliked = document.querySelector('.like-button[data-post-id="3"]');
+    expect(unliked).not.toHaveClass('liked');
+    expect(unliked.querySelector('.label')).toHaveTextContent('Like');
+    expect(document.getElementById('likes-count-3')).toHaveTextContent('3 likes');
+    expect(fetch).not.toHaveBeenCalled();
+  });
 });
@@ -0,0 +1,75 @@
+/**
+ * @jest-environment jsdom
+ */
+import '@testing-library/jest-dom';
+import { fireEvent } from '@testing-library/dom';
+
+import '../../static/js/tag-autocomplete.js';
+
+describe('tag-autocomplete.js', () => {
+  let textarea;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    document.body.innerHTML = `
+      <textarea id="id_caption" data-tag-autocomplete="/posts/tags/autocomplete/"></textarea>
+    `;
+    textarea = document.getElementById('id_caption');
+    global.fetch = jest.fn();
+
+    document.dispatchEvent(new Event('DOMContentLoaded'));
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+    jest.resetAllMocks();
+  });
+
+  function type(value) {
+    textarea.value = value;
+    textarea.setSelectionRange(value.length, value.length);
+    fireEvent.input(textarea);
+  }
+
+  it('should fetch and render suggestions for the hashtag at the caret', async () => {
+    fetch.mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ tags: [{ name: 'python', posts: 12 }, { name: 'pytest', posts: 3 }] })
+    });
+
+    type('Hello #py');
+    jest.advanceTimersByTime(200);
+    await Promise.resolve();
+    await Promise.resolve();
+
+    expect(fetch).toHaveBeenCalledWith('/posts/tags/autocomplete/?q=py', expect.any(Object));
+    const items = document.querySelectorAll('.tag-suggestion');
+    expect(items).toHaveLength(2);
+    expect(items[0]).toHaveTextContent('#python · 12');
+    expect(document.querySelector('.tag-suggestions')).toBeVisible();
+  });
+
+  it('should replace the typed hashtag with the chosen suggestion', async () => {
+    fetch.mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ tags: [{ name: 'python', posts: 12 }] })
+    });
+
+    type('Hello #py');
+    jest.advanceTimersByTime(200);
+    await Promise.resolve();
+    await Promise.resolve();
+
+    fireEvent.mouseDown(document.querySelector('.tag-suggestion'));
+
+    expect(textarea.value).toBe('Hello #python ');
+    expect(document.querySelector('.tag-suggestions').hidden).toBe(true);
+  });
+
+  it('should not query outside of a hashtag', () => {
+    type('Hello world');
+    jest.advanceTimersByTime(200);
+
+    expect(fetch).not.toHaveBeenCalled();
+  });
+});
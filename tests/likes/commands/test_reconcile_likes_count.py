@@ -0,0 +1,42 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from likes.models import Like
+from posts.models import Post
+
+User = get_user_model()
+
+
+class ReconcileLikesCountCommandTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        self.fan = User.objects.create_user(
+            username='fan', email='fan@example.com', password='x')
+        self.liked = Post.objects.create(author=self.author, caption='a')
+        self.stale = Post.objects.create(author=self.author, caption='b')
+
+        Like.objects.create(user=self.author, post=self.liked)
+        Like.objects.create(user=self.fan, post=self.liked)
+        Post.objects.filter(pk=self.stale.pk).update(likes_count=7)
+
+    def test_repairs_drift_in_chunks(self):
+        out = StringIO()
+        call_command('reconcile_likes_count', chunk_size=1, stdout=out)
+
+        self.liked.refresh_from_db()
+        self.stale.refresh_from_db()
+        self.assertEqual(self.liked.likes_count, 2)
+        self.assertEqual(self.stale.likes_count, 0)
+        self.assertIn("Repaired 2 counter(s)", out.getvalue())
+
+    def test_dry_run_does_not_write(self):
+        out = StringIO()
+        call_command('reconcile_likes_count', dry_run=True, stdout=out)
+
+        self.stale.refresh_from_db()
+        self.assertEqual(self.stale.likes_count, 7)
+        self.assertIn("Would repair 2 counter(s)", out.getvalue())
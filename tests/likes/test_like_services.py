@@ -0,0 +1,114 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from likes.models import Like
+from likes.services.like_services import (add_like, get_like_states,
+                                         remove_like, toggle_like)
+from posts.models import Post
+
+User = get_user_model()
+
+
+class ToggleLikeCounterTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        self.fan = User.objects.create_user(
+            username='fan', email='fan@example.com', password='x')
+        self.post = Post.objects.create(author=self.author, caption='Post')
+
+    def test_counter_follows_toggles(self):
+        self.assertEqual(
+            toggle_like(user=self.author, post=self.post),
+            {"liked": True, "likes_count": 1})
+        self.assertEqual(
+            toggle_like(user=self.fan, post=self.post),
+            {"liked": True, "likes_count": 2})
+        self.assertEqual(
+            toggle_like(user=self.author, post=self.post),
+            {"liked": False, "likes_count": 1})
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertEqual(Like.objects.filter(post=self.post).count(), 1)
+
+    def test_counter_never_goes_negative(self):
+        Like.objects.create(user=self.fan, post=self.post)
+
+        result = toggle_like(user=self.fan, post=self.post)
+
+        self.assertEqual(result, {"liked": False, "likes_count": 0})
+
+    def test_requires_authenticated_user(self):
+        with self.assertRaises(ValueError):
+            toggle_like(user=None, post=self.post)
+
+
+class IdempotentLikeTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='user', email='user@example.com', password='x')
+        self.post = Post.objects.create(author=self.user, caption='Post')
+
+    def test_add_like_is_idempotent(self):
+        self.assertEqual(
+            add_like(user=self.user, post=self.post),
+            {"liked": True, "likes_count": 1})
+        self.assertEqual(
+            add_like(user=self.user, post=self.post),
+            {"liked": True, "likes_count": 1})
+        self.assertEqual(Like.objects.filter(post=self.post).count(), 1)
+
+    def test_remove_like_is_idempotent(self):
+        add_like(user=self.user, post=self.post)
+
+        self.assertEqual(
+            remove_like(user=self.user, post=self.post),
+            {"liked": False, "likes_count": 0})
+        self.assertEqual(
+            remove_like(user=self.user, post=self.post),
+            {"liked": False, "likes_count": 0})
+        self.assertFalse(Like.objects.filter(post=self.post).exists())
+
+    def test_post_deleted_concurrently_raises_does_not_exist(self):
+        Post.objects.filter(pk=self.post.pk).delete()
+
+        for action in (toggle_like, add_like, remove_like):
+            with self.subTest(action=action.__name__):
+                with self.assertRaises(Post.DoesNotExist):
+                    action(user=self.user, post=self.post)
+        self.assertFalse(Like.objects.exists())
+
+    def test_like_uses_two_statements_without_savepoint(self):
+        with CaptureQueriesContext(connection) as ctx:
+            toggle_like(user=self.user, post=self.post)
+
+        statements = [
+            q["sql"] for q in ctx.captured_queries
+            if "SAVEPOINT" not in q["sql"].upper()
+        ]
+        self.assertEqual(len(statements), 2)
+        self.assertNotIn(
+            "ROLLBACK TO SAVEPOINT",
+            " ".join(q["sql"].upper() for q in ctx.captured_queries))
+
+
+class GetLikeStatesTests(TestCase):
+    def test_single_query_for_many_posts(self):
+        user = User.objects.create_user(
+            username='user', email='user@example.com', password='x')
+        posts = [
+            Post.objects.create(author=user, caption=str(i))
+            for i in range(20)
+        ]
+        add_like(user=user, post=posts[3])
+
+        with CaptureQueriesContext(connection) as ctx:
+            states = get_like_states(user, [p.id for p in posts])
+
+        self.assertEqual(len(ctx), 1)
+        self.assertEqual(len(states), 20)
+        self.assertEqual(
+            [s["post_id"] for s in states if s["liked"]], [posts[3].id])
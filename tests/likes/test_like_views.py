@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.urls import reverse
@@ -95,3 +97,101 @@ class LikeToggleTests(TestCase):
 
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json()['error'], 'Invalid request type')
+
+
+class LikeUnlikeEndpointTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='likeuser',
+            email='likeuser@example.com',
+            password='strongpassword987',
+            is_active=True
+        )
+        self.post = Post.objects.create(
+            author=self.user,
+            caption='Post for like testing'
+        )
+        self.client.login(email='likeuser@example.com',
+                          password='strongpassword987')
+
+    def post_ajax(self, name):
+        return self.client.post(
+            reverse(name),
+            {'post_id': self.post.id},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+    def test_retried_like_keeps_post_liked(self):
+        for _ in range(2):
+            response = self.post_ajax('like-ajax')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), {
+                'liked': True, 'likes_count': 1, 'post_id': self.post.id})
+
+    def test_retried_unlike_keeps_post_unliked(self):
+        self.post_ajax('like-ajax')
+        for _ in range(2):
+            response = self.post_ajax('unlike-ajax')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), {
+                'liked': False, 'likes_count': 0, 'post_id': self.post.id})
+
+    def test_post_deleted_while_liking_is_not_found(self):
+        # The post is loaded, then deleted before the like commits.
+        Post.objects.filter(pk=self.post.pk).delete()
+        with mock.patch('likes.views.get_object_or_404',
+                        return_value=self.post):
+            for name in ('like-toggle-ajax', 'like-ajax', 'unlike-ajax'):
+                with self.subTest(name=name):
+                    response = self.post_ajax(name)
+                    self.assertEqual(response.status_code, 404)
+        self.assertFalse(Like.objects.exists())
+
+
+class LikeStatesEndpointTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='likeuser',
+            email='likeuser@example.com',
+            password='strongpassword987',
+            is_active=True
+        )
+        self.liked = Post.objects.create(author=self.user, caption='a')
+        self.other = Post.objects.create(author=self.user, caption='b')
+        self.client.login(email='likeuser@example.com',
+                          password='strongpassword987')
+        self.client.post(
+            reverse('like-ajax'),
+            {'post_id': self.liked.id},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+    def get_states(self, ids):
+        return self.client.get(
+            reverse('like-states-ajax'),
+            {'ids': ids},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+    def test_returns_states_in_request_order(self):
+        response = self.get_states(
+            f'{self.other.id},{self.liked.id},999999')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['posts'], [
+            {'post_id': self.other.id, 'liked': False, 'likes_count': 0},
+            {'post_id': self.liked.id, 'liked': True, 'likes_count': 1},
+        ])
+
+    def test_rejects_invalid_ids(self):
+        for ids in ('1,abc', '1,0', '-3', str(2**63), '1' + '0' * 30):
+            with self.subTest(ids=ids):
+                response = self.get_states(ids)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.json()['error'],
+                    'ids must be comma-separated integers')
+
+    def test_rejects_too_many_ids(self):
+        response = self.get_states(','.join(str(i) for i in range(101)))
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,27 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from posts.models import Tag, TagBucket
+
+
+class CompactTagBucketsCommandTests(TestCase):
+    def test_rolls_up_old_hourly_buckets(self):
+        tag = Tag.objects.create(name='python')
+        old = (timezone.now() - timedelta(days=5)).replace(
+            minute=0, second=0, microsecond=0)
+        for hour in range(3):
+            TagBucket.objects.create(
+                tag=tag, granularity=TagBucket.Granularity.HOUR,
+                start=old.replace(hour=hour), count=2)
+
+        out = StringIO()
+        call_command('compact_tag_buckets', stdout=out)
+
+        bucket = TagBucket.objects.get()
+        self.assertEqual(bucket.granularity, TagBucket.Granularity.DAY)
+        self.assertEqual(bucket.count, 6)
+        self.assertIn('Rolled up 3 hourly bucket(s)', out.getvalue())
@@ -0,0 +1,41 @@
+import io
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from PIL import Image as PilImage
+
+from posts.models import Image, Post, ThumbnailJob
+from posts.services.thumbnail_jobs import enqueue_thumbnail
+
+User = get_user_model()
+
+
+class ProcessThumbnailJobsCommandTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        post = Post.objects.create(author=user, caption='Post')
+        for i in range(3):
+            buffer = io.BytesIO()
+            PilImage.new('RGB', (400, 400), color='red').save(
+                buffer, 'JPEG')
+            image = Image.objects.create(
+                post=post,
+                image=SimpleUploadedFile(f'p{i}.jpg', buffer.getvalue()))
+            enqueue_thumbnail(image)
+
+    def test_once_drains_queue(self):
+        out = StringIO()
+        call_command(
+            'process_thumbnail_jobs', once=True, concurrency=1,
+            batch_size=2, stdout=out)
+
+        self.assertFalse(
+            ThumbnailJob.objects.exclude(
+                status=ThumbnailJob.Status.DONE).exists())
+        for image in Image.objects.all():
+            self.assertTrue(image.thumbnail)
+        self.assertIn("Thumbnails generated: 3", out.getvalue())
@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from posts.management.commands.prune_unused_tags import Command
+from posts.models import Post, Tag, TagBucket
+from posts.services.tag_cache import get_tag_ids
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+class PruneUnusedTagsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        post = Post.objects.create(author=self.user, caption='#kept')
+        update_post_tags(post, post.caption)
+        Tag.objects.bulk_create(Tag(name=f'unused{i}') for i in range(5))
+        # Drifted counter: must not delete a tag that is still in use.
+        Tag.objects.filter(name='kept').update(post_count=0)
+
+    def test_deletes_unused_tags_in_chunks(self):
+        out = StringIO()
+        call_command('prune_unused_tags', chunk_size=2, stdout=out)
+
+        self.assertEqual(
+            list(Tag.objects.values_list('name', flat=True)), ['kept'])
+        self.assertIn('Deleted 5 unused tag(s).', out.getvalue())
+
+    def test_dry_run_deletes_nothing(self):
+        out = StringIO()
+        call_command('prune_unused_tags', dry_run=True, stdout=out)
+
+        self.assertEqual(Tag.objects.count(), 6)
+        self.assertIn('Would delete 5 unused tag(s).', out.getvalue())
+
+    def test_tag_used_after_the_chunk_was_read_is_kept(self):
+        kept = Tag.objects.get(name='kept')
+        unused = Tag.objects.get(name='unused0')
+        TagBucket.objects.create(
+            tag=unused, granularity=TagBucket.Granularity.HOUR,
+            start=timezone.now(), count=0)
+
+        # `kept` is in the chunk as if it had been read while unused.
+        self.assertEqual(Command()._delete_chunk([kept.pk, unused.pk]), 1)
+
+        self.assertTrue(Post.tags.through.objects.filter(tag=kept).exists())
+        self.assertFalse(Tag.objects.filter(pk=unused.pk).exists())
+        self.assertFalse(TagBucket.objects.filter(tag_id=unused.pk).exists())
+
+    def test_pruned_tags_are_evicted_from_the_tag_cache(self):
+        self.assertIn('unused0', get_tag_ids(['unused0']))
+
+        call_command('prune_unused_tags', stdout=StringIO())
+
+        self.assertEqual(get_tag_ids(['unused0']), {})
+        post = Post.objects.create(author=self.user, caption='#unused0')
+        update_post_tags(post, post.caption)
+        self.assertEqual(
+            list(post.tags.values_list('name', flat=True)), ['unused0'])
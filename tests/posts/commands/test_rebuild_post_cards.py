@@ -0,0 +1,27 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from posts.models import Post, PostCard
+
+User = get_user_model()
+
+
+class RebuildPostCardsCommandTests(TestCase):
+    def test_writes_a_card_per_post(self):
+        user = User.objects.create_user('u', 'u@example.com', 'x')
+        Post.objects.create(author=user, caption='Legacy #python')
+        Post.objects.create(
+            author=user, caption='Parsed', caption_body='Parsed',
+            caption_tags=[])
+
+        out = StringIO()
+        call_command('rebuild_post_cards', '--chunk-size', '1', stdout=out)
+
+        cards = {c.caption: c for c in PostCard.objects.all()}
+        self.assertEqual(cards['Legacy #python'].caption_html, 'Legacy')
+        self.assertEqual(cards['Legacy #python'].tags, ['python'])
+        self.assertEqual(cards['Parsed'].author_username, 'u')
+        self.assertIn('Wrote 2 post card(s).', out.getvalue())
@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from posts.models import Post, Tag, TagCooccurrence
+
+User = get_user_model()
+
+
+class RebuildTagCooccurrenceCommandTests(TestCase):
+    def test_recomputes_counts_from_through_table(self):
+        user = User.objects.create_user('u', 'u@example.com', 'x')
+        python, django = (
+            Tag.objects.create(name='python'),
+            Tag.objects.create(name='django'),
+        )
+        Post.tags.through.objects.bulk_create([
+            Post.tags.through(post_id=post.pk, tag_id=tag.pk)
+            for post in (
+                Post.objects.create(author=user, caption='a'),
+                Post.objects.create(author=user, caption='b'),
+            )
+            for tag in (python, django)
+        ])
+        TagCooccurrence.objects.create(tag=python, related=django, count=9)
+
+        out = StringIO()
+        call_command('rebuild_tag_cooccurrence', stdout=out)
+
+        self.assertEqual(
+            sorted(TagCooccurrence.objects.values_list(
+                'tag__name', 'related__name', 'count')),
+            [('django', 'python', 2), ('python', 'django', 2)],
+        )
+        self.assertIn('Rebuilt 2 tag co-occurrence row(s).', out.getvalue())
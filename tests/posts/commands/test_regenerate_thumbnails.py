@@ -0,0 +1,89 @@
+import io
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from PIL import Image as PilImage
+
+from posts.models import Image, Post
+
+User = get_user_model()
+
+
+class RegenerateThumbnailsCommandTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        post = Post.objects.create(author=user, caption='Post')
+        self.images = []
+        for i in range(3):
+            buffer = io.BytesIO()
+            PilImage.new('RGB', (500, 500), color='red').save(buffer, 'JPEG')
+            self.images.append(Image.objects.create(
+                post=post,
+                image=SimpleUploadedFile(f'regen{i}.jpg', buffer.getvalue())))
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.checkpoint = Path(tmp.name) / 'progress.json'
+
+    def run_command(self, **options):
+        out = StringIO()
+        call_command(
+            'regenerate_thumbnails', checkpoint=str(self.checkpoint),
+            concurrency=1, chunk_size=2, stdout=out, stderr=StringIO(),
+            **options)
+        return out.getvalue()
+
+    def test_rebuilds_all_and_checkpoints(self):
+        output = self.run_command()
+
+        for image in Image.objects.all():
+            self.assertTrue(image.thumbnail.name.startswith(
+                'posts/thumbnails/thumb_regen'))
+        self.assertIn("Rebuilt 3 thumbnail(s)", output)
+        self.assertEqual(
+            json.loads(self.checkpoint.read_text()),
+            {'last_id': self.images[-1].id})
+
+    def test_resume_skips_completed_ids(self):
+        self.checkpoint.write_text(
+            json.dumps({'last_id': self.images[1].id}))
+
+        output = self.run_command(resume=True)
+
+        self.assertIn("Rebuilt 1 thumbnail(s)", output)
+        self.assertFalse(Image.objects.get(pk=self.images[0].pk).thumbnail)
+        self.assertTrue(Image.objects.get(pk=self.images[2].pk).thumbnail)
+
+    def test_missing_only_and_since_id(self):
+        output = self.run_command(
+            missing_only=True, since_id=self.images[0].id)
+        self.assertIn("Rebuilt 2 thumbnail(s)", output)
+
+        output = self.run_command(missing_only=True)
+        self.assertIn("Rebuilt 1 thumbnail(s)", output)
+
+    def test_replaced_thumbnails_are_deleted_unless_shared(self):
+        self.run_command()
+        first, second, third = Image.objects.order_by('id')
+        storage = second.thumbnail.storage
+        # Content-addressed twins share one thumbnail file.
+        Image.objects.filter(pk=first.pk).update(
+            thumbnail=third.thumbnail.name)
+        version = Post.objects.get(pk=second.post_id).version
+
+        self.run_command(since_id=first.id)
+
+        self.assertFalse(storage.exists(second.thumbnail.name))
+        self.assertTrue(storage.exists(third.thumbnail.name))
+        self.assertNotEqual(
+            Image.objects.get(pk=third.pk).thumbnail.name,
+            third.thumbnail.name)
+        self.assertGreater(
+            Post.objects.get(pk=second.post_id).version, version)
@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 
 from posts.models import Post, Image, Tag
 from likes.models import Like
+from likes.services.like_services import toggle_like
 from posts.services.selectors import get_post_feed_for_user
 
 User = get_user_model()
@@ -26,9 +27,9 @@ class FeedCorrectnessTests(TestCase):
         self.p1.tags.add(self.t_python, self.t_django)
         self.p2.tags.add(self.t_django)
 
-        Like.objects.create(user=self.author, post=self.p0)
-        Like.objects.create(user=self.viewer, post=self.p1)
-        Like.objects.create(user=self.author, post=self.p1)
+        toggle_like(user=self.author, post=self.p0)
+        toggle_like(user=self.viewer, post=self.p1)
+        toggle_like(user=self.author, post=self.p1)
 
     def test_likes_annotations_and_ordering(self) -> None:
         qs = list(get_post_feed_for_user(self.viewer)[:10])
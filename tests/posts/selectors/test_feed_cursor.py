@@ -0,0 +1,97 @@
+import base64
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from posts.models import Post
+from posts.services.selectors import (decode_cursor, get_post_feed_for_user,
+                                      paginate_feed)
+
+User = get_user_model()
+
+
+class FeedCursorPaginationTests(TestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user("author", "a@example.com", "x")
+        self.viewer = User.objects.create_user("viewer", "v@example.com", "x")
+        self.posts = [
+            Post.objects.create(author=self.author, caption=f"p{i}")
+            for i in range(7)
+        ]
+        # Identical timestamps must still be paginated deterministically.
+        Post.objects.filter(
+            id__in=[p.id for p in self.posts[2:5]]
+        ).update(created_at=self.posts[2].created_at)
+
+    def captions(self, page) -> list[str]:
+        return [p.caption for p in page["posts"]]
+
+    def test_walk_forward_and_back(self) -> None:
+        qs = get_post_feed_for_user(self.viewer)
+
+        first = paginate_feed(qs, per_page=3)
+        self.assertEqual(self.captions(first), ["p6", "p5", "p4"])
+        self.assertTrue(first["has_next"])
+        self.assertFalse(first["has_previous"])
+        self.assertIsNone(first["prev_cursor"])
+
+        second = paginate_feed(qs, first["next_cursor"], per_page=3)
+        self.assertEqual(self.captions(second), ["p3", "p2", "p1"])
+        self.assertTrue(second["has_next"])
+        self.assertTrue(second["has_previous"])
+
+        third = paginate_feed(qs, second["next_cursor"], per_page=3)
+        self.assertEqual(self.captions(third), ["p0"])
+        self.assertFalse(third["has_next"])
+        self.assertIsNone(third["next_cursor"])
+
+        back = paginate_feed(qs, third["prev_cursor"], per_page=3)
+        self.assertEqual(self.captions(back), ["p3", "p2", "p1"])
+
+        back = paginate_feed(qs, back["prev_cursor"], per_page=3)
+        self.assertEqual(self.captions(back), ["p6", "p5", "p4"])
+        self.assertFalse(back["has_previous"])
+
+    def test_no_count_query(self) -> None:
+        qs = get_post_feed_for_user(self.viewer)
+        first = paginate_feed(qs, per_page=3)
+
+        with CaptureQueriesContext(connection) as ctx:
+            paginate_feed(qs, first["next_cursor"], per_page=3)
+
+        sql = " ".join(q["sql"].upper() for q in ctx.captured_queries)
+        self.assertNotIn("COUNT(*)", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_invalid_cursor_falls_back_to_first_page(self) -> None:
+        self.assertIsNone(decode_cursor("not-a-cursor"))
+        page = paginate_feed(
+            get_post_feed_for_user(self.viewer), "bm90LWpzb24", per_page=3)
+        self.assertEqual(self.captions(page), ["p6", "p5", "p4"])
+
+    def test_out_of_range_cursor_ids_fall_back_to_first_page(self) -> None:
+        created_at = Post.objects.first().created_at.isoformat()
+        for pk in ("1e999", 1e999, 10**30, -1, True, "5"):
+            with self.subTest(pk=pk):
+                cursor = base64.urlsafe_b64encode(
+                    json.dumps(["n", created_at, pk]).encode()).decode()
+                self.assertIsNone(decode_cursor(cursor))
+                page = paginate_feed(
+                    get_post_feed_for_user(self.viewer), cursor, per_page=3)
+                self.assertEqual(self.captions(page), ["p6", "p5", "p4"])
+
+    def test_feed_view_links_next_cursor(self) -> None:
+        self.client.force_login(self.viewer)
+        response = self.client.get(reverse('post-list'))
+        next_cursor = response.context['page_obj']['next_cursor']
+        self.assertContains(response, f'?cursor={next_cursor}')
+
+        response = self.client.get(
+            reverse('post-list'), {'cursor': next_cursor})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "p1")
+        self.assertNotContains(response, "p6")
@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from posts.models import Post
+from posts.services.selectors import (get_posts_by_tags_for_user,
+                                      paginate_feed, parse_tag_path)
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+class MultiTagFeedTests(TestCase):
+    def setUp(self) -> None:
+        self.viewer = User.objects.create_user("v", "v@example.com", "x")
+        self.posts = {}
+        for caption in ["#python #django one", "#python two",
+                        "#django three", "#python #django #rare four",
+                        "#python #rare five"]:
+            post = Post.objects.create(author=self.viewer, caption=caption)
+            update_post_tags(post, caption)
+            self.posts[caption.split()[-1]] = post
+
+    def captions(self, *names: str) -> list[str]:
+        qs = get_posts_by_tags_for_user(self.viewer, list(names))
+        return [p.caption.split()[-1] for p in qs]
+
+    def test_parse_tag_path(self) -> None:
+        self.assertEqual(
+            parse_tag_path("Python+django++python+"), ["python", "django"])
+        self.assertEqual(
+            parse_tag_path("a+b+c+d+e"), ["a", "b", "c", "d", "e"])
+
+    def test_too_many_tags_is_not_found(self) -> None:
+        self.client.force_login(self.viewer)
+        url = reverse('post-by-tag', args=['a+b+c+d+e'])
+        self.assertEqual(self.client.get(url).status_code, 404)
+        url = reverse('post-by-tag', args=['a+b+c+d+a'])
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_intersection(self) -> None:
+        self.assertEqual(self.captions("python", "django"), ["four", "one"])
+        self.assertEqual(self.captions("django", "rare", "python"), ["four"])
+        self.assertEqual(self.captions("python"),
+                         ["five", "four", "two", "one"])
+
+    def test_unknown_tag_is_empty(self) -> None:
+        self.assertEqual(self.captions("python", "missing"), [])
+
+    def test_starts_from_rarest_tag(self) -> None:
+        get_posts_by_tags_for_user(self.viewer, ["python", "rare"])
+
+        with self.assertNumQueries(3) as ctx:
+            # rarity order, rarest posting list, one probe for "python"
+            qs = get_posts_by_tags_for_user(self.viewer, ["python", "rare"])
+        rarest = ctx.captured_queries[1]["sql"]
+        rare_id = self.posts["five"].tags.get(name="rare").id
+        self.assertIn(f'"tag_id" = {rare_id}', rarest)
+        self.assertEqual([p.caption.split()[-1] for p in qs],
+                         ["five", "four"])
+
+    def test_large_posting_lists_use_semi_joins(self) -> None:
+        with mock.patch("posts.services.selectors.INTERSECT_MAX_IDS", 1):
+            self.assertEqual(
+                self.captions("python", "django"), ["four", "one"])
+
+    def test_view_accepts_plus_separated_tags(self) -> None:
+        self.client.force_login(self.viewer)
+        response = self.client.get(
+            reverse("post-by-tag", args=["python+django"]))
+
+        self.assertContains(response, "#python + #django")
+        self.assertEqual(
+            [p.id for p in response.context["posts"]],
+            [self.posts["four"].id, self.posts["one"].id])
+        page = paginate_feed(
+            get_posts_by_tags_for_user(self.viewer, ["python", "django"]),
+            per_page=1)
+        self.assertTrue(page["has_next"])
@@ -0,0 +1,72 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from posts.models import Post
+from posts.services.search import search_terms
+from posts.services.selectors import paginate_feed, search_posts_for_user
+
+User = get_user_model()
+
+
+class CaptionSearchTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            "author", "a@example.com", "x", is_staff=True, is_superuser=True)
+        self.sunset = Post.objects.create(
+            author=self.user, caption="Sunset over the Lake #travel")
+        self.lake = Post.objects.create(
+            author=self.user, caption="Морське озеро, lake trip")
+        self.code = Post.objects.create(
+            author=self.user, caption="Refactoring Django views")
+
+    def captions(self, query: str) -> list[str]:
+        return [
+            p.caption for p in search_posts_for_user(self.user, query)]
+
+    def test_terms_are_sanitised(self) -> None:
+        self.assertEqual(
+            search_terms('#Lake "OR" lake* NEAR('), ["lake", "or", "near"])
+
+    def test_matches_all_terms_with_prefix(self) -> None:
+        self.assertEqual(
+            self.captions("lake"),
+            [self.lake.caption, self.sunset.caption])
+        self.assertEqual(self.captions("sunset la"), [self.sunset.caption])
+        self.assertEqual(self.captions("refact"), [self.code.caption])
+        self.assertEqual(self.captions("озер"), [self.lake.caption])
+        self.assertEqual(self.captions("#travel"), [self.sunset.caption])
+
+    def test_empty_query_matches_nothing(self) -> None:
+        self.assertEqual(self.captions("  !! "), [])
+
+    def test_index_follows_edits_and_deletes(self) -> None:
+        self.code.caption = "Sunny weekend"
+        self.code.save()
+        self.sunset.delete()
+
+        self.assertEqual(self.captions("refactoring"), [])
+        self.assertEqual(self.captions("sun"), [self.code.caption])
+
+    def test_search_view_pages_with_query_in_links(self) -> None:
+        for i in range(6):
+            Post.objects.create(author=self.user, caption=f"lake day {i}")
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("post-search"), {"q": "lake"})
+
+        self.assertEqual(response.status_code, 200)
+        next_cursor = response.context["page_obj"]["next_cursor"]
+        self.assertContains(response, f"?cursor={next_cursor}&amp;q=lake")
+        page = paginate_feed(
+            search_posts_for_user(self.user, "lake"), next_cursor)
+        self.assertEqual(len(page["posts"]), 3)
+
+    def test_admin_search_uses_index(self) -> None:
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse("admin:posts_post_changelist"), {"q": "refactoring"})
+
+        self.assertContains(response, "Refactoring Django views")
+        self.assertNotContains(response, "Sunset over the Lake")
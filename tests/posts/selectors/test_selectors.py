@@ -1,6 +1,6 @@
 from django.test import TestCase
 
-from likes.models import Like
+from likes.services.like_services import toggle_like
 from posts.models import Post, Tag
 from posts.services.selectors import (get_post_feed_for_user,
                                       get_posts_by_tag_for_user,
@@ -17,7 +17,7 @@ class GetPostFeedForUserTests(TestCase):
         self.post2 = Post.objects.create(
             author=self.other_user, caption="Post 2")
 
-        Like.objects.create(user=self.user, post=self.post1)
+        toggle_like(user=self.user, post=self.post1)
 
     def create_user(self, email):
         from django.contrib.auth import get_user_model
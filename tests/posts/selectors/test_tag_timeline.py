@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from posts.models import Post, Tag, TagTimelineEntry
+from posts.services.selectors import get_posts_by_tag_for_user, paginate_feed
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+class TagTimelineFeedTests(TestCase):
+    def setUp(self) -> None:
+        self.viewer = User.objects.create_user("v", "v@example.com", "x")
+        base = timezone.now()
+        self.posts = []
+        for i in range(7):
+            post = Post.objects.create(
+                author=self.viewer, caption=f"p{i} #python #django")
+            created_at = base - timedelta(minutes=10 - i)
+            if i in (3, 4):
+                # Identical timestamps must still page deterministically.
+                created_at = base
+            Post.objects.filter(pk=post.pk).update(created_at=created_at)
+            post.refresh_from_db()
+            update_post_tags(post, post.caption)
+            self.posts.append(post)
+
+    def captions(self, page) -> list[str]:
+        return [p.caption.split()[0] for p in page["posts"]]
+
+    def test_reads_tag_feed_from_timeline_in_feed_order(self) -> None:
+        qs = get_posts_by_tag_for_user(self.viewer, "python")
+        sql = str(qs.query)
+
+        self.assertIn('"posts_tagtimelineentry"', sql)
+        self.assertNotIn('"posts_post_tags"', sql)
+        expected = [
+            p.caption.split()[0] for p in
+            Post.objects.order_by("-created_at", "-id")]
+        self.assertEqual([p.caption.split()[0] for p in qs], expected)
+
+    def test_cursor_pages_seek_on_timeline_columns(self) -> None:
+        qs = get_posts_by_tag_for_user(self.viewer, "django")
+
+        first = paginate_feed(qs, per_page=3)
+        second = paginate_feed(qs, first["next_cursor"], per_page=3)
+        third = paginate_feed(qs, second["next_cursor"], per_page=3)
+        back = paginate_feed(qs, third["prev_cursor"], per_page=3)
+
+        walked = self.captions(first) + self.captions(second) + \
+            self.captions(third)
+        self.assertEqual(walked, ["p4", "p3", "p6", "p5", "p2", "p1", "p0"])
+        self.assertEqual(self.captions(back), self.captions(second))
+        self.assertFalse(third["has_next"])
+
+    def test_timeline_follows_tag_changes(self) -> None:
+        post = self.posts[0]
+        update_post_tags(post, "p0 #python")
+        self.assertFalse(TagTimelineEntry.objects.filter(
+            post=post, tag__name="django").exists())
+
+        extra = Tag.objects.create(name="extra")
+        post.tags.add(extra)
+        entry = TagTimelineEntry.objects.get(post=post, tag=extra)
+        self.assertEqual(entry.created_at, post.created_at)
+
+        post.tags.clear()
+        self.assertFalse(TagTimelineEntry.objects.filter(post=post).exists())
+        extra.refresh_from_db()
+        self.assertEqual(extra.post_count, 0)
+
+    def test_removing_absent_tag_changes_nothing(self) -> None:
+        tag = Tag.objects.create(name="solo")
+        self.posts[0].tags.add(tag)
+
+        self.posts[1].tags.remove(tag)
+        tag.posts.remove(self.posts[2])
+
+        tag.refresh_from_db()
+        self.assertEqual(tag.post_count, 1)
+        self.assertTrue(TagTimelineEntry.objects.filter(
+            post=self.posts[0], tag=tag).exists())
@@ -0,0 +1,78 @@
+import hashlib
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from conftest import make_image_upload
+from posts.models import Image, ImageRendition, Post
+from posts.services.image_services import save_images_to_post
+
+User = get_user_model()
+
+
+@override_settings(MEDIA_CONTENT_ADDRESSED=True,
+                   IMAGE_RENDITION_WIDTHS=(320,),
+                   IMAGE_RENDITION_FORMATS=("jpeg",))
+class ContentAddressedMediaTests(TestCase):
+    def setUp(self) -> None:
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = self.settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        author = User.objects.create_user("author", "a@example.com", "x")
+        self.post = Post.objects.create(author=author, caption="first")
+        self.other = Post.objects.create(author=author, caption="second")
+
+    def test_upload_stored_under_sharded_hash_path(self) -> None:
+        upload = make_image_upload("photo.JPG")
+        digest = hashlib.sha256(upload.read()).hexdigest()
+        upload.seek(0)
+
+        save_images_to_post(self.post, [{"image": upload}])
+
+        image = self.post.images.get()
+        self.assertEqual(image.content_hash, digest)
+        self.assertEqual(
+            image.image.name,
+            f"posts/{digest[:2]}/{digest[2:4]}/{digest}.jpg",
+        )
+        self.assertTrue(image.thumbnail)
+        self.assertEqual(image.renditions.count(), 1)
+
+    def test_duplicate_reuses_blob_thumbnail_and_renditions(self) -> None:
+        save_images_to_post(self.post, [{"image": make_image_upload("photo.JPG")}])
+        first = self.post.images.get()
+
+        with self.assertNumQueries(5):
+            # twin lookup + renditions prefetch + insert + bulk insert
+            # + post version bump
+            save_images_to_post(
+                self.other, [{"image": make_image_upload("copy.jpg")}])
+
+        second = self.other.images.get()
+        self.assertEqual(second.image.name, first.image.name)
+        self.assertEqual(second.thumbnail.name, first.thumbnail.name)
+        self.assertEqual(
+            list(second.renditions.values_list("file", flat=True)),
+            list(first.renditions.values_list("file", flat=True)),
+        )
+        self.assertEqual(ImageRendition.objects.count(), 2)
+
+    def test_different_content_is_not_deduplicated(self) -> None:
+        save_images_to_post(self.post, [{"image": make_image_upload("photo.JPG")}])
+        save_images_to_post(self.other, [{"image": make_image_upload("photo.JPG", color="blue")}])
+
+        names = set(Image.objects.values_list("image", flat=True))
+        self.assertEqual(len(names), 2)
+
+    @override_settings(MEDIA_CONTENT_ADDRESSED=False)
+    def test_disabled_keeps_original_names(self) -> None:
+        save_images_to_post(self.post, [{"image": make_image_upload("photo.JPG")}])
+
+        image = self.post.images.get()
+        self.assertEqual(image.content_hash, "")
+        self.assertTrue(image.image.name.startswith("posts/photo"))
@@ -0,0 +1,87 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from posts.models import Post, Tag, TagCooccurrence
+from posts.services.cooccurrence import (rebuild_tag_cooccurrence,
+                                         record_cooccurrence_changes)
+from posts.services.selectors import get_related_tags
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+class TagCooccurrenceTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("u", "u@example.com", "x")
+
+    def tag_post(self, caption: str) -> Post:
+        post = Post.objects.create(author=self.user, caption=caption)
+        update_post_tags(post, caption)
+        return post
+
+    def counts(self) -> dict[tuple[str, str], int]:
+        return {
+            (row.tag.name, row.related.name): row.count
+            for row in TagCooccurrence.objects.select_related("tag", "related")
+        }
+
+    def test_counts_follow_edits_and_deletes(self) -> None:
+        first = self.tag_post("#python #django")
+        self.tag_post("#python #django #web")
+        self.assertEqual(self.counts()[("python", "django")], 2)
+        self.assertEqual(self.counts()[("django", "python")], 2)
+        self.assertEqual(self.counts()[("web", "python")], 1)
+
+        update_post_tags(first, "#python #web")
+        self.assertEqual(self.counts()[("python", "django")], 1)
+        self.assertEqual(self.counts()[("python", "web")], 2)
+
+        first.delete()
+        self.assertEqual(self.counts()[("python", "web")], 1)
+
+        first = self.tag_post("#python")
+        first.tags.add(Tag.objects.get(name="web"))
+        self.assertEqual(self.counts()[("web", "python")], 2)
+
+    def test_incremental_counts_match_bulk_rebuild(self) -> None:
+        a = self.tag_post("#a #b #c")
+        self.tag_post("#a #b")
+        b = self.tag_post("#b #c #d")
+        update_post_tags(a, "#a #d")
+        b.tags.remove(Tag.objects.get(name="c"))
+        self.tag_post("#solo")
+        incremental = self.counts()
+
+        self.assertEqual(rebuild_tag_cooccurrence(), len(incremental))
+        self.assertEqual(self.counts(), incremental)
+
+    def test_removal_deletes_only_pairs_it_took_to_zero(self) -> None:
+        a, b, c = (Tag.objects.create(name=name) for name in "abc")
+        TagCooccurrence.objects.bulk_create([
+            TagCooccurrence(tag=a, related=b, count=1),
+            TagCooccurrence(tag=b, related=a, count=1),
+            # Pair a concurrent add has inserted but not incremented yet.
+            TagCooccurrence(tag=a, related=c, count=0),
+        ])
+
+        record_cooccurrence_changes([], [a.pk], [b.pk, c.pk])
+
+        self.assertEqual(self.counts(), {("a", "c"): 0})
+
+    def test_related_tags_ranked_by_shared_posts(self) -> None:
+        self.tag_post("#python #django #web")
+        self.tag_post("#python #django")
+        self.tag_post("#python #data")
+        self.tag_post("#django")
+
+        self.assertEqual(get_related_tags("python", limit=2), [
+            {"name": "django", "count": 2},
+            {"name": "web", "count": 1},
+        ])
+        self.assertEqual(get_related_tags("missing"), [])
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("post-by-tag", args=["python"]))
+        self.assertContains(response, "People also use")
+        self.assertContains(response, 'href="/posts/tag/django/"')
@@ -0,0 +1,136 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.cache import cache_metrics, reset_cache_metrics
+from likes.services.like_services import add_like
+from posts.models import Post
+from posts.services import feed_prefetch
+from posts.services.feed_prefetch import (PREFETCH_FAMILY,
+                                          PREFETCH_MAX_PENDING, prefetch_key,
+                                          prefetch_page, schedule_next_page,
+                                          take_prefetched_page)
+from posts.services.feed_state import bump_feed_generation
+from posts.services.post_versions import bump_post_versions
+from posts.services.selectors import get_post_feed_for_user, paginate_feed
+
+User = get_user_model()
+
+
+class InlineExecutor:
+    """
+    Runs prefetches in the calling thread (and connection), so the
+    test transaction can see them.
+    """
+
+    def submit(self, fn, key, *args):
+        prefetch_page(key, *args)
+        feed_prefetch._pending.discard(key)
+
+
+class FeedPrefetchTests(TestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user("author", "a@example.com", "x")
+        self.viewer = User.objects.create_user("viewer", "v@example.com", "x")
+        self.posts = [
+            Post.objects.create(author=self.author, caption=f"p{i}")
+            for i in range(25)
+        ]
+        self.path = reverse('post-list')
+        self.cursor = paginate_feed(
+            get_post_feed_for_user(self.viewer))["next_cursor"]
+        reset_cache_metrics()
+
+    def tearDown(self) -> None:
+        feed_prefetch._pending.clear()
+
+    def prefetch(self) -> None:
+        prefetch_page(
+            prefetch_key(self.viewer.pk, self.path, self.cursor),
+            get_post_feed_for_user, self.viewer, self.cursor)
+
+    def test_take_returns_prefetched_page_once(self) -> None:
+        self.prefetch()
+        expected = paginate_feed(
+            get_post_feed_for_user(self.viewer), self.cursor)
+
+        page = take_prefetched_page(self.viewer, self.path, self.cursor)
+        self.assertEqual(
+            [p.pk for p in page["posts"]],
+            [p.pk for p in expected["posts"]],
+        )
+        self.assertEqual(page["next_cursor"], expected["next_cursor"])
+        self.assertIsNone(
+            take_prefetched_page(self.viewer, self.path, self.cursor))
+        self.assertEqual(
+            cache_metrics()[PREFETCH_FAMILY], {"hits": 1, "misses": 1})
+
+    def test_like_states_are_refreshed_on_take(self) -> None:
+        self.prefetch()
+        post = Post.objects.get(caption="p17")
+        add_like(self.viewer, post)
+
+        page = take_prefetched_page(self.viewer, self.path, self.cursor)
+        liked = next(p for p in page["posts"] if p.pk == post.pk)
+        self.assertTrue(liked.has_liked)
+        self.assertEqual(liked.likes_count, 1)
+
+    def test_pages_are_per_viewer(self) -> None:
+        self.prefetch()
+        self.assertIsNone(
+            take_prefetched_page(self.author, self.path, self.cursor))
+
+    def test_changes_outside_the_page_keep_it(self) -> None:
+        self.prefetch()
+        Post.objects.create(author=self.author, caption="newer")
+        bump_feed_generation()
+        bump_post_versions([Post.objects.get(caption="p24").pk])
+
+        self.assertIsNotNone(
+            take_prefetched_page(self.viewer, self.path, self.cursor))
+
+    def test_edited_or_deleted_posts_make_the_page_stale(self) -> None:
+        self.prefetch()
+        bump_post_versions([Post.objects.get(caption="p17").pk])
+        self.assertIsNone(
+            take_prefetched_page(self.viewer, self.path, self.cursor))
+
+        self.prefetch()
+        Post.objects.get(caption="p16").delete()
+        self.assertIsNone(
+            take_prefetched_page(self.viewer, self.path, self.cursor))
+        self.assertEqual(cache_metrics()[PREFETCH_FAMILY], {"stale": 2})
+
+    def test_schedule_drops_when_pool_is_saturated(self) -> None:
+        pool = mock.Mock()
+        with mock.patch.object(feed_prefetch, "_executor", lambda: pool):
+            for i in range(PREFETCH_MAX_PENDING):
+                self.assertTrue(schedule_next_page(
+                    get_post_feed_for_user, self.viewer, self.path, f"c{i}"))
+            self.assertFalse(schedule_next_page(
+                get_post_feed_for_user, self.viewer, self.path, "c0"))
+            self.assertFalse(schedule_next_page(
+                get_post_feed_for_user, self.viewer, self.path, "extra"))
+            self.assertFalse(schedule_next_page(
+                get_post_feed_for_user, self.viewer, self.path, None))
+
+        self.assertEqual(pool.submit.call_count, PREFETCH_MAX_PENDING)
+        self.assertEqual(
+            cache_metrics()[PREFETCH_FAMILY],
+            {"scheduled": PREFETCH_MAX_PENDING, "dropped": 1},
+        )
+
+    @override_settings(FEED_PREFETCH=True, FEED_PAGE_CACHE=False)
+    def test_feed_view_serves_prefetched_next_page(self) -> None:
+        self.client.force_login(self.viewer)
+        with mock.patch.object(
+                feed_prefetch, "_executor", InlineExecutor):
+            first = self.client.get(self.path)
+            cursor = first.context['page_obj']['next_cursor']
+            second = self.client.get(self.path, {'cursor': cursor})
+
+        self.assertContains(second, "p19")
+        self.assertNotContains(second, "p24")
+        self.assertEqual(cache_metrics()[PREFETCH_FAMILY]["hits"], 1)
@@ -2,12 +2,14 @@ import io
 
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.forms import modelformset_factory
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from conftest import make_image_upload
 from posts.forms import ImageForm
 from posts.models import Image, Post
 from posts.services.image_services import (handle_images_update,
                                            save_images_to_post)
+from posts.templatetags.post_tags import display_url
 
 
 class SaveImagesToPostTests(TestCase):
@@ -121,3 +123,35 @@ class HandleImagesUpdateTests(TestCase):
 
         updated_image = Image.objects.get(id=self.image1.id)
         self.assertIsNotNone(updated_image.thumbnail)
+
+    @override_settings(IMAGE_RENDITION_WIDTHS=(320,),
+                       IMAGE_RENDITION_FORMATS=('jpeg',))
+    def test_handle_images_update_rebuilds_derived_files_of_replaced_image(
+            self):
+        save_images_to_post(
+            self.post, [{'image': make_image_upload('red.jpg')}])
+        image = Image.objects.get(image__contains='red')
+        old_files = [image.thumbnail.name] + [
+            r.file.name for r in image.renditions.all()]
+
+        ImageFormSet = modelformset_factory(
+            Image, form=ImageForm, can_delete=True)
+        formset = ImageFormSet(
+            {
+                'form-TOTAL_FORMS': '1',
+                'form-INITIAL_FORMS': '1',
+                'form-0-id': str(image.id),
+            },
+            {'form-0-image': make_image_upload('blue.jpg', color='blue')},
+            queryset=Image.objects.filter(pk=image.pk),
+        )
+        self.assertTrue(formset.is_valid())
+
+        handle_images_update(self.post, formset)
+
+        image = Image.objects.get(pk=image.pk)
+        self.assertIn('thumb_blue', image.thumbnail.name)
+        self.assertIn('blue_320w', display_url(image))
+        storage = image.thumbnail.storage
+        for name in old_files:
+            self.assertFalse(storage.exists(name), name)
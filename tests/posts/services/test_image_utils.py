@@ -0,0 +1,44 @@
+from django.test import TestCase, override_settings
+from PIL import Image as PilImage
+
+from conftest import make_image_upload
+from posts.forms import ImageForm
+from posts.services.image_utils import (ImageTooLargeError,
+                                        generate_thumbnail, open_scaled)
+
+
+class OpenScaledTests(TestCase):
+    def test_jpeg_is_decoded_at_reduced_scale(self):
+        img = open_scaled(make_image_upload(size=(4000, 3000)), (300, 300))
+
+        self.assertLess(img.width, 4000)
+        self.assertGreaterEqual(img.width, 600)
+        self.assertGreaterEqual(img.height, 600)
+
+    def test_png_is_reduced_after_decode(self):
+        img = open_scaled(
+            make_image_upload('photo.png', (2400, 2400), fmt='PNG'), (300, 300))
+        self.assertEqual(img.size, (600, 600))
+
+    def test_thumbnail_size_unchanged(self):
+        thumb = generate_thumbnail(make_image_upload(size=(4000, 3000)))
+        with PilImage.open(thumb) as img:
+            self.assertEqual(img.size, (300, 225))
+
+    @override_settings(IMAGE_MAX_DECODE_PIXELS=1_000_000)
+    def test_pixel_ceiling_applies_to_scaled_decode(self):
+        # A large JPEG fits once DCT scaling kicks in...
+        generate_thumbnail(make_image_upload(size=(4000, 3000)))
+
+        # ...but a PNG of the same size must be decoded in full.
+        with self.assertRaises(ImageTooLargeError):
+            generate_thumbnail(make_image_upload('big.png', (4000, 3000), fmt='PNG'))
+
+    @override_settings(IMAGE_MAX_DECODE_PIXELS=1_000_000)
+    def test_form_rejects_oversized_upload(self):
+        form = ImageForm(
+            data={},
+            files={'image': make_image_upload('big.png', (4000, 3000), fmt='PNG')})
+
+        self.assertFalse(form.is_valid())
+        self.assertIn('image', form.errors)
@@ -0,0 +1,106 @@
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from conftest import make_image_upload
+from likes.services.like_services import toggle_like
+from posts.models import Post, PostCard
+from posts.services.image_services import save_images_to_post
+from posts.services.post_cards import write_post_cards
+from posts.services.selectors import get_post_cards_for_user, paginate_feed
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+@override_settings(POST_CARDS_ENABLED=True)
+class PostCardTests(TestCase):
+    def setUp(self) -> None:
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.settings(MEDIA_ROOT=media_root).enable()
+        self.author = User.objects.create_user(
+            "author", "a@example.com", "x", full_name="Ann Author")
+        self.viewer = User.objects.create_user("viewer", "v@example.com", "x")
+
+    def create_post(self, caption: str) -> Post:
+        post = Post.objects.create(author=self.author, caption=caption)
+        update_post_tags(post, caption)
+        return post
+
+    def test_post_and_image_services_write_the_card(self) -> None:
+        post = self.create_post("Hello <b>world</b> #python #django")
+        save_images_to_post(post, [{"image": make_image_upload("a.jpg", (100, 100))}])
+
+        card = PostCard.objects.get(post=post)
+        self.assertEqual(card.author_name, "Ann Author")
+        self.assertEqual(card.caption_html, "Hello &lt;b&gt;world&lt;/b&gt;")
+        self.assertEqual(card.tags, ["python", "django"])
+        self.assertEqual(len(card.images), 1)
+        self.assertIn("thumb_", card.images[0]["src"])
+        self.assertIn("100w", card.images[0]["jpeg_srcset"])
+        self.assertEqual(card.images[0]["caption"], post.caption)
+
+        post.caption = "Edited #web"
+        post.save()
+        update_post_tags(post, post.caption)
+        card.refresh_from_db()
+        self.assertEqual(card.tags, ["web"])
+
+    def test_legacy_caption_is_parsed_for_the_card(self) -> None:
+        post = Post.objects.create(
+            author=self.author, caption="Old post #python")
+        self.assertIsNone(post.caption_body)
+        write_post_cards([post.pk])
+
+        card = PostCard.objects.get(post=post)
+        self.assertEqual(card.caption_html, "Old post")
+        self.assertEqual(card.tags, ["python"])
+
+    def test_like_and_profile_changes_reach_the_card(self) -> None:
+        post = self.create_post("p")
+
+        toggle_like(self.viewer, post)
+        self.assertEqual(PostCard.objects.get(post=post).likes_count, 1)
+
+        self.author.full_name = "Ann B."
+        self.author.save()
+        self.assertEqual(PostCard.objects.get(post=post).author_name, "Ann B.")
+
+        with self.assertNumQueries(2):
+            # UPDATE user, UPDATE of stale cards (matches none)
+            self.author.save(update_fields=["last_login"])
+
+    def test_feed_page_is_one_query(self) -> None:
+        for i in range(7):
+            self.create_post(f"p{i} #tag{i}")
+        toggle_like(self.viewer, Post.objects.get(caption="p6 #tag6"))
+
+        qs = get_post_cards_for_user(self.viewer)
+        with self.assertNumQueries(1):
+            first = paginate_feed(qs, per_page=3)
+        second = paginate_feed(qs, first["next_cursor"], per_page=3)
+
+        self.assertEqual([c.tags for c in first["posts"]],
+                         [["tag6"], ["tag5"], ["tag4"]])
+        self.assertTrue(first["posts"][0].has_liked)
+        self.assertEqual([c.tags for c in second["posts"]],
+                         [["tag3"], ["tag2"], ["tag1"]])
+
+        self.client.force_login(self.viewer)
+        response = self.client.get(reverse("post-list"))
+        self.assertTrue(response.context["feed_cards"])
+        self.assertContains(response, 'href="/posts/tag/tag6/"')
+        self.assertContains(response, "Ann Author")
+
+        response = self.client.get(
+            reverse("users:profile", args=[self.author.username]))
+        self.assertContains(response, "p6")
+
+    @override_settings(POST_CARDS_ENABLED=False)
+    def test_disabled_by_default(self) -> None:
+        self.create_post("p #python")
+        self.assertFalse(PostCard.objects.exists())
@@ -0,0 +1,80 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from PIL import Image as PilImage
+
+from conftest import make_image_upload
+from posts.models import Image, ImageRendition, Post
+from posts.services.image_services import save_images_to_post
+from posts.services.rendition_services import build_renditions
+from posts.templatetags.post_tags import display_url, srcset
+
+User = get_user_model()
+
+
+@override_settings(
+    IMAGE_RENDITION_WIDTHS=(320, 640, 1080),
+    IMAGE_RENDITION_FORMATS=("webp", "jpeg"),
+    IMAGE_DISPLAY_WIDTH=640,
+)
+class BuildRenditionsTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        self.post = Post.objects.create(author=user, caption='Post')
+
+    def test_builds_each_width_and_format(self):
+        image = Image.objects.create(post=self.post, image=make_image_upload(size=(800, 400)))
+
+        renditions = build_renditions(image)
+
+        self.assertEqual(
+            sorted((r.format, r.width, r.height) for r in renditions),
+            [('jpeg', 320, 160), ('jpeg', 640, 320), ('jpeg', 800, 400),
+             ('webp', 320, 160), ('webp', 640, 320), ('webp', 800, 400)])
+        for rendition in renditions:
+            with PilImage.open(rendition.file) as encoded:
+                self.assertEqual(encoded.format, rendition.format.upper())
+
+    def test_rebuild_replaces_previous_renditions(self):
+        image = Image.objects.create(post=self.post, image=make_image_upload(size=(300, 300)))
+
+        first = build_renditions(image)
+        build_renditions(image)
+
+        self.assertEqual(
+            ImageRendition.objects.filter(image=image).count(), 2)
+        for rendition in first:
+            self.assertFalse(
+                rendition.file.storage.exists(rendition.file.name))
+
+    def test_rebuild_keeps_files_shared_with_a_twin(self):
+        image = Image.objects.create(post=self.post, image=make_image_upload(size=(300, 300)))
+        twin = Image.objects.create(post=self.post, image=image.image.name)
+        shared = build_renditions(image)
+        ImageRendition.objects.bulk_create(
+            ImageRendition(
+                image=twin, format=r.format, width=r.width,
+                height=r.height, file=r.file.name)
+            for r in shared
+        )
+
+        build_renditions(image)
+
+        for rendition in shared:
+            self.assertTrue(
+                rendition.file.storage.exists(rendition.file.name))
+
+    def test_upload_builds_renditions_and_template_helpers(self):
+        save_images_to_post(self.post, [{'image': make_image_upload(size=(1200, 900))}])
+        image = self.post.images.get()
+
+        self.assertEqual(image.renditions.count(), 6)
+        webp = srcset(image, "webp")
+        self.assertEqual(webp.count("w,"), 2)
+        self.assertIn("320w", webp)
+        self.assertRegex(display_url(image), r"_640w(_\w+)?\.jpg$")
+
+    def test_display_url_falls_back_to_original(self):
+        image = Image.objects.create(post=self.post, image=make_image_upload(size=(50, 50)))
+        self.assertEqual(display_url(image), image.image.url)
+        self.assertEqual(srcset(image, "jpeg"), "")
@@ -0,0 +1,87 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from posts.models import Post, Tag
+from posts.services import tag_cache
+from posts.services.selectors import get_posts_by_tag_for_user, paginate_feed
+from posts.services.tag_cache import (TAG_CACHE_VERSION_KEY, get_tag_id,
+                                      get_tag_ids)
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+class TagCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.python = Tag.objects.create(name="python")
+
+    def test_hits_and_misses_are_cached(self) -> None:
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_tag_ids(["Python", "missing"]),
+                {"python": self.python.id})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_tag_id("python"), self.python.id)
+            self.assertIsNone(get_tag_id("missing"))
+
+    def test_tag_changes_invalidate(self) -> None:
+        self.assertIsNone(get_tag_id("django"))
+
+        django = Tag.objects.create(name="django")
+        self.assertEqual(get_tag_id("django"), django.id)
+
+        django.delete()
+        self.assertIsNone(get_tag_id("django"))
+
+    def test_version_bump_from_another_process(self) -> None:
+        get_tag_id("python")
+        Tag.objects.filter(pk=self.python.pk).update(name="py")
+
+        cache.incr(TAG_CACHE_VERSION_KEY)
+
+        self.assertIsNone(get_tag_id("python"))
+        self.assertEqual(get_tag_id("py"), self.python.id)
+
+    def test_bounded_lru(self) -> None:
+        original = tag_cache.TAG_CACHE_SIZE
+        tag_cache.TAG_CACHE_SIZE = 2
+        self.addCleanup(setattr, tag_cache, "TAG_CACHE_SIZE", original)
+
+        get_tag_ids(["a", "b", "c"])
+
+        self.assertEqual(list(tag_cache._entries), ["b", "c"])
+
+    def test_sync_creating_tags_invalidates_negative_entries(self) -> None:
+        post = Post.objects.create(
+            author=User.objects.create_user("u", "u@example.com", "x"))
+        self.assertIsNone(get_tag_id("fresh"))
+
+        update_post_tags(post, "#fresh")
+
+        self.assertEqual(
+            get_tag_id("fresh"), Tag.objects.get(name="fresh").id)
+
+
+class TagFeedByIdTests(TestCase):
+    def setUp(self) -> None:
+        self.viewer = User.objects.create_user("v", "v@example.com", "x")
+        self.post = Post.objects.create(author=self.viewer, caption="#Django")
+        update_post_tags(self.post, self.post.caption)
+
+    def test_filters_through_table_by_id(self) -> None:
+        qs = get_posts_by_tag_for_user(self.viewer, "DJANGO")
+
+        self.assertEqual(list(qs), [self.post])
+        self.assertNotIn('"posts_tag"', str(qs.query))
+
+    def test_unknown_tag_is_empty_without_query(self) -> None:
+        get_posts_by_tag_for_user(self.viewer, "nope")
+
+        with self.assertNumQueries(0):
+            page = paginate_feed(
+                get_posts_by_tag_for_user(self.viewer, "nope"))
+
+        self.assertEqual(list(page["posts"]), [])
+        self.assertFalse(page["has_next"])
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from posts.models import Post, Tag
+from posts.services.tag_index import suggest_tags
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+class SuggestTagsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("u", "u@example.com", "x")
+        for caption in ["#python #pytest", "#python #pyramid", "#python",
+                        "#pytest", "#django", "#київ"]:
+            post = Post.objects.create(author=self.user, caption=caption)
+            update_post_tags(post, caption)
+        Tag.objects.create(name="pyunused")
+
+    def names(self, prefix: str, **kwargs) -> list[str]:
+        return [tag["name"] for tag in suggest_tags(prefix, **kwargs)]
+
+    def test_prefix_ranked_by_popularity(self) -> None:
+        self.assertEqual(
+            suggest_tags("#Py"),
+            [
+                {"name": "python", "posts": 3},
+                {"name": "pytest", "posts": 2},
+                {"name": "pyramid", "posts": 1},
+                {"name": "pyunused", "posts": 0},
+            ],
+        )
+        self.assertEqual(self.names("py", limit=2), ["python", "pytest"])
+        self.assertEqual(self.names("ки"), ["київ"])
+
+    def test_no_match_and_empty_prefix(self) -> None:
+        self.assertEqual(suggest_tags("zzz"), [])
+        self.assertEqual(suggest_tags("#"), [])
+
+    def test_index_is_reused_until_tags_change(self) -> None:
+        suggest_tags("py")
+        with self.assertNumQueries(0):
+            suggest_tags("dj")
+
+        Tag.objects.create(name="pydantic")
+
+        self.assertIn("pydantic", self.names("pyd"))
+
+
+class TagAutocompleteViewTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("u", "u@example.com", "x")
+        Tag.objects.create(name="travel")
+
+    def test_returns_suggestions(self) -> None:
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("tag-autocomplete"), {"q": "tr"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), {"tags": [{"name": "travel", "posts": 0}]})
+
+    def test_requires_login(self) -> None:
+        response = self.client.get(reverse("tag-autocomplete"), {"q": "tr"})
+        self.assertEqual(response.status_code, 302)
@@ -1,7 +1,8 @@
 from django.test import TestCase
 
 from posts.models import Post, Tag
-from posts.services.tag_services import extract_tag_names, update_post_tags
+from posts.services.tag_services import (extract_tag_names, parse_caption,
+                                         update_post_tags)
 
 
 class ExtractTagNamesTests(TestCase):
@@ -19,6 +20,17 @@ class ExtractTagNamesTests(TestCase):
         self.assertEqual(result, [])
 
 
+class ParseCaptionTests(TestCase):
+    def test_body_and_unique_ordered_tags(self):
+        parsed = parse_caption("Привіт світ\n#Київ #python #Python\n\n")
+
+        self.assertEqual(parsed["body"], "Привіт світ")
+        self.assertEqual(parsed["tags"], ["київ", "python"])
+
+    def test_empty_caption(self):
+        self.assertEqual(parse_caption(""), {"body": "", "tags": []})
+
+
 class UpdatePostTagsTests(TestCase):
     def setUp(self):
         from django.contrib.auth import get_user_model
@@ -45,3 +57,66 @@ class UpdatePostTagsTests(TestCase):
 
         self.assertTrue(Tag.objects.filter(name='python').exists())
         self.assertTrue(Tag.objects.filter(name='django').exists())
+
+    def test_update_post_tags_stores_parsed_caption(self):
+        update_post_tags(self.post, "Morning run #Fitness #fitness")
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.caption_body, "Morning run")
+        self.assertEqual(self.post.caption_tags, ["fitness"])
+
+    def test_update_post_tags_only_writes_changes(self):
+        update_post_tags(self.post, "#a #b #c")
+        through = Post.tags.through
+        kept_ids = set(
+            through.objects.filter(tag__name__in=["a", "b"])
+            .values_list("id", flat=True))
+
+        diff = update_post_tags(self.post, "#b #a #d")
+
+        self.assertEqual(diff, {"added": ["d"], "removed": ["c"]})
+        self.assertEqual(
+            set(self.post.tags.values_list("name", flat=True)),
+            {"a", "b", "d"})
+        self.assertTrue(kept_ids <= set(
+            through.objects.values_list("id", flat=True)))
+
+    def test_unchanged_tags_cost_one_select(self):
+        caption = " ".join(f"#tag{i}" for i in range(15))
+        update_post_tags(self.post, caption)
+
+        # caption fields UPDATE + current through-rows SELECT
+        with self.assertNumQueries(2):
+            diff = update_post_tags(self.post, caption)
+        self.assertEqual(diff, {"added": [], "removed": []})
+
+    def test_many_new_tags_use_bulk_statements(self):
+        Tag.objects.create(name="tag0")
+        caption = " ".join(f"#Tag{i}" for i in range(15))
+
+        # UPDATE, SELECT current, SELECT known ids (cold tag cache),
+        # INSERT tags, SELECT new ids, INSERT through, INSERT timeline,
+        # UPDATE post_count, INSERT + UPDATE trending buckets,
+        # INSERT + UPDATE co-occurrence pairs
+        with self.assertNumQueries(12):
+            update_post_tags(self.post, caption)
+
+        self.assertEqual(self.post.tags.count(), 15)
+        self.assertEqual(Tag.objects.count(), 15)
+
+    def test_post_count_follows_sync_and_delete(self):
+        other = Post.objects.create(author=self.user, caption="")
+        update_post_tags(self.post, "#a #b")
+        update_post_tags(other, "#a")
+
+        update_post_tags(self.post, "#a #c")
+        counts = dict(Tag.objects.values_list("name", "post_count"))
+        self.assertEqual(counts, {"a": 2, "b": 0, "c": 1})
+
+        self.post.delete()
+        counts = dict(Tag.objects.values_list("name", "post_count"))
+        self.assertEqual(counts, {"a": 1, "b": 0, "c": 0})
+
+        self.user.delete()
+        self.assertEqual(
+            set(Tag.objects.values_list("post_count", flat=True)), {0})
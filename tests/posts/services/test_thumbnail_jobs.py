@@ -0,0 +1,102 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from conftest import make_image_upload
+from posts.models import Image, Post, ThumbnailJob
+from posts.services.image_services import save_images_to_post
+from posts.services.thumbnail_jobs import (MAX_ATTEMPTS, backoff_delay,
+                                           claim_due_jobs, enqueue_thumbnail,
+                                           process_job)
+
+User = get_user_model()
+
+
+class ThumbnailJobQueueTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(
+            username='author', email='author@example.com', password='x')
+        self.post = Post.objects.create(author=user, caption='Post')
+        self.image = Image.objects.create(post=self.post, image=make_image_upload())
+
+    @override_settings(THUMBNAIL_ASYNC=True)
+    def test_async_upload_only_enqueues(self):
+        save_images_to_post(self.post, [{'image': make_image_upload('new.jpg')}])
+
+        image = self.post.images.latest('id')
+        self.assertFalse(image.thumbnail)
+        self.assertEqual(
+            image.thumbnail_job.status, ThumbnailJob.Status.PENDING)
+
+    def test_claim_and_process_marks_thumbnail_ready(self):
+        enqueue_thumbnail(self.image)
+
+        jobs = claim_due_jobs(10)
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].status, ThumbnailJob.Status.RUNNING)
+        self.assertEqual(claim_due_jobs(10), [])
+
+        self.assertTrue(process_job(jobs[0]))
+
+        self.image.refresh_from_db()
+        self.assertTrue(
+            self.image.thumbnail.name.startswith('posts/thumbnails/thumb_'))
+        self.assertEqual(
+            ThumbnailJob.objects.get().status, ThumbnailJob.Status.DONE)
+
+    def test_failure_is_retried_with_backoff(self):
+        enqueue_thumbnail(self.image)
+        job = claim_due_jobs(1)[0]
+
+        with patch('posts.services.thumbnail_jobs.generate_thumbnail',
+                   side_effect=OSError('truncated file')):
+            self.assertFalse(process_job(job))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ThumbnailJob.Status.PENDING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn('truncated file', job.last_error)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertEqual(claim_due_jobs(1), [])
+
+    def test_job_fails_after_max_attempts(self):
+        job = enqueue_thumbnail(self.image)
+        ThumbnailJob.objects.filter(pk=job.pk).update(
+            attempts=MAX_ATTEMPTS - 1)
+        job = claim_due_jobs(1)[0]
+
+        with patch('posts.services.thumbnail_jobs.generate_thumbnail',
+                   side_effect=OSError('broken')):
+            process_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ThumbnailJob.Status.FAILED)
+
+    def test_stale_running_job_is_reclaimed(self):
+        job = enqueue_thumbnail(self.image)
+        ThumbnailJob.objects.filter(pk=job.pk).update(
+            status=ThumbnailJob.Status.RUNNING,
+            locked_at=timezone.now() - timedelta(hours=1),
+        )
+
+        self.assertEqual([j.pk for j in claim_due_jobs(1)], [job.pk])
+
+    def test_stale_job_fails_after_max_attempts(self):
+        job = enqueue_thumbnail(self.image)
+        ThumbnailJob.objects.filter(pk=job.pk).update(
+            status=ThumbnailJob.Status.RUNNING,
+            locked_at=timezone.now() - timedelta(hours=1),
+            attempts=MAX_ATTEMPTS,
+        )
+
+        self.assertEqual(claim_due_jobs(1), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, ThumbnailJob.Status.FAILED)
+        self.assertIn('lease expired', job.last_error)
+
+    def test_backoff_grows_exponentially(self):
+        self.assertEqual(backoff_delay(2), 2 * backoff_delay(1))
+        self.assertEqual(backoff_delay(3), 4 * backoff_delay(1))
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from posts.models import Post, TagBucket
+from posts.services.tag_services import update_post_tags
+from posts.services.trending import compact_tag_buckets, get_trending_tags
+
+User = get_user_model()
+
+NOW = datetime(2026, 3, 10, 12, 30, tzinfo=dt_timezone.utc)
+
+
+class TrendingTagsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = User.objects.create_user("u", "u@example.com", "x")
+        patcher = mock.patch(
+            "posts.services.trending.timezone.now", return_value=NOW)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tag_post(self, caption: str, age: timedelta) -> Post:
+        post = Post.objects.create(author=self.user, caption=caption)
+        Post.objects.filter(pk=post.pk).update(created_at=NOW - age)
+        post.refresh_from_db()
+        update_post_tags(post, caption)
+        return post
+
+    def test_counts_by_window(self) -> None:
+        self.tag_post("#python #django", timedelta(minutes=10))
+        self.tag_post("#python", timedelta(minutes=20))
+        self.tag_post("#django", timedelta(hours=5))
+        self.tag_post("#django", timedelta(days=3))
+        self.tag_post("#travel", timedelta(days=30))
+
+        self.assertEqual(get_trending_tags("hour"), [
+            {"name": "python", "count": 2},
+            {"name": "django", "count": 1},
+        ])
+        self.assertEqual(get_trending_tags("day")[0],
+                         {"name": "django", "count": 2})
+        self.assertEqual(get_trending_tags("week", limit=1),
+                         [{"name": "django", "count": 3}])
+
+    def test_edits_update_counters(self) -> None:
+        post = self.tag_post("#python #django", timedelta(minutes=5))
+
+        update_post_tags(post, "#django")
+
+        self.assertEqual(get_trending_tags("hour"),
+                         [{"name": "django", "count": 1}])
+
+    def test_old_posts_count_into_daily_buckets(self) -> None:
+        self.tag_post("#archive", timedelta(days=4))
+
+        bucket = TagBucket.objects.get()
+        self.assertEqual(bucket.granularity, TagBucket.Granularity.DAY)
+        self.assertEqual(bucket.start, datetime(
+            2026, 3, 6, tzinfo=dt_timezone.utc))
+
+    def test_compaction_preserves_totals(self) -> None:
+        for age in (timedelta(minutes=5), timedelta(hours=10),
+                    timedelta(hours=30), timedelta(days=20)):
+            post = self.tag_post("#python", age)
+        TagBucket.objects.create(
+            tag=post.tags.get(), granularity=TagBucket.Granularity.DAY,
+            start=datetime(2026, 3, 9, tzinfo=dt_timezone.utc), count=4)
+        later = NOW + timedelta(days=3)
+        before = get_trending_tags("week", now=later)
+
+        result = compact_tag_buckets(now=later)
+
+        self.assertEqual(result, {"rolled_up": 3, "expired": 1})
+        self.assertEqual(get_trending_tags("week", now=later), before)
+        self.assertEqual(before, [{"name": "python", "count": 7}])
+        self.assertEqual(
+            dict(TagBucket.objects.values_list("start__day", "count")),
+            {9: 5, 10: 2})
+
+    def test_widget_renders_in_feed(self) -> None:
+        cache.clear()
+        self.tag_post("#python", timedelta(minutes=5))
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("post-list"))
+
+        self.assertContains(response, "Trending this day")
+        self.assertContains(response, 'class="trending-tags"')
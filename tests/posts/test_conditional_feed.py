@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from likes.services.like_services import add_like
+from posts.models import Post
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+@override_settings(FEED_CONDITIONAL_GET=True)
+class ConditionalFeedTests(TestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user("author", "a@example.com", "x")
+        self.viewer = User.objects.create_user("viewer", "v@example.com", "x")
+        self.post = Post.objects.create(
+            author=self.author, caption="hello #python")
+        update_post_tags(self.post, self.post.caption)
+        self.client.force_login(self.viewer)
+        self.urls = [
+            reverse('post-list'),
+            reverse('post-by-tag', args=['python']),
+            reverse('users:profile', args=['author']),
+        ]
+
+    def revalidate(self, url: str, etag: str):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_pages_answer_304_without_feed_queries(self) -> None:
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("private", response["Cache-Control"])
+                etag = response["ETag"]
+
+                # Session and user lookups plus, for profiles, the
+                # viewed user's fields; no feed query.
+                with self.assertNumQueries(3 if url == self.urls[2] else 2):
+                    response = self.revalidate(url, etag)
+                self.assertEqual(response.status_code, 304)
+
+    def test_post_changes_invalidate(self) -> None:
+        url = self.urls[0]
+        etag = self.client.get(url)["ETag"]
+        self.post.caption = "edited"
+        self.post.save()
+        self.assertEqual(self.revalidate(url, etag).status_code, 200)
+
+    def test_likes_invalidate(self) -> None:
+        url = self.urls[0]
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            add_like(self.author, self.post)
+        self.assertEqual(self.revalidate(url, etag).status_code, 200)
+
+    def test_validators_are_per_viewer(self) -> None:
+        url = self.urls[0]
+        etag = self.client.get(url)["ETag"]
+        self.client.force_login(self.author)
+        self.assertEqual(self.revalidate(url, etag).status_code, 200)
+
+    def test_profile_edits_invalidate(self) -> None:
+        url = self.urls[2]
+        etag = self.client.get(url)["ETag"]
+        User.objects.filter(pk=self.author.pk).update(bio="new bio")
+        self.assertEqual(self.revalidate(url, etag).status_code, 200)
+
+    @override_settings(FEED_CONDITIONAL_GET=False)
+    def test_disabled_sends_no_etag(self) -> None:
+        response = self.client.get(self.urls[0])
+        self.assertFalse(response.has_header("ETag"))
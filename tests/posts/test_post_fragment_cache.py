@@ -0,0 +1,90 @@
+from django.contrib.auth import get_user_model
+from django.forms import modelformset_factory
+from django.test import TestCase
+from django.urls import reverse
+
+from likes.services.like_services import toggle_like
+from posts.forms import ImageForm
+from posts.models import Image, Post
+from posts.services.image_services import handle_images_update
+from posts.services.tag_services import update_post_tags
+from users.forms import ProfileUpdateForm
+
+User = get_user_model()
+
+
+class PostFragmentCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.author = User.objects.create_user(
+            "author", "a@example.com", "x", full_name="Ann")
+        self.viewer = User.objects.create_user("viewer", "v@example.com", "x")
+        self.post = Post.objects.create(
+            author=self.author, caption="Original #python")
+        update_post_tags(self.post, self.post.caption)
+
+    def feed(self, user=None):
+        self.client.force_login(user or self.viewer)
+        return self.client.get(reverse("post-list"))
+
+    def test_fragment_is_reused_until_the_version_changes(self) -> None:
+        self.feed()
+        Post.objects.filter(pk=self.post.pk).update(caption_body="Changed")
+
+        self.assertContains(self.feed(), "Original")
+
+        Post.objects.filter(pk=self.post.pk).update(version=2)
+        self.assertContains(self.feed(), "Changed")
+
+    def test_edit_view_bumps_version(self) -> None:
+        self.feed()
+        self.client.force_login(self.author)
+        self.client.post(reverse("post-edit", args=[self.post.pk]), {
+            "caption": "Edited #django",
+            "form-TOTAL_FORMS": "0",
+            "form-INITIAL_FORMS": "0",
+        })
+
+        response = self.feed()
+        self.assertContains(response, "Edited")
+        self.assertNotContains(response, "Original")
+
+    def test_unchanged_image_formset_keeps_version(self) -> None:
+        formset = modelformset_factory(Image, form=ImageForm, extra=0)(
+            {"form-TOTAL_FORMS": "0", "form-INITIAL_FORMS": "0"},
+            queryset=Image.objects.none(),
+        )
+        self.assertTrue(formset.is_valid())
+
+        handle_images_update(self.post, formset)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.version, 1)
+
+    def test_profile_name_change_bumps_author_posts(self) -> None:
+        self.feed()
+        form = ProfileUpdateForm(
+            {"full_name": "Ann Renamed", "bio": ""}, instance=self.author)
+        self.assertTrue(form.is_valid())
+        form.save()
+
+        self.assertContains(self.feed(), "Ann Renamed")
+
+        form = ProfileUpdateForm(
+            {"full_name": "Ann Renamed", "bio": "new bio"},
+            instance=self.author)
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.version, 2)
+
+    def test_like_state_is_rendered_per_viewer(self) -> None:
+        toggle_like(self.viewer, self.post)
+
+        liked = self.feed(self.viewer)
+        not_liked = self.feed(self.author)
+
+        self.assertContains(liked, 'data-liked="true"')
+        self.assertContains(not_liked, 'data-liked="false"')
+        self.assertContains(not_liked, "1 like")
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.version, 1)
@@ -1,4 +1,5 @@
 from io import BytesIO
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -7,6 +8,7 @@ from django.urls import reverse
 from PIL import Image as PILImage
 
 from posts.models import Post, Tag
+from posts.views import PostUpdateView
 
 User = get_user_model()
 
@@ -72,6 +74,21 @@ class PostViewsTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Visible post")
 
+    def test_post_list_renders_stored_caption_and_legacy_fallback(self):
+        Post.objects.create(
+            author=self.user, caption="Unparsed caption",
+            caption_body="Stored body", caption_tags=["stored"])
+        Post.objects.create(author=self.user, caption="Legacy text #old")
+
+        response = self.client.get(reverse('post-list'))
+
+        self.assertContains(response, "Stored body")
+        self.assertNotContains(response, "Unparsed caption")
+        self.assertContains(
+            response, reverse('post-by-tag', args=['stored']))
+        self.assertContains(response, "Legacy text")
+        self.assertContains(response, reverse('post-by-tag', args=['old']))
+
     def test_post_list_by_tag_filters_posts(self):
         tag = Tag.objects.create(name='filteredtag')
         post = Post.objects.create(author=self.user, caption="Filtered post")
@@ -82,6 +99,7 @@ class PostViewsTests(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Filtered post")
+        self.assertContains(response, "1 post<")
 
     def test_post_update_view_updates_caption(self):
         post = Post.objects.create(author=self.user, caption="Old caption")
@@ -99,6 +117,27 @@ class PostViewsTests(TestCase):
         post.refresh_from_db()
         self.assertEqual(post.caption, 'Updated caption')
 
+    def test_post_update_keeps_likes_counted_during_the_edit(self):
+        post = Post.objects.create(author=self.user, caption="Old caption")
+        get_object = PostUpdateView.get_object
+
+        def get_object_then_like(view, *args, **kwargs):
+            loaded = get_object(view, *args, **kwargs)
+            # A like committed after the edit request loaded the post.
+            Post.objects.filter(pk=post.pk).update(likes_count=7)
+            return loaded
+
+        with patch.object(PostUpdateView, 'get_object', get_object_then_like):
+            self.client.post(reverse('post-edit', kwargs={'pk': post.id}), {
+                'caption': 'Updated caption',
+                'form-TOTAL_FORMS': '1',
+                'form-INITIAL_FORMS': '0',
+            })
+
+        post.refresh_from_db()
+        self.assertEqual(post.caption, 'Updated caption')
+        self.assertEqual(post.likes_count, 7)
+
     def test_post_delete_view_deletes_post(self):
         post = Post.objects.create(author=self.user, caption="To be deleted")
         url = reverse('post-delete', kwargs={'pk': post.id})
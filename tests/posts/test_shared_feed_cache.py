@@ -0,0 +1,73 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from likes.services.like_services import toggle_like
+from posts.models import Post
+from posts.services.tag_services import update_post_tags
+
+User = get_user_model()
+
+
+@override_settings(FEED_PAGE_CACHE=True)
+class SharedFeedPageTests(TestCase):
+    def setUp(self) -> None:
+        self.alice = User.objects.create_user("alice", "a@example.com", "x")
+        self.bob = User.objects.create_user("bob", "b@example.com", "x")
+        self.post = self.create_post("Sunset #travel")
+        toggle_like(self.alice, self.post)
+
+    def create_post(self, caption: str) -> Post:
+        post = Post.objects.create(author=self.alice, caption=caption)
+        update_post_tags(post, caption)
+        return post
+
+    def get(self, user, url=None):
+        self.client.force_login(user)
+        return self.client.get(url or reverse("post-list"))
+
+    def like_states(self, response) -> list[dict]:
+        html = response.content.decode()
+        start = html.index('<script id="like-states" type="application/json">')
+        start = html.index(">", start) + 1
+        return json.loads(html[start:html.index("</script>", start)])
+
+    def test_body_is_shared_and_like_states_are_per_viewer(self) -> None:
+        alice_page = self.get(self.alice)
+        bob_page = self.get(self.bob)
+
+        for page in (alice_page, bob_page):
+            self.assertContains(page, "Sunset")
+            self.assertContains(page, 'data-liked="false"')
+            self.assertNotContains(page, 'data-liked="true"')
+        self.assertEqual(self.like_states(alice_page), [
+            {"post_id": self.post.pk, "liked": True, "likes_count": 1}])
+        self.assertEqual(self.like_states(bob_page), [
+            {"post_id": self.post.pk, "liked": False, "likes_count": 1}])
+
+    def test_cached_page_skips_feed_queries(self) -> None:
+        self.get(self.bob)
+
+        self.client.force_login(self.bob)
+        # session, user, like states
+        with self.assertNumQueries(3):
+            self.client.get(reverse("post-list"))
+
+    def test_post_changes_invalidate_shared_pages(self) -> None:
+        self.get(self.bob)
+        self.create_post("Mountains #travel")
+        self.assertContains(self.get(self.bob), "Mountains")
+
+        Post.objects.get(caption="Mountains #travel").delete()
+        self.assertNotContains(self.get(self.bob), "Mountains")
+
+    def test_tag_feed_is_shared(self) -> None:
+        url = reverse("post-by-tag", args=["travel"])
+        self.get(self.alice, url)
+
+        response = self.get(self.bob, url)
+        self.assertContains(response, "Sunset")
+        self.assertContains(response, "1 post")
+        self.assertEqual(self.like_states(response)[0]["liked"], False)
@@ -4,6 +4,8 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 
+from posts.services.post_versions import bump_author_post_versions
+
 User = get_user_model()
 
 
@@ -59,3 +61,13 @@ class ProfileUpdateForm(forms.ModelForm):
     class Meta:
         model = User
         fields = ['full_name', 'bio', 'avatar']
+
+    def save(self, commit: bool = True) -> Any:
+        """
+        Save the profile and, if the name or avatar shown next to the
+        user's posts changed, invalidate their cached feed fragments.
+        """
+        user = super().save(commit=commit)
+        if commit and {'full_name', 'avatar'} & set(self.changed_data):
+            bump_author_post_versions(user.pk)
+        return user
@@ -3,6 +3,8 @@ Views for user registration, profile viewing, profile editing,
 and account activation via email confirmation in the ContentFlow application.
 """
 
+from typing import Optional
+
 from django.contrib import messages
 from django.contrib.auth import get_user_model, login
 from django.contrib.auth.decorators import login_required
@@ -10,15 +12,19 @@ from django.contrib.auth.models import AbstractBaseUser
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.mail import EmailMultiAlternatives
-from django.core.paginator import Paginator
 from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 
-from posts.services.selectors import get_posts_by_user
+from posts.services.feed_state import feed_etag
+from posts.services.post_cards import post_cards_enabled
+from posts.services.selectors import (get_post_cards_by_user,
+                                      get_posts_by_user, paginate_feed)
 
 from .forms import ProfileUpdateForm, UserRegisterForm
 
@@ -113,7 +119,24 @@ def activate_user(
     return render(request, 'users/activation_failed.html')
 
 
+def _profile_etag(request: HttpRequest, username: str) -> Optional[str]:
+    """
+    `condition` validator of a profile page: the feed ETag plus the
+    viewed user's displayed fields, read in one indexed query.
+    """
+    profile = (
+        get_user_model().objects.filter(username=username)
+        .values_list('full_name', 'bio', 'avatar', 'email')
+        .first()
+    )
+    if profile is None:
+        return None
+    return feed_etag(request, *profile)
+
+
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_profile_etag)
 def profile_view(request: HttpRequest, username: str) -> HttpResponse:
     """
     View-only version of a user profile. Allows viewing bio, avatar, and posts.
@@ -122,16 +145,19 @@ def profile_view(request: HttpRequest, username: str) -> HttpResponse:
     User = get_user_model()
     viewed_user = get_object_or_404(User, username=username)
 
-    posts_qs = get_posts_by_user(viewed_user, request.user)
+    feed_cards = post_cards_enabled()
+    if feed_cards:
+        posts_qs = get_post_cards_by_user(viewed_user, request.user)
+    else:
+        posts_qs = get_posts_by_user(viewed_user, request.user)
 
-    paginator = Paginator(posts_qs, 5)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    page_obj = paginate_feed(posts_qs, request.GET.get('cursor'))
 
     return render(request, 'users/profile.html', {
         'viewed_user': viewed_user,
         'page_obj': page_obj,
-        'posts': page_obj.object_list,
+        'posts': page_obj['posts'],
+        'feed_cards': feed_cards,
     })
 
 